@@ -0,0 +1,138 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from tdm_automation.Utils.budgets import budget
+from .base_page import BasePage
+from . import wait_conditions as conditions
+
+
+# Açık dropdown'da seçeneği arar; render edilmemişse rc-virtual-list holder'ını
+# bir görünür yükseklik kadar kaydırıp React'in yeniden render etmesini bekler.
+# Sonuç: bulunan option elementi ya da null (listenin sonuna gelindi).
+FIND_OPTION_SCRIPT = """
+var text = arguments[0];
+var done = arguments[arguments.length - 1];
+var dropdown = document.querySelector('.ant-select-dropdown:not(.ant-select-dropdown-hidden)');
+if (!dropdown) { done(null); return; }
+
+function match() {
+    var options = dropdown.querySelectorAll('.ant-select-item-option');
+    var partial = null;
+    for (var i = 0; i < options.length; i++) {
+        var label = (options[i].getAttribute('title') || options[i].textContent).trim();
+        if (label === text) { return options[i]; }
+        if (!partial && label.indexOf(text) !== -1) { partial = options[i]; }
+    }
+    return partial;
+}
+
+var holder = dropdown.querySelector('.rc-virtual-list-holder');
+if (holder) { holder.scrollTop = 0; }
+
+function step() {
+    var option = match();
+    if (option) {
+        option.scrollIntoView({block: 'nearest'});
+        done(option);
+        return;
+    }
+    if (!holder || holder.scrollTop + holder.clientHeight >= holder.scrollHeight - 1) {
+        done(null);
+        return;
+    }
+    holder.scrollTop = holder.scrollTop + holder.clientHeight;
+    requestAnimationFrame(function () { setTimeout(step, 0); });
+}
+requestAnimationFrame(step);
+"""
+
+
+class AntSelect(BasePage):
+    """Ant Design select - arama kutusuna yazıp filtreler, seçeneği tek adımda tıklar
+
+    Arrow-key ile tek tek gezmek yerine önce search input ile filtreleme yapılır.
+    Filtre sonuç vermezse (ör. optionFilterProp label değilse) arama temizlenir ve
+    virtual list holder'ı sayfa sayfa kaydırılarak seçenek aranır.
+    """
+
+    SEARCH_INPUT = (By.CSS_SELECTOR, "input.ant-select-selection-search-input")
+
+    def __init__(self, driver, locator):
+        super().__init__(driver)
+        self.locator = locator
+
+    def open(self):
+        """Dropdown'ı aç"""
+        if not self.click_element(self.locator):
+            return False
+        return self.wait_for(conditions.dropdown_open(), timeout=3)
+
+    @budget(15)
+    def select(self, option_text, search=True):
+        """Seçeneği bul ve tıkla"""
+        print(f"'{option_text}' seçiliyor")
+        if not self.open():
+            print("Dropdown açılamadı")
+            return False
+
+        # Seçenekler backend'den geliyorsa yüklenmesini bekle
+        self.wait_for(conditions.dropdown_options_loaded(), timeout=15)
+
+        option = None
+        typed = search and self._type_search(option_text)
+        if typed:
+            option = self._find_option(option_text)
+            if option is None:
+                # Arama label üzerinden filtrelemiyor olabilir - temizleyip listeyi tara
+                self._clear_search()
+
+        if option is None:
+            option = self._find_option(option_text)
+
+        if option is None:
+            print(f"Seçenek bulunamadı: {option_text}")
+            return False
+
+        try:
+            option.click()
+        except Exception:
+            self.driver.execute_script("arguments[0].click();", option)
+
+        self.wait_for(conditions.dropdown_closed(), timeout=2)
+        print(f"Seçenek seçildi: {option_text}")
+        return True
+
+    def _search_input(self):
+        """Bu select'e ait search input (readonly ise None)"""
+        try:
+            root = self.driver.find_element(*self.locator).find_element(
+                By.XPATH, "./ancestor-or-self::div[contains(concat(' ', normalize-space(@class), ' '), ' ant-select ')][1]")
+            search_input = root.find_element(*self.SEARCH_INPUT)
+        except Exception:
+            return None
+        if search_input.get_attribute("readonly") is not None:
+            return None
+        return search_input
+
+    def _type_search(self, text):
+        search_input = self._search_input()
+        if search_input is None:
+            return False
+        search_input.send_keys(text)
+        # Filtrelenmiş listenin render edilmesi
+        self.wait_for(conditions.animations_finished(), timeout=2)
+        return True
+
+    def _clear_search(self):
+        search_input = self._search_input()
+        if search_input is not None:
+            search_input.send_keys(Keys.CONTROL, "a")
+            search_input.send_keys(Keys.BACKSPACE)
+            self.wait_for(conditions.animations_finished(), timeout=2)
+
+    def _find_option(self, text):
+        try:
+            return self.driver.execute_async_script(FIND_OPTION_SCRIPT, text)
+        except Exception as e:
+            print(f"Seçenek arama hatası: {e}")
+            return None
@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .list_table import ListTable
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -20,6 +21,7 @@ class AppManagementPage(BasePage):
 
     def __init__(self,driver):
         super().__init__(driver)
+        self.table = ListTable(driver)
 
 
     def click_appman(self):
@@ -59,9 +61,7 @@ class AppManagementPage(BasePage):
         """Version List butonuna tıkla"""
         print("Version List butonuna tıklanıyor")
 
-        VERSIONLIST_BUTTON = (By.XPATH,f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'ant-btn')]//div[text()='Version List']")
-
-        success = self.click_element(VERSIONLIST_BUTTON)
+        success = self.table.click_row_button(projectname, label="Version List")
         if success:
             print("Version List butonuna başarıyla tıklandı")
         else:
@@ -73,9 +73,7 @@ class AppManagementPage(BasePage):
         """Module List butonuna tıkla"""
         print("Module List butonuna tıklanıyor")
 
-        MODULELIST_BUTTON = (By.XPATH,f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'ant-btn')]//div[text()='Module List']")
-
-        success = self.click_element(MODULELIST_BUTTON)
+        success = self.table.click_row_button(projectname, label="Module List")
         if success:
              print("Module List butonuna başarıyla tıklandı")
         else:
@@ -86,28 +84,19 @@ class AppManagementPage(BasePage):
         """Module List ekleme butonuna tıkla"""
         print("Module List ekleme butonuna tıklanıyor")
 
-        try:
-            # İlk önce proje ismini bul
-            project_span = self.driver.find_element(By.XPATH, f"//span[text()='{projectname}']")
-
-            # Parent tr'yi bul
-            parent_tr = project_span.find_element(By.XPATH, "./ancestor::tr")
-
-            # SVG elementini bul ve tıkla (Path yerine SVG)
-            MODULEADD_BUTTON = parent_tr.find_element(By.CSS_SELECTOR, "svg[viewBox='0 0 1536 1536']")
-            MODULEADD_BUTTON.click()
-            success = True
-
-        except Exception as e:
-            print(f"SVG click başarısız, alternatif deneniyor: {e}")
+        # SVG'yi document yerine satır içinde ara
+        svg_element = self.table.find_in_row(projectname, By.CSS_SELECTOR, "svg[viewBox='0 0 1536 1536']")
+        success = svg_element is not None
+        if success:
             try:
-                # Alternatif: JavaScript ile tıkla
-                svg_element = parent_tr.find_element(By.CSS_SELECTOR, "svg[viewBox='0 0 1536 1536']")
-                self.driver.execute_script("arguments[0].click();", svg_element)
-                success = True
-            except Exception as e2:
-                print(f"Hata: {e2}")
-                success = False
+                svg_element.click()
+            except Exception as e:
+                print(f"SVG click başarısız, JavaScript ile deneniyor: {e}")
+                try:
+                    self.driver.execute_script("arguments[0].click();", svg_element)
+                except Exception as e2:
+                    print(f"Hata: {e2}")
+                    success = False
 
         if success:
             print("Module List ekleme butonuna başarıyla tıklandı")
@@ -121,10 +110,7 @@ class AppManagementPage(BasePage):
 
         print("Delete butonuna tıklanıyor")
 
-        APPDELETE_BUTTON = (By.XPATH,
-                             f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'delete-btn')]")
-
-        success = self.click_element(APPDELETE_BUTTON)
+        success = self.table.click_row_button(projectname, css_class="delete-btn")
         if success:
             print("DELETE butonuna başarıyla tıklandı")
             DELETE_CONFIRM_BUTTON = (By.XPATH, "//span[text()='DELETE']")
@@ -143,9 +129,7 @@ class AppManagementPage(BasePage):
         """App Edit butonuna tıkla"""
         print("App Edit butonuna tıklanıyor")
 
-        APPEDITBUTTON = (By.XPATH,f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'edit-btn')]")
-
-        success = self.click_element(APPEDITBUTTON)
+        success = self.table.click_row_button(projectname, css_class="edit-btn")
         if success:
             print("App Edit butonuna başarıyla tıklandı")
         else:
@@ -158,9 +142,7 @@ class AppManagementPage(BasePage):
 
         self.click_modulelist_button(projectname)
 
-        MODULEVERSIONLIST_BUTTON = (By.XPATH,f"//span[text()='{modulename}']/ancestor::tr//button[contains(@class, 'ant-btn')]//div[text()='Version List']")
-
-        success = self.click_element(MODULEVERSIONLIST_BUTTON)
+        success = self.table.click_row_button(modulename, label="Version List")
         if success:
             print("Module Version List butonuna başarıyla tıklandı")
         else:
@@ -175,10 +157,7 @@ class AppManagementPage(BasePage):
 
         print("Delete butonuna tıklanıyor")
 
-        MODULEDELETE_BUTTON = (By.XPATH,
-                             f"//span[text()='{modulename}']/ancestor::tr//button[contains(@class, 'delete-btn')]")
-
-        success = self.click_element(MODULEDELETE_BUTTON)
+        success = self.table.click_row_button(modulename, css_class="delete-btn")
         if success:
             print("DELETE butonuna başarıyla tıklandı")
             DELETE_CONFIRM_BUTTON = (By.XPATH, "//span[text()='DELETE']")
@@ -201,10 +180,7 @@ class AppManagementPage(BasePage):
 
         print("Edit butonuna tıklanıyor")
 
-        MODULEEDIT_BUTTON = (By.XPATH,
-                               f"//span[text()='{modulename}']/ancestor::tr//button[contains(@class, 'edit-btn')]")
-
-        success = self.click_element(MODULEEDIT_BUTTON)
+        success = self.table.click_row_button(modulename, css_class="edit-btn")
 
         if success:
             print("Module Edit butonuna başarıyla tıklandı")
@@ -1,11 +1,17 @@
 import os
-import time
 
 from dotenv import load_dotenv
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+
+from tdm_automation.Utils.action_profiler import profiler
+from tdm_automation.Utils.network_tracker import tracker_for
+from . import text_input
+from . import wait_conditions as conditions
+from .element_cache import ElementCache
+from .page_content import ContentSnapshot, PAGE_CONTENT_SCRIPT
 
 load_dotenv()
 
@@ -14,48 +20,94 @@ class BasePage:
         self.driver = driver
         self.timeout = int(os.getenv('TIMEOUT', '10'))
         self.wait = WebDriverWait(driver, self.timeout)
+        self._elements = ElementCache(driver)
 
     def find_element(self, locator):
-        """Element bul"""
-        try:
-            return self.wait.until(EC.presence_of_element_located(locator))
-        except TimeoutException:
-            print(f"Element bulunamadı: {locator}")
-            return None
+        """Element bul
+
+        Sayfa geçişlerinden sonra varlık beklemesi olarak da kullanıldığı için her
+        zaman aranır; bulunan element sonraki click/enter_text için cache'lenir.
+        """
+        with profiler.track(self._page_name, "find_element", locator) as record:
+            try:
+                with profiler.waiting(record):
+                    element = self.wait.until(EC.presence_of_element_located(locator))
+                return self._elements.put(locator, element)
+            except TimeoutException:
+                record["success"] = False
+                print(f"Element bulunamadı: {locator}")
+                return None
 
     def click_element(self, locator):
-        try:
-            element = self.wait.until(EC.element_to_be_clickable(locator))
-            # Elemente scroll yap
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)  # animasyon, overlay vs için bekle
-            element.click()
-            return True
-        except TimeoutException:
-            print(f"Element tıklanamadı: {locator}")
-            return False
-        except Exception as e:
-            print(f"Click hatası, JavaScript ile deneniyor: {e}")
+        with profiler.track(self._page_name, "click_element", locator) as record:
             try:
-                element = self.wait.until(EC.presence_of_element_located(locator))
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                time.sleep(0.5)
-                self.driver.execute_script("arguments[0].click();", element)
+                try:
+                    self._click_native(locator, record)
+                except StaleElementReferenceException:
+                    # Cache'teki element render arasında değişmiş - yeniden bul ve bir kez daha dene
+                    self._elements.invalidate(locator)
+                    self._click_native(locator, record)
                 return True
-            except Exception as e2:
-                print(f"JavaScript click de başarısız: {e2}")
+            except TimeoutException:
+                record["success"] = False
+                record["path"] = "failed"
+                print(f"Element tıklanamadı: {locator}")
                 return False
+            except Exception as e:
+                print(f"Click hatası, JavaScript ile deneniyor: {e}")
+                record["path"] = "js"
+                self._elements.invalidate(locator)
+                try:
+                    with profiler.waiting(record):
+                        element = self.wait.until(EC.presence_of_element_located(locator))
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                    self.wait_for(conditions.animations_finished(), timeout=2)
+                    self.driver.execute_script("arguments[0].click();", element)
+                    return True
+                except Exception as e2:
+                    record["success"] = False
+                    record["path"] = "failed"
+                    print(f"JavaScript click de başarısız: {e2}")
+                    return False
+
+    def _click_native(self, locator, record):
+        element = self._clickable_element(locator, record, scroll=True)
+        self.wait_for(conditions.animations_finished(), timeout=2)  # animasyon, overlay vs için bekle
+        element.click()
 
-    def enter_text(self, locator, text):
-        """Text gir"""
-        try:
+    def _clickable_element(self, locator, record, scroll=False):
+        """Cache'ten (tek kontrol çağrısı) ya da bekleyerek tıklanabilir elementi al"""
+        element = self._elements.get(locator, scroll=scroll)
+        if element is not None:
+            record["cached"] = True
+            return element
+        with profiler.waiting(record):
             element = self.wait.until(EC.element_to_be_clickable(locator))
-            element.clear()
-            element.send_keys(text)
-            return True
-        except Exception as e:
-            print(f"Text giriş hatası: {e}")
-            return False
+        if scroll:
+            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        return self._elements.put(locator, element)
+
+    def enter_text(self, locator, text, fast=None):
+        """Text gir (uzun metinler native setter ile tek seferde, bkz. text_input)
+
+        fast=False klavye event'lerine ihtiyaç duyan alanlar için tuş tuş yazdırır.
+        """
+        with profiler.track(self._page_name, "enter_text", locator) as record:
+            try:
+                try:
+                    element = self._clickable_element(locator, record)
+                    path = text_input.fill(self.driver, element, text, fast)
+                except StaleElementReferenceException:
+                    self._elements.invalidate(locator)
+                    element = self._clickable_element(locator, record)
+                    path = text_input.fill(self.driver, element, text, fast)
+                if path != "keys":
+                    record["path"] = path
+                return True
+            except Exception as e:
+                record["success"] = False
+                print(f"Text giriş hatası: {e}")
+                return False
 
     def get_text(self, locator):
         """Element'in text'ini al"""
@@ -65,23 +117,226 @@ class BasePage:
     def wait_for_url_contains(self, text, timeout=None):
         """URL belirli bir metni içerene kadar bekle"""
         timeout = timeout or self.timeout
-        try:
-            return WebDriverWait(self.driver, timeout).until(EC.url_contains(text))
-        except TimeoutException:
-            print(f"URL '{text}' içermiyor. Mevcut URL: {self.driver.current_url}")
-            return False
+        with profiler.track(self._page_name, "wait_for_url_contains", f"url~{text}") as record:
+            try:
+                with profiler.waiting(record):
+                    return WebDriverWait(self.driver, timeout).until(EC.url_contains(text))
+            except TimeoutException:
+                record["success"] = False
+                print(f"URL '{text}' içermiyor. Mevcut URL: {self.driver.current_url}")
+                return False
+
+    def query_state(self, locators):
+        """{ad: locator} için görünürlük/enabled/text/value bilgisini tek round trip'te oku
+
+        Her ad için: present, count, visible, enabled, text, value, classes.
+        Birden fazla eşleşme varsa ilk görünür element (yoksa ilki) raporlanır.
+        """
+        queries = {name: _to_js_query(locator) for name, locator in locators.items()}
+        with profiler.track(self._page_name, "query_state", f"batch={','.join(locators)}") as record:
+            try:
+                return self.driver.execute_script(QUERY_STATE_SCRIPT, queries)
+            except WebDriverException as e:
+                record["success"] = False
+                print(f"Toplu DOM sorgusu başarısız: {e}")
+                return {name: dict(MISSING_STATE) for name in locators}
+
+    def get_state(self, locator):
+        """Tek locator için query_state"""
+        return self.query_state({"element": locator})["element"]
+
+    def read_content(self):
+        """Tablo, mesaj, form hatası ve modal içeriğini tek seferde oku (page_source yerine)"""
+        with profiler.track(self._page_name, "read_content") as record:
+            try:
+                return ContentSnapshot(self.driver.execute_script(PAGE_CONTENT_SCRIPT))
+            except WebDriverException as e:
+                record["success"] = False
+                print(f"Sayfa içeriği okunamadı: {e}")
+                return ContentSnapshot(None)
+
+    def dismiss_dialogs(self, labels=("CANCEL",), max_steps=5, idle_timeout=0.5):
+        """Açık modal/sayfaları verilen butonlarla sırayla kapat (her adımda tek sorgu)"""
+        locators = {label: (By.XPATH, f"//span[text()='{label}']") for label in labels}
+        closed = []
+        for _ in range(max_steps):
+            state = self.query_state(locators)
+            label = next((label for label in labels if state[label]["visible"]), None)
+            if label is None or not self.click_element(locators[label]):
+                break
+            self.wait_until_idle(idle_timeout)
+            closed.append(label)
+        return closed
+
+    @property
+    def _page_name(self):
+        return type(self).__name__
 
     def click_element_with_scroll(self, locator):
         """Element'e scroll yap ve tıkla (mevcut click_element'i bozmadan)"""
-        try:
-            element = self.driver.find_element(*locator)
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)
+        with profiler.track(self._page_name, "click_element_with_scroll", locator) as record:
+            try:
+                if self._elements.get(locator, scroll=True) is None:
+                    element = self.driver.find_element(*locator)
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+
+                # Scroll sonrası normal click_element kullan (animasyon beklemesi orada)
+                record["success"] = self.click_element(locator)
+                return record["success"]
+
+            except Exception as e:
+                record["success"] = False
+                print(f"Scroll and click hatası: {e}")
+                return False
+
+    # =============== WAIT ENGINE ===============
+    def wait_for(self, *condition_list, timeout=None, quiet=0):
+        """Verilen koşulların hepsi sağlanana kadar bekle
+
+        Koşullar wait_conditions modülündeki (ya da selenium EC) callable'lardır.
+        quiet > 0 ise koşullar bu kadar saniye kesintisiz sağlanmalıdır.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        condition = _combine(condition_list)
+        if quiet:
+            condition = conditions.stable_for(condition, quiet)
+
+        names = ", ".join(getattr(c, "description", repr(c)) for c in condition_list)
+        with profiler.track(self._page_name, "wait_for", f"condition={names}") as record:
+            try:
+                with profiler.waiting(record):
+                    WebDriverWait(self.driver, timeout, poll_frequency=0.1,
+                                  ignored_exceptions=(WebDriverException,)).until(condition)
+                return True
+            except TimeoutException:
+                record["success"] = False
+                print(f"{timeout}s içinde koşul sağlanmadı: {names}")
+                return False
+
+    def wait_until_idle(self, timeout=None, quiet_ms=300):
+        """Spinner/animasyon bitene ve network sakinleşene kadar bekle (sabit sleep yerine)"""
+        return self.wait_for(conditions.spinner_gone() & conditions.animations_finished(),
+                             self._network_idle_condition(quiet_ms), timeout=timeout, quiet=0.15)
+
+    def wait_for_network_idle(self, quiet_ms=500, timeout=None):
+        """Bekleyen XHR/fetch kalmayana ve quiet_ms boyunca yeni istek başlamayana kadar bekle"""
+        return self.wait_for(self._network_idle_condition(quiet_ms), timeout=timeout)
+
+    def click_and_wait_for_network(self, locator, quiet_ms=300, start_timeout=2):
+        """Tıkla ve tıklamanın tetiklediği backend isteği bitene kadar bekle (SAVE/VALIDATE/RUN)"""
+        with profiler.track(self._page_name, "click_and_wait_for_network", locator) as record:
+            tracker = tracker_for(self.driver)
+            tracker.poll()
+            started_before = tracker.started
+
+            success = record["success"] = self.click_element_with_scroll(locator)
+            if not success or not tracker.available:
+                return success
+
+            try:
+                # Disabled buton gibi durumlarda istek hiç başlamayabilir
+                with profiler.waiting(record):
+                    WebDriverWait(self.driver, start_timeout, poll_frequency=0.05).until(
+                        tracker.started_since(started_before))
+            except TimeoutException:
+                return success
+
+            self.wait_for_network_idle(quiet_ms)
+            return success
+
+    def _network_idle_condition(self, quiet_ms):
+        """CDP tracker varsa onu, yoksa sayfaya eklenen JS sayacını kullan"""
+        tracker = tracker_for(self.driver)
+        tracker.poll()
+        if tracker.available:
+            return tracker.idle_condition(quiet_ms)
+        return conditions.network_idle(quiet_ms)
+
+    def wait_for_modal_open(self, timeout=None):
+        """Ant Design modal açılana kadar bekle"""
+        return self.wait_for(conditions.modal_open(), timeout=timeout)
+
+    def wait_for_modal_closed(self, timeout=None):
+        """Açık modal kapanana kadar bekle"""
+        return self.wait_for(conditions.modal_closed(), conditions.animations_finished(), timeout=timeout)
+
+    def wait_for_toast(self, text=None, timeout=None):
+        """Ant message/notification görünene kadar bekle"""
+        return self.wait_for(conditions.toast_shown(text), timeout=timeout)
+
+
+# query_state'in tarayıcıda çalışan kısmı: her sorgu [tip, selector] çifti
+QUERY_STATE_SCRIPT = """
+var queries = arguments[0], result = {};
+function findAll(query) {
+    if (query[0] === 'css') { return Array.prototype.slice.call(document.querySelectorAll(query[1])); }
+    var snapshot = document.evaluate(query[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+    return nodes;
+}
+function isVisible(el) {
+    var style = getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+}
+Object.keys(queries).forEach(function (name) {
+    var nodes = findAll(queries[name]);
+    var visible = nodes.filter(isVisible);
+    var el = visible[0] || nodes[0];
+    if (!el) {
+        result[name] = {present: false, count: 0, visible: false, enabled: false, text: '', value: null, classes: ''};
+        return;
+    }
+    result[name] = {
+        present: true,
+        count: nodes.length,
+        visible: visible.length > 0,
+        // disabled bir button içindeki span de disabled sayılır
+        enabled: !el.closest(':disabled'),
+        text: (el.innerText || '').trim(),
+        value: el.value === undefined ? null : el.value,
+        classes: typeof el.className === 'string' ? el.className : ''
+    };
+});
+return result;
+"""
+
+MISSING_STATE = {"present": False, "count": 0, "visible": False, "enabled": False, "text": "", "value": None, "classes": ""}
+
+
+def _to_js_query(locator):
+    """Selenium locator'ını document.evaluate / querySelectorAll sorgusuna çevir"""
+    by, value = locator
+    if by == By.XPATH:
+        return ["xpath", value]
+    if by == By.CSS_SELECTOR:
+        return ["css", value]
+    if by == By.ID:
+        return ["css", f'[id="{value}"]']
+    if by == By.NAME:
+        return ["css", f'[name="{value}"]']
+    if by == By.CLASS_NAME:
+        return ["css", f".{value}"]
+    if by == By.TAG_NAME:
+        return ["css", value]
+    if by == By.LINK_TEXT:
+        return ["xpath", f'//a[normalize-space(.)="{value}"]']
+    if by == By.PARTIAL_LINK_TEXT:
+        return ["xpath", f'//a[contains(., "{value}")]']
+    raise ValueError(f"Desteklenmeyen locator tipi: {by}")
+
 
-            # Scroll sonrası normal click_element kullan
-            return self.click_element(locator)
+def _combine(condition_list):
+    """JS koşullarını tek script'te birleştir, diğerlerini EC.all_of ile bağla"""
+    js = [c for c in condition_list if isinstance(c, conditions.JsCondition)]
+    other = [c for c in condition_list if not isinstance(c, conditions.JsCondition)]
 
-        except Exception as e:
-            print(f"Scroll and click hatası: {e}")
-            return False
+    merged = []
+    if js:
+        combined = js[0]
+        for condition in js[1:]:
+            combined = combined & condition
+        merged.append(combined)
+    merged.extend(other)
 
+    return merged[0] if len(merged) == 1 else EC.all_of(*merged)
@@ -1,12 +1,14 @@
-import time
-
-from selenium.webdriver import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from selenium.webdriver.common.by import By
+from tdm_automation.Utils.action_profiler import profiler
 from .base_page import BasePage
+from . import wait_conditions as conditions
+from .ant_select import AntSelect
+from .sql_editor import SqlEditor
 
 
 class CreateListGenerator(BasePage):
@@ -60,6 +62,10 @@ class CreateListGenerator(BasePage):
     AI_MODEL_NAME_FIELD = (By.ID, "modal_name")
     AI_PROMPT_TEXTAREA = (By.ID, "prompt")
 
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.sql_editor = SqlEditor(driver, self.SQL_QUERY_TEXTAREA)
+
     # =============== TAB NAVIGATION METHODS ===============
     def click_create_new_tab(self):
         """Create New tab'ına tıkla"""
@@ -112,12 +118,12 @@ class CreateListGenerator(BasePage):
     def click_save_button_new_file(self):
         """SAVE butonuna tıkla (Create New ve From File için)"""
         print("SAVE butonuna tıklanıyor (New/File)")
-        return self.click_element_with_scroll(self.SAVE_BUTTON_NEW_FILE)
+        return self.click_and_wait_for_network(self.SAVE_BUTTON_NEW_FILE)
 
     def click_save_button_db_ai(self):
         """SAVE butonuna tıkla (DB ve AI için)"""
         print("SAVE butonuna tıklanıyor (DB/AI)")
-        return self.click_element_with_scroll(self.SAVE_BUTTON_DB_AI)
+        return self.click_and_wait_for_network(self.SAVE_BUTTON_DB_AI)
 
     def click_cancel_button(self):
         """CANCEL butonuna tıkla (tüm tab'lar için)"""
@@ -127,31 +133,34 @@ class CreateListGenerator(BasePage):
     def click_validate_button(self):
         """VALIDATE butonuna tıkla (DB ve AI tab'ları için)"""
         print("VALIDATE butonuna tıklanıyor")
-        return self.click_element_with_scroll(self.VALIDATE_BUTTON)
+        return self.click_and_wait_for_network(self.VALIDATE_BUTTON)
 
     def is_save_button_enabled_new_file(self):
         """SAVE butonu aktif mi (Create New/From File)"""
-        try:
-            save_button = self.driver.find_element(*self.SAVE_BUTTON_NEW_FILE)
-            return save_button.is_enabled()
-        except:
-            return False
+        state = self.get_state(self.SAVE_BUTTON_NEW_FILE)
+        return state["present"] and state["enabled"]
 
     def is_save_button_enabled_db_ai(self):
         """SAVE butonu aktif mi (DB/AI)"""
-        try:
-            save_button = self.driver.find_element(*self.SAVE_BUTTON_DB_AI)
-            return save_button.is_enabled()
-        except:
-            return False
+        state = self.get_state(self.SAVE_BUTTON_DB_AI)
+        return state["present"] and state["enabled"]
 
     def is_validate_button_enabled(self):
         """VALIDATE butonu aktif mi kontrol et"""
-        try:
-            validate_button = self.driver.find_element(*self.VALIDATE_BUTTON)
-            return validate_button.is_enabled()
-        except:
-            return False
+        state = self.get_state(self.VALIDATE_BUTTON)
+        return state["present"] and state["enabled"]
+
+    def get_ai_form_state(self):
+        """Generate with AI formunun tüm alanları + VALIDATE butonu (tek round trip)"""
+        return self.query_state({
+            "name": self.NAME_FIELD,
+            "max_count": self.AI_MAX_COUNT_FIELD,
+            "api_url": self.AI_API_URL_FIELD,
+            "api_key": self.AI_API_KEY_FIELD,
+            "model_name": self.AI_MODEL_NAME_FIELD,
+            "prompt": self.AI_PROMPT_TEXTAREA,
+            "validate": self.VALIDATE_BUTTON,
+        })
 
     # =============== CREATE NEW TAB METHODS ===============
     def enter_value(self, value):
@@ -214,6 +223,25 @@ class CreateListGenerator(BasePage):
             print(f"Dosya upload hatası: {e}")
             return False
 
+    def wait_for_upload(self, file_name, timeout=None):
+        """Upload listesinde dosya görünene ve yükleme bitene kadar bekle
+
+        Büyük dosyalarda wait_for bütçesini aşmamak için ayrı "wait_for_upload"
+        aksiyonu olarak profillenir.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        with profiler.track(self._page_name, "wait_for_upload", f"file={file_name}") as record:
+            try:
+                with profiler.waiting(record):
+                    WebDriverWait(self.driver, timeout, poll_frequency=0.5,
+                                  ignored_exceptions=(WebDriverException,)).until(
+                        conditions.upload_finished(file_name))
+                return True
+            except TimeoutException:
+                record["success"] = False
+                print(f"{timeout}s içinde upload tamamlanmadı: {file_name}")
+                return False
+
     def click_download_sample(self):
         """Sample file download butonuna tıkla"""
         print("Sample file download edilıyor")
@@ -234,7 +262,7 @@ class CreateListGenerator(BasePage):
 
             # Scroll to element
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", clickable_element)
-            time.sleep(0.5)
+            self.wait_for(conditions.animations_finished(), timeout=2)
 
             # Önce normal tıklama dene
             try:
@@ -245,109 +273,36 @@ class CreateListGenerator(BasePage):
                 print("JavaScript ile tıklanıyor")
                 self.driver.execute_script("arguments[0].click();", clickable_element)
 
-            time.sleep(1)
-
-            # Dropdown açıldığını kontrol et
-            try:
-                WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'ant-select-dropdown')]"))
-                )
+            # Dropdown açıldığını (ve açılış animasyonunun bittiğini) kontrol et
+            if self.wait_for(conditions.dropdown_open(), timeout=5):
                 print("Dropdown başarıyla açıldı")
                 return True
-            except:
-                print("Dropdown açılmadı")
-                return False
+            print("Dropdown açılmadı")
+            return False
 
         except Exception as e:
             print(f"Dropdown tıklama hatası: {e}")
             return False
 
     def select_environment_postgres(self):
-        """AAAdene environment'ını seç - Arrow keys + Doğru text okuma"""
+        """AAAdene environment'ını seç - arama ile filtreleyip tek adımda"""
         print("AAAdene environment seçiliyor")
 
-        # Debug: Dropdown tıklama başarısını kontrol et
-        dropdown_clicked = self.click_environment_dropdown()
-        print(f"Dropdown tıklama sonucu: {dropdown_clicked}")
-
-        if dropdown_clicked:
-            try:
-                print("Environment dropdown açılıyor")
-
-                # Dropdown'un açılmasını biraz daha bekle
-                time.sleep(2)
-
-                # Dropdown item'ların yüklenmesini bekle
-                dropdown_items = WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_all_elements_located((By.XPATH,
-                                                         "//div[contains(@class, 'ant-select-dropdown')]//div[contains(@class, 'ant-select-item')]"))
-                )
-
-                print(f"Bulunan dropdown item sayısı: {len(dropdown_items)}")
-
-                # İlk item'a tıkla
-                if dropdown_items:
-                    dropdown_items[0].click()
-                    time.sleep(0.5)
-                else:
-                    raise Exception("Dropdown item'lar bulunamadı")
-
-                found = False
-                max_attempts = 60
-
-                for i in range(max_attempts):
-                    try:
-                        # Active element kontrolü
-                        focused_elem = self.driver.switch_to.active_element
-                        focused_elem.send_keys(Keys.ARROW_DOWN)
-                        time.sleep(0.2)  # Biraz bekle
-
-                        # Current item'ı bul
-                        current_item = self.driver.find_element(By.XPATH,
-                                                                "//div[contains(@class, 'ant-select-item-option-active') or contains(@class, 'ant-select-item-option-selected')]")
-
-                        text = current_item.text.strip()
-                        print(f"{i + 1}. item: '{text}'")  # Debug için tüm text'leri yazdır
-
-                        if "AAAdene" in text:
-                            print("AAAdene bulundu! Tıklanıyor...")
-
-                            # Enter tuşu ile seç (daha güvenli)
-                            focused_elem.send_keys(Keys.ENTER)
-                            time.sleep(1)
-
-                            found = True
-                            break
-
-                    except Exception as text_error:
-                        print(f"{i + 1}. odak: [text okunamadı] - {str(text_error)}")
-                        continue
-
-                if not found:
-                    # Debug: Ekran görüntüsü al
-                    self.driver.save_screenshot("environment_dropdown_debug.png")
-                    raise Exception("AAAdene bulunamadı")
-
-                return True
-
-            except Exception as e:
-                print(f"Environment seçim hatası: {e}")
-                # Debug: Sayfa HTML'ini yazdır
-                print("Sayfa HTML (dropdown kısmı):")
-                try:
-                    dropdown_html = self.driver.find_element(By.XPATH, "//div[contains(@class, 'ant-select-dropdown')]")
-                    print(dropdown_html.get_attribute('innerHTML')[:500])  # İlk 500 karakter
-                except:
-                    print("Dropdown HTML alınamadı")
-                return False
-        else:
-            print("Dropdown tıklanamadı - click_environment_dropdown() False döndü")
-            return False
+        selected = AntSelect(self.driver, self.ENVIRONMENT_DROPDOWN).select("AAAdene")
+        if not selected:
+            # Debug: Ekran görüntüsü al
+            self.driver.save_screenshot("environment_dropdown_debug.png")
+            print("Environment seçim hatası: AAAdene bulunamadı")
+        return selected
 
     def enter_sql_query(self, sql_query):
         """SQL query text area'ya kod gir"""
         print(f"SQL query giriliyor: {sql_query}")
-        return self.enter_text(self.SQL_QUERY_TEXTAREA, sql_query)
+        return self.sql_editor.set_text(sql_query)
+
+    def get_sql_query(self):
+        """SQL editöründeki güncel query"""
+        return self.sql_editor.content()
 
     # =============== GENERATE WITH AI TAB METHODS ===============
     def enter_max_count(self, count):
@@ -1,7 +1,10 @@
-import time
-
 from selenium.webdriver.common.by import By
+
+from tdm_automation.Utils.budgets import budget
+from tdm_automation.Utils.job_waiter import JobWaiter
 from .base_page import BasePage
+from . import wait_conditions as conditions
+from .ant_select import AntSelect
 
 
 
@@ -37,7 +40,7 @@ class CreateFlowPage(BasePage):
         try:
             success = self.click_element(dropdown_locator)
             if success:
-                time.sleep(1)  # Dropdown açılması için bekle
+                self.wait_for(conditions.dropdown_open(), timeout=3)  # Dropdown açılması için bekle
                 print("Dropdown açıldı")
             return success
         except Exception as e:
@@ -45,27 +48,15 @@ class CreateFlowPage(BasePage):
             return False
 
 
+    @budget(15)
     def select_dropdown_option(self, dropdown_locator, option_text):
-        """Dropdown aç ve seçenek seç"""
+        """Dropdown aç ve seçenek seç (arama + virtual list kaydırma ile tek adımda)"""
         try:
-            # Dropdown'ı aç
-            if not self.open_dropdown(dropdown_locator):
-                return False
-
-            # Seçeneği bul ve tıkla
-            option_locator = (By.XPATH,
-                              f"//div[contains(@class, 'ant-select-item') and contains(text(), '{option_text}')]")
-            success = self.click_element(option_locator)
-
-            if success:
-                print(f"Seçenek seçildi: {option_text}")
-            return success
-
+            return AntSelect(self.driver, dropdown_locator).select(option_text)
         except Exception as e:
             print(f"Dropdown seçim hatası: {e}")
             return False
 
-
     def select_env(self,env_name):
         """ env seç"""
         return self.select_dropdown_option(self.ENV_DROPDOWN,env_name)
@@ -118,7 +109,28 @@ class CreateFlowPage(BasePage):
     def click_save_button(self):
         """SAVE butonuna tıkla """
         print("SAVE butonuna tıklanıyor ")
-        return self.click_element_with_scroll(self.SAVE_BUTTON)
+        self._url_before_save = self.driver.current_url
+        return self.click_and_wait_for_network(self.SAVE_BUTTON)
+
+    def wait_for_save(self, timeout=None):
+        """SAVE sonrası flow kaydının bitmesini bekle
+
+        Liste sayfasına dönülünce SAVED, form validation hatası ya da hata tipinde
+        message/notification görülünce REJECTED döner; sabit bekleme yerine
+        backoff ile poll edilir. Geri bildirim beklenmeyen (negatif) senaryolarda
+        kısa bir timeout verilmelidir.
+        """
+        url_before = getattr(self, "_url_before_save", None)
+
+        def probe():
+            if url_before and self.driver.current_url != url_before:
+                return "SAVED"
+            content = self.read_content()
+            if content.field_errors or content.errors:
+                return "REJECTED"
+            return None
+
+        return JobWaiter(probe, name="flow_save", timeout=timeout, page=self._page_name).wait()
 
     def click_cancel_button(self):
         """CANCEL butonuna tıkla (tüm tab'lar için)"""
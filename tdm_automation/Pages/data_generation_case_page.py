@@ -1,8 +1,14 @@
 import os
-import time
 
 from selenium.webdriver.common.by import By
+
+from tdm_automation.Utils.budgets import budget
+from tdm_automation.Utils.job_waiter import JobWaiter, state_in, state_mentioned
 from .base_page import BasePage
+from .list_table import ListTable
+from .run_log import RunLogReader
+from . import wait_conditions as conditions
+from .ant_select import AntSelect
 
 
 
@@ -29,6 +35,7 @@ class DataCasePage(BasePage):
 
     def __init__(self,driver):
         super().__init__(driver)
+        self.table = ListTable(driver)
 
 
     def click_newlist(self):
@@ -49,10 +56,7 @@ class DataCasePage(BasePage):
 
         print("Delete butonuna tıklanıyor")
 
-        CASEDELETE_BUTTON = (By.XPATH,
-                             f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'delete-btn')]")
-
-        success = self.click_element(CASEDELETE_BUTTON)
+        success = self.table.click_row_button(projectname, css_class="delete-btn")
         if success:
             print("DELETE butonuna başarıyla tıklandı")
             DELETE_CONFIRM_BUTTON = (By.XPATH, "//span[text()='DELETE']")
@@ -71,9 +75,7 @@ class DataCasePage(BasePage):
         """Case Edit butonuna tıkla"""
         print("App Edit butonuna tıklanıyor")
 
-        CASEEDITBUTTON = (By.XPATH,f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'edit-btn')]")
-
-        success = self.click_element(CASEEDITBUTTON)
+        success = self.table.click_row_button(projectname, css_class="edit-btn")
         if success:
             print("List Edit butonuna başarıyla tıklandı")
         else:
@@ -85,13 +87,13 @@ class DataCasePage(BasePage):
         """Case Run butonuna tıkla"""
         print("App Edit butonuna tıklanıyor")
 
-        CASERUNBUTTON = (By.XPATH,f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'run-btn')]")
-
-        success = self.click_element(CASERUNBUTTON)
+        # wait_for_run'ın önceki koşunun durumunu yeni koşununkiyle karıştırmaması için
+        self._row_before_run = self._run_marker(projectname)
+        success = self.table.click_row_button(projectname, css_class="run-btn")
         if success:
             print("Case Run butonuna başarıyla tıklandı")
             RUN_CONFIRM_BUTTON = (By.XPATH, "//span[text()='RUN']")
-            confirm_success = self.click_element(RUN_CONFIRM_BUTTON)
+            confirm_success = self.click_and_wait_for_network(RUN_CONFIRM_BUTTON)
             if confirm_success:
                 print("Run başarıyla gerçekleştiriliyor")
             else:
@@ -103,13 +105,43 @@ class DataCasePage(BasePage):
         return success
 
 
+    def _fresh_row(self, projectname):
+        """Satırı index'e güvenmeden DOM'dan yeniden oku"""
+        self.table.invalidate()
+        return self.table.row(projectname)
+
+    def _run_marker(self, projectname):
+        """Satırın tüm hücre metinleri (status/son koşu zamanı değişince değişir)"""
+        row = self._fresh_row(projectname)
+        return tuple(row.names) if row else None
+
+    def get_run_status(self, projectname):
+        """Case satırındaki run status'u (bilinen bir durum değilse None)"""
+        row = self._fresh_row(projectname)
+        return state_in(row.names) if row else None
+
+    def wait_for_run(self, projectname, timeout=None, probe=None):
+        """Run terminal duruma (SUCCESS/FAILED/...) gelene kadar backoff ile poll et
+
+        Varsayılan probe satırın status hücresi, yoksa run mesajıdır; backend
+        erişilebilirse api_status_probe verilebilir. Terminal durum ancak run'ın
+        başladığı (RUNNING görüldü ya da satır RUN öncesinden farklı) görüldükten
+        sonra kabul edilir.
+        """
+        def row_probe():
+            row = self._fresh_row(projectname)
+            state = state_in(row.names) if row else None
+            return state or state_mentioned(self.read_content().messages), tuple(row.names) if row else None
+
+        waiter = JobWaiter(probe or row_probe, name=f"run:{projectname}", timeout=timeout, page=self._page_name,
+                           require_transition=True, baseline=getattr(self, "_row_before_run", None))
+        return waiter.wait()
+
     def click_schedule_button(self, projectname):
         """Case Schedule butonuna tıkla"""
         print("Schedule butonuna tıklanıyor")
 
-        SCEDULEBUTTON = (By.XPATH,f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'schedule-btn')]")
-
-        success = self.click_element(SCEDULEBUTTON)
+        success = self.table.click_row_button(projectname, css_class="schedule-btn")
         if success:
             print("Schedule butonuna başarıyla tıklandı")
         else:
@@ -120,9 +152,7 @@ class DataCasePage(BasePage):
         """Case History butonuna tıkla"""
         print("Case History butonuna tıklanıyor")
 
-        HISTORYBUTTON = (By.XPATH,f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'history-btn')]")
-
-        success = self.click_element(HISTORYBUTTON)
+        success = self.table.click_row_button(projectname, css_class="history-btn")
         if success:
             print("History butonuna başarıyla tıklandı")
         else:
@@ -147,8 +177,7 @@ class DataCasePage(BasePage):
         """Case log butonuna tıkla"""
         print("Case  log butonuna tıklanıyor")
 
-        LOGBUTTON = (By.XPATH,f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'log-btn')]")
-        success = self.click_element(LOGBUTTON)
+        success = self.table.click_row_button(projectname, css_class="log-btn")
         if success:
             print(" Log butonuna başarıyla tıklandı")
         else:
@@ -157,6 +186,10 @@ class DataCasePage(BasePage):
 
 
 
+    def log_reader(self):
+        """Açık log ekranını (log / history log) artımlı okuyan reader"""
+        return RunLogReader(self.driver)
+
         # Dropdown genel metodları
 
     def open_dropdown(self, dropdown_locator):
@@ -164,34 +197,22 @@ class DataCasePage(BasePage):
         try:
             success = self.click_element(dropdown_locator)
             if success:
-                time.sleep(1)  # Dropdown açılması için bekle
+                self.wait_for(conditions.dropdown_open(), timeout=3)  # Dropdown açılması için bekle
                 print("Dropdown açıldı")
             return success
         except Exception as e:
             print(f"Dropdown açma hatası: {e}")
             return False
 
+    @budget(15)
     def select_dropdown_option(self, dropdown_locator, option_text):
-        """Dropdown aç ve seçenek seç"""
+        """Dropdown aç ve seçenek seç (arama + virtual list kaydırma ile tek adımda)"""
         try:
-            # Dropdown'ı aç
-            if not self.open_dropdown(dropdown_locator):
-                return False
-
-            # Seçeneği bul ve tıkla
-            option_locator = (By.XPATH,
-                              f"//div[contains(@class, 'ant-select-item') and contains(text(), '{option_text}')]")
-            success = self.click_element(option_locator)
-
-            if success:
-                print(f"Seçenek seçildi: {option_text}")
-            return success
-
+            return AntSelect(self.driver, dropdown_locator).select(option_text)
         except Exception as e:
             print(f"Dropdown seçim hatası: {e}")
             return False
 
-
     def select_project(self,project_name):
         """ Projeyi seç"""
         return self.select_dropdown_option(self.PROJECT_DROPDOWN,project_name)
@@ -231,10 +252,18 @@ class DataCasePage(BasePage):
         print(f"Description '{description}' giriliyor")
         return self.enter_text(self.DESCRIPTION_FIELD, description)
 
+    def get_form_state(self):
+        """Case formunun alanları + SAVE butonu (tek round trip)"""
+        return self.query_state({
+            "case_name": self.CASE_NAME_FIELD,
+            "description": self.DESCRIPTION_FIELD,
+            "save": self.SAVE_BUTTON,
+        })
+
     def click_save_button(self):
         """SAVE butonuna tıkla """
         print("SAVE butonuna tıklanıyor ")
-        return self.click_element_with_scroll(self.SAVE_BUTTON)
+        return self.click_and_wait_for_network(self.SAVE_BUTTON)
 
     def click_cancel_button(self):
         """CANCEL butonuna tıkla """
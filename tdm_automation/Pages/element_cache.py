@@ -0,0 +1,68 @@
+import os
+
+from selenium.common.exceptions import WebDriverException
+
+# Cache'teki element hala DOM'a bağlı, görünür ve enabled mı; öyleyse istenirse
+# scroll da aynı çağrıda yapılır. Element (ya da bir atası) DOM'dan çıkarılmışsa
+# ya da sayfa değişmişse null döner. Sayfadaki başka DOM değişiklikleri kaydı
+# geçersiz kılmaz.
+CHECK_SCRIPT = """
+var el = arguments[0], scroll = arguments[1];
+if (!el.isConnected) { return null; }
+var style = getComputedStyle(el);
+var state = {
+    displayed: el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none',
+    enabled: !el.disabled
+};
+if (scroll && state.displayed && state.enabled) { el.scrollIntoView(true); }
+return state;
+"""
+
+
+class ElementCache:
+    """Locator -> WebElement cache'i (tıklanabilir element aramaları için)
+
+    element_to_be_clickable her denemede findElement + isDisplayed + isEnabled
+    (3 round trip) yapar. Cache'te element varsa bunların yerine tek bir
+    execute_script ile elementin DOM'a bağlı, görünür ve enabled olduğu kontrol
+    edilir (click için scroll da aynı çağrıdadır). Kaydetmek round trip
+    gerektirmez. Kontrol ile kullanım arasında element değişirse çağıran taraf
+    StaleElementReferenceException'ı yakalayıp locator'ı yeniden çözer.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.enabled = os.getenv('ELEMENT_CACHE', 'true').lower() == 'true'
+        self._entries = {}
+
+    def get(self, locator, scroll=False):
+        """Cache'teki element tıklanabilir durumdaysa döndür, değilse None"""
+        element = self._entries.get(locator) if self.enabled else None
+        if element is None:
+            return None
+
+        try:
+            state = self.driver.execute_script(CHECK_SCRIPT, element, scroll)
+        except WebDriverException:
+            # StaleElementReference dahil
+            state = None
+
+        if state is None:
+            self.invalidate(locator)
+            return None
+        if not (state["displayed"] and state["enabled"]):
+            return None
+        return element
+
+    def put(self, locator, element):
+        """Elementi sakla (round trip yok)"""
+        if self.enabled and element is not None:
+            self._entries[locator] = element
+        return element
+
+    def invalidate(self, locator=None):
+        """Locator'ın (ya da tüm) kaydını sil"""
+        if locator is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(locator, None)
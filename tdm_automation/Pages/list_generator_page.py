@@ -1,7 +1,7 @@
-import time
-
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .list_table import ListTable
+from . import wait_conditions as conditions
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
@@ -16,6 +16,7 @@ class ListGeneratorPage(BasePage):
 
     def __init__(self,driver):
         super().__init__(driver)
+        self.table = ListTable(driver)
 
     def click_newlist(self):
         try:
@@ -28,7 +29,7 @@ class ListGeneratorPage(BasePage):
                 )
                 print("Modal bulundu, kapatılıyor.")
                 modal_close.click()
-                time.sleep(1)
+                self.wait_for_modal_closed(timeout=3)
             except:
                 print("Modal bulunamadı, devam ediliyor.")
 
@@ -47,7 +48,7 @@ class ListGeneratorPage(BasePage):
 
             # === Görünür hale getir ===
             self.driver.execute_script("arguments[0].scrollIntoView(true);", new_button)
-            time.sleep(0.5)
+            self.wait_for(conditions.animations_finished(), timeout=2)
 
             # === JavaScript ile zorla tıkla ===
             self.driver.execute_script("arguments[0].click();", new_button)
@@ -64,10 +65,7 @@ class ListGeneratorPage(BasePage):
 
         print("Delete butonuna tıklanıyor")
 
-        APPDELETE_BUTTON = (By.XPATH,
-                             f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'delete-btn')]")
-
-        success = self.click_element(APPDELETE_BUTTON)
+        success = self.table.click_row_button(projectname, css_class="delete-btn")
         if success:
             print("DELETE butonuna başarıyla tıklandı")
             DELETE_CONFIRM_BUTTON = (By.XPATH, "//span[text()='DELETE']")
@@ -86,9 +84,7 @@ class ListGeneratorPage(BasePage):
         """List Edit butonuna tıkla"""
         print("App Edit butonuna tıklanıyor")
 
-        APPEDITBUTTON = (By.XPATH,f"//span[text()='{projectname}']/ancestor::tr//button[contains(@class, 'edit-btn')]")
-
-        success = self.click_element(APPEDITBUTTON)
+        success = self.table.click_row_button(projectname, css_class="edit-btn")
         if success:
             print("List Edit butonuna başarıyla tıklandı")
         else:
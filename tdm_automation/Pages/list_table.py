@@ -0,0 +1,405 @@
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+
+from tdm_automation.Utils.action_profiler import profiler
+from .base_page import BasePage
+from . import wait_conditions as conditions
+
+
+# Sayfaya bir kez eklenen DOM generation sayacı: node eklenip/çıkarıldıkça ya da
+# bir text node'un içeriği yerinde değiştikçe (characterData) artar.
+# Navigasyonda yeni document'te sayaç olmadığı için snapshot kendiliğinden yenilenir.
+INSTALL_GENERATION = """
+if (!window.__tdmDom) {
+    var state = window.__tdmDom = {generation: 0};
+    new MutationObserver(function () { state.generation++; })
+        .observe(document.documentElement, {childList: true, characterData: true, subtree: true});
+}
+"""
+
+# Görünür tablo satırlarını okur. DOM generation değişmemişse sadece {unchanged}
+# döner; değişmişse tüm satırların hücre metinleri yeniden okunur (hücre metni
+# yerinde değişmiş olabilir). Elimizdeki satır elementleriyle aynı olanlar {same}
+# olarak sadece isimleriyle, yeni/yeniden render edilenler buton handle'larıyla
+# birlikte döner.
+SNAPSHOT_SCRIPT = INSTALL_GENERATION + """
+var known = arguments[0] || {}, generation = arguments[1];
+if (window.__tdmDom.generation === generation) { return {unchanged: true}; }
+
+function isVisible(el) {
+    var style = getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+}
+function label(el) { return (el.textContent || '').trim(); }
+
+var rows = Array.prototype.filter.call(document.querySelectorAll('tbody > tr'), function (row) {
+    return isVisible(row) && !row.classList.contains('ant-table-placeholder');
+});
+var result = rows.map(function (row, position) {
+    var key = row.getAttribute('data-row-key') || ('#' + position);
+    var names = [];
+    Array.prototype.forEach.call(row.querySelectorAll('td, span'), function (el) {
+        var text = label(el);
+        if (text && (el.tagName === 'TD' || el.children.length === 0) && names.indexOf(text) === -1) {
+            names.push(text);
+        }
+    });
+    if (known[key] === row) { return {key: key, position: position, names: names, same: true}; }
+
+    var buttons = Array.prototype.map.call(row.querySelectorAll('button'), function (button) {
+        return {element: button, classes: button.className, label: label(button)};
+    });
+    return {key: key, position: position, row: row, names: names, buttons: buttons};
+});
+return {generation: window.__tdmDom.generation, rows: result};
+"""
+
+# Tablonun Ant pagination durumu: aktif/son sayfa, next kullanılabilir mi,
+# page-size seçici ve quick jumper var mı. Pagination yoksa null.
+PAGINATION_SCRIPT = """
+function isVisible(el) {
+    var style = getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+}
+var pagination = Array.prototype.filter.call(document.querySelectorAll('.ant-pagination'), isVisible)[0];
+if (!pagination) { return null; }
+
+var pages = Array.prototype.map.call(pagination.querySelectorAll('.ant-pagination-item'), function (item) {
+    return parseInt(item.getAttribute('title') || item.textContent, 10);
+}).filter(function (page) { return !isNaN(page); });
+var active = pagination.querySelector('.ant-pagination-item-active');
+var next = pagination.querySelector('.ant-pagination-next');
+return {
+    current: active ? parseInt(active.getAttribute('title') || active.textContent, 10) : 1,
+    last: pages.length ? Math.max.apply(null, pages) : 1,
+    has_next: !!next && !next.classList.contains('ant-pagination-disabled')
+        && next.getAttribute('aria-disabled') !== 'true',
+    size_changer: !!pagination.querySelector('.ant-pagination-options-size-changer'),
+    size: (pagination.querySelector('.ant-pagination-options-size-changer .ant-select-selection-item') || {}).textContent || '',
+    jumper: !!pagination.querySelector('.ant-pagination-options-quick-jumper input')
+};
+"""
+
+
+class TableRow:
+    """Index'teki bir tablo satırı: row key, isimler ve buton handle'ları"""
+
+    def __init__(self, key, element, names, buttons, position):
+        self.key = key
+        self.element = element
+        self.names = names
+        self.buttons = buttons
+        self.position = position
+
+    def button(self, css_class=None, label=None, index=None):
+        """Class token'ı, görünen metni ya da sırası ile satırdaki butonu bul"""
+        if index is not None:
+            return self.buttons[index]["element"] if index < len(self.buttons) else None
+        for button in self.buttons:
+            if css_class and css_class in button["classes"].split():
+                return button["element"]
+            if label and button["label"] == label:
+                return button["element"]
+        return None
+
+
+class ListTable(BasePage):
+    """Liste sayfalarındaki tablonun isim -> satır index'i
+
+    Her satır aksiyonunda tüm document'i XPath ile taramak yerine görünür satırlar
+    bir kez okunup isim -> satır index'i tutulur. DOM değişmediyse (generation aynı)
+    index olduğu gibi kullanılır; sayfa değişimi veya mutasyon sonrasında satır
+    isimleri tazelenir, buton handle'ları sadece yeni/yeniden render edilen
+    satırlar için tekrar okunur.
+
+    Satır görünür sayfada yoksa locate() sırasıyla arama kutusunu (tek filtreli
+    sorgu), page-size seçiciyi (en büyük sayfa boyu) ve sayfa sayfa gezmeyi dener.
+    """
+
+    SEARCH_INPUT = (By.CSS_SELECTOR, ".ant-input-search input, input[type='search'], "
+                                     "input[placeholder*='Search'], input[placeholder*='search'], "
+                                     "input[placeholder*='Ara']")
+    PAGE_SIZE_SELECT = (By.CSS_SELECTOR, ".ant-pagination-options-size-changer")
+    PAGE_SIZE_OPTIONS = (By.CSS_SELECTOR, ".ant-select-dropdown:not(.ant-select-dropdown-hidden) "
+                                          ".ant-select-item-option")
+    QUICK_JUMPER = (By.CSS_SELECTOR, ".ant-pagination-options-quick-jumper input")
+    NEXT_PAGE = (By.CSS_SELECTOR, ".ant-pagination-next:not(.ant-pagination-disabled) button, "
+                                  ".ant-pagination-next:not(.ant-pagination-disabled)")
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self._rows = {}
+        self._by_name = {}
+        self._generation = None
+        self._searched = None
+
+    def refresh(self, force=False):
+        """Index'i DOM ile senkronla (tek round trip)"""
+        if force:
+            self.invalidate()
+        known = {key: row.element for key, row in self._rows.items()}
+        with profiler.track(self._page_name, "table_refresh") as record:
+            try:
+                snapshot = self.driver.execute_script(SNAPSHOT_SCRIPT, known, self._generation)
+            except WebDriverException as e:
+                # Elimizdeki satırlardan biri stale - sıfırdan oku
+                record["success"] = False
+                print(f"Tablo index'i okunamadı, yeniden deneniyor: {e}")
+                self.invalidate()
+                snapshot = self.driver.execute_script(SNAPSHOT_SCRIPT, {}, None)
+
+        if snapshot.get("unchanged"):
+            return
+
+        rows = {}
+        for item in snapshot["rows"]:
+            if item.get("same"):
+                row = self._rows[item["key"]]
+                row.position = item["position"]
+                row.names = item["names"]
+            else:
+                row = TableRow(item["key"], item["row"], item["names"], item["buttons"], item["position"])
+            rows[row.key] = row
+
+        self._rows = rows
+        self._by_name = {}
+        for row in sorted(rows.values(), key=lambda r: r.position):
+            for name in row.names:
+                self._by_name.setdefault(name, row)
+        self._generation = snapshot["generation"]
+
+    def invalidate(self):
+        self._rows = {}
+        self._by_name = {}
+        self._generation = None
+
+    def row(self, name):
+        """İsmi içeren satır (görünür sayfada yoksa None)"""
+        self.refresh()
+        return self._by_name.get(name)
+
+    def has_row(self, name):
+        return self.row(name) is not None
+
+    def wait_for_row(self, name, timeout=None):
+        """Satır render edilene kadar bekle (kaydetme/sayfa geçişi sonrası)"""
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.2,
+                                 ignored_exceptions=(WebDriverException,)).until(lambda driver: self.row(name))
+        except TimeoutException:
+            return None
+
+    def names(self):
+        """Görünür satırların ilk hücre isimleri"""
+        self.refresh()
+        return [row.names[0] for row in sorted(self._rows.values(), key=lambda r: r.position) if row.names]
+
+    # =============== SEARCH / PAGINATION ===============
+    def locate(self, name, order=None, max_pages=None):
+        """Satırı görünür sayfaya getir ve döndür (bulunamazsa None)
+
+        1. Görünür sayfada varsa doğrudan döner
+        2. Arama kutusu varsa isimle filtreler (tek sorgu)
+        3. Page-size seçici varsa en büyük sayfa boyuna geçer
+        4. order ("asc"/"desc") verilmişse ve quick jumper varsa ilk sütuna göre
+           binary search, yoksa sayfa sayfa ilerler
+        """
+        with profiler.track(self._page_name, "locate_row", f"row={name}") as record:
+            row = self.row(name)
+            if row is None:
+                self.wait_until_idle(timeout=self.timeout)
+                row = self.row(name) or self._search(name) or self._traverse(name, order, max_pages)
+            record["success"] = row is not None
+            return row
+
+    def contains(self, name, order=None, max_pages=None):
+        """Kayıt (hangi sayfada olursa olsun) listede var mı"""
+        return self.locate(name, order=order, max_pages=max_pages) is not None
+
+    def clear_search(self):
+        """locate() ile uygulanan arama filtresini kaldır"""
+        if self._searched is None:
+            return True
+        self._searched = None
+        if not self._type_search(""):
+            return False
+        self.invalidate()
+        return True
+
+    def show(self, query=None):
+        """Tabloyu query ile filtrele ve en büyük sayfa boyuna geç (toplu işlemler için)"""
+        self.invalidate()
+        if query is not None and self._type_search(query):
+            self._searched = query
+        state = self._pagination()
+        if state is not None:
+            self._maximize_page_size(state)
+
+    def next_page(self):
+        """Sonraki sayfaya geç; son sayfadaysa False"""
+        state = self._pagination()
+        if not state or not state["has_next"] or not self.click_element(self.NEXT_PAGE):
+            return False
+        self.wait_until_idle(timeout=self.timeout)
+        return True
+
+    def _search(self, name):
+        """Arama kutusu ile filtrele; sonuçta satır varsa döndür"""
+        if not self._type_search(name):
+            return None
+        self._searched = name
+        row = self.wait_for_row(name, timeout=3)
+        if row is None:
+            # Arama bu sütunda yapılmıyor olabilir - filtreyi kaldırıp sayfalara geç
+            self.clear_search()
+            self.wait_until_idle(timeout=self.timeout)
+        return row
+
+    def _type_search(self, text):
+        inputs = [el for el in self.driver.find_elements(*self.SEARCH_INPUT) if el.is_displayed()]
+        if not inputs:
+            return False
+        search = inputs[0]
+        try:
+            # React controlled input: clear() onChange tetiklemez
+            search.send_keys(Keys.CONTROL, "a")
+            search.send_keys(Keys.BACKSPACE)
+            search.send_keys(text + Keys.ENTER)
+        except WebDriverException as e:
+            print(f"Arama kutusu kullanılamadı: {e}")
+            return False
+        self.wait_until_idle(timeout=self.timeout)
+        return True
+
+    def _pagination(self):
+        try:
+            return self.driver.execute_script(PAGINATION_SCRIPT)
+        except WebDriverException:
+            return None
+
+    def _maximize_page_size(self, state):
+        """Page-size seçicide en büyük seçeneği seç (zaten seçiliyse dokunma)"""
+        if not state["size_changer"] or not self.click_element(self.PAGE_SIZE_SELECT):
+            return state
+        self.wait_for(conditions.dropdown_open(), timeout=3)
+        options = self.driver.find_elements(*self.PAGE_SIZE_OPTIONS)
+        if not options or options[-1].text.strip() == state["size"].strip():
+            self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+            return state
+        options[-1].click()
+        self.wait_until_idle(timeout=self.timeout)
+        return self._pagination() or state
+
+    def _go_to_page(self, page):
+        """Quick jumper ile sayfaya git"""
+        if not self.enter_text(self.QUICK_JUMPER, f"{page}{Keys.ENTER}"):
+            return False
+        self.wait_until_idle(timeout=self.timeout)
+        return True
+
+    def _traverse(self, name, order=None, max_pages=None):
+        state = self._pagination()
+        if state is None:
+            return None
+        state = self._maximize_page_size(state)
+        row = self.row(name)
+        if row is not None:
+            return row
+
+        if order and state["jumper"] and state["last"] > 1:
+            return self._binary_search(name, order, state["last"])
+
+        if state["current"] != 1 and state["jumper"]:
+            self._go_to_page(1)
+            state = self._pagination() or state
+        visited = 1
+        while state["has_next"] and (max_pages is None or visited < max_pages):
+            if not self.click_element(self.NEXT_PAGE):
+                return None
+            self.wait_until_idle(timeout=self.timeout)
+            row = self.row(name)
+            if row is not None:
+                return row
+            visited += 1
+            state = self._pagination()
+            if state is None:
+                return None
+        return None
+
+    def _binary_search(self, name, order, last):
+        """Tablo ilk sütuna göre sıralıysa O(log sayfa) ile satırın sayfasını bul"""
+        low, high = 1, last
+        while low <= high:
+            middle = (low + high) // 2
+            if not self._go_to_page(middle):
+                return None
+            row = self.row(name)
+            if row is not None:
+                return row
+            names = self.names()
+            if not names:
+                return None
+            first, final = (names[0], names[-1]) if order == "asc" else (names[-1], names[0])
+            if name < first:
+                low, high = (low, middle - 1) if order == "asc" else (middle + 1, high)
+            elif name > final:
+                low, high = (middle + 1, high) if order == "asc" else (low, middle - 1)
+            else:
+                # Sayfa aralığında olmalıydı - kayıt yok
+                return None
+        return None
+
+    def click_row_button(self, name, css_class=None, label=None, index=None):
+        """Satırdaki butona tıkla; satır render arasında değiştiyse bir kez yeniden oku"""
+        with profiler.track(self._page_name, "click_row_button", f"row={name}") as record:
+            for attempt in range(2):
+                with profiler.waiting(record):
+                    row = self.row(name) or self.locate(name) or self.wait_for_row(name)
+                if row is None:
+                    record["success"] = False
+                    print(f"Satır bulunamadı: {name}")
+                    return False
+
+                button = row.button(css_class=css_class, label=label, index=index)
+                if button is None:
+                    record["success"] = False
+                    print(f"Satırda buton bulunamadı: {name} ({css_class or label or index})")
+                    return False
+
+                try:
+                    self._click_handle(button, record)
+                    return True
+                except StaleElementReferenceException:
+                    self.invalidate()
+                except WebDriverException as e:
+                    print(f"Satır butonu tıklanamadı: {e}")
+                    record["success"] = False
+                    return False
+
+            record["success"] = False
+            return False
+
+    def find_in_row(self, name, by, value):
+        """Satır içinde (document yerine) element ara"""
+        row = self.row(name) or self.locate(name) or self.wait_for_row(name)
+        if row is None:
+            return None
+        try:
+            return row.element.find_element(by, value)
+        except WebDriverException:
+            return None
+
+    def _click_handle(self, element, record):
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+        self.wait_for(conditions.animations_finished(), timeout=2)
+        try:
+            element.click()
+        except StaleElementReferenceException:
+            raise
+        except WebDriverException:
+            # Overlay vs. yüzünden native click alınamadı
+            record["path"] = "js"
+            self.driver.execute_script("arguments[0].click();", element)
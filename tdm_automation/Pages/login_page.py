@@ -10,6 +10,7 @@ class LoginPage(BasePage):
     USERNAME_FIELD = (By.ID, "username")
     PASSWORD_FIELD = (By.ID, "password")
     LOGIN_BUTTON = (By.ID, "submit_login2")
+    TDM_MODULE_ITEM = (By.XPATH, "//li[@title='New Test Data Manager'][2]")
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -37,4 +38,12 @@ class LoginPage(BasePage):
         self.enter_username(username)
         self.enter_password(password)
         self.click_login_button()
-        return True
\ No newline at end of file
+        return True
+
+    def click_tdm_module(self):
+        """Login sonrası New Test Data Manager modülüne tıkla"""
+        return self.click_element(self.TDM_MODULE_ITEM)
+
+    def is_login_page(self):
+        """Login sayfasına (ya da login hatasına) yönlendirildik mi"""
+        return "/login" in self.driver.current_url
\ No newline at end of file
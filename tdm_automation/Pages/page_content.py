@@ -0,0 +1,139 @@
+"""Sayfanın sadece ilgili bölgelerini okuyan yapısal içerik snapshot'ı
+
+driver.page_source tüm DOM'u (script'ler, attribute'lar dahil) serialize edip
+taşır; substring araması da "modal" gibi kelimeleri script tag'lerinde bile
+bulur. Burada tablo satırları, Ant message/notification container'ı, form
+hataları ve açık modal tek bir execute_script ile okunur.
+"""
+
+# Görünür bölgelerin metinleri - sonuç ContentSnapshot'a sarılır
+PAGE_CONTENT_SCRIPT = """
+function isVisible(el) {
+    var style = getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+}
+function visible(selector, root) {
+    return Array.prototype.filter.call((root || document).querySelectorAll(selector), isVisible);
+}
+function text(el) { return (el.innerText || el.textContent || '').trim(); }
+function texts(selector, root) { return visible(selector, root).map(text).filter(Boolean); }
+
+var rows = visible('tbody > tr').map(function (row) {
+    return Array.prototype.map.call(row.querySelectorAll('td'), text);
+});
+
+var fieldErrors = visible('.ant-form-item-explain-error').map(function (el) {
+    var item = el.closest('.ant-form-item');
+    var label = item && item.querySelector('.ant-form-item-label label');
+    return {field: label ? text(label) : '', text: text(el)};
+});
+
+var modal = {open: false, title: '', text: ''};
+var wraps = visible('.ant-modal-wrap, .ant-drawer-open .ant-drawer-content');
+if (wraps.length) {
+    var top = wraps[wraps.length - 1];
+    var title = top.querySelector('.ant-modal-title, .ant-drawer-title');
+    modal = {open: true, title: title ? text(title) : '', text: text(top)};
+}
+
+var values = visible('input:not([type=hidden]):not([type=file]), textarea').map(function (el) {
+    return el.value;
+}).concat(visible('.ant-select-selection-item').map(function (el) {
+    return el.getAttribute('title') || text(el);
+})).filter(Boolean);
+
+return {
+    rows: rows,
+    headers: texts('.ant-table-thead th'),
+    headings: texts('h1, h2, h3, h4, h5, .ant-page-header-heading-title, .ant-breadcrumb, '
+        + '.ant-card-head-title, .ant-tabs-tab, .ant-modal-title, .ant-drawer-title'),
+    messages: texts('.ant-message-notice, .ant-notification-notice, .ant-alert, .ant-result-title, .ant-result-subtitle'),
+    field_errors: fieldErrors,
+    errors: visible('.ant-message-error, .ant-notification-notice-error, .ant-notification-notice-icon-error')
+        .map(function (el) { return text(el.closest('.ant-message-notice, .ant-notification-notice') || el); })
+        .filter(Boolean),
+    labels: texts('.ant-form-item-label label'),
+    empty: texts('.ant-empty-description'),
+    pagination: texts('.ant-pagination-total-text, .ant-transfer-list-header-selected'),
+    uploads: texts('.ant-upload-list-item-name, .ant-upload-list-item'),
+    values: values,
+    modal: modal
+};
+"""
+
+
+class ContentSnapshot:
+    """PAGE_CONTENT_SCRIPT sonucunun yapısal hali"""
+
+    def __init__(self, data):
+        data = data or {}
+        self.rows = data.get("rows", [])
+        self.headers = data.get("headers", [])
+        self.headings = data.get("headings", [])
+        self.messages = data.get("messages", [])
+        self.field_errors = data.get("field_errors", [])
+        # Hata tipindeki Ant message/notification metinleri
+        self.errors = data.get("errors", [])
+        self.labels = data.get("labels", [])
+        self.empty = data.get("empty", [])
+        self.pagination = data.get("pagination", [])
+        self.uploads = data.get("uploads", [])
+        self.values = data.get("values", [])
+        self.modal = data.get("modal", {"open": False, "title": "", "text": ""})
+
+    @property
+    def modal_open(self):
+        return bool(self.modal.get("open"))
+
+    @property
+    def modal_text(self):
+        return self.modal.get("text", "")
+
+    @property
+    def has_empty_state(self):
+        """Ant Empty ("No data") gösteriliyor mu"""
+        return bool(self.empty)
+
+    def find_row(self, text):
+        """Hücrelerinden biri text'i içeren ilk satır (hücre listesi)"""
+        for row in self.rows:
+            if any(text in cell for cell in row):
+                return row
+        return None
+
+    def has_row(self, text):
+        return self.find_row(text) is not None
+
+    def feedback(self):
+        """Kullanıcıya gösterilen mesajlar: message/notification/alert + form hataları"""
+        return self.messages + [error["text"] for error in self.field_errors]
+
+    def mentions(self, *words):
+        """Feedback metinlerinden biri kelimelerden birini içeriyor mu (büyük/küçük harf duyarsız)"""
+        feedback = [text.lower() for text in self.feedback()]
+        return any(word.lower() in text for word in words for text in feedback)
+
+    def has_label(self, label):
+        """Görünür form alanları arasında label var mı"""
+        return any(label in text for text in self.labels)
+
+    def field_error(self, field):
+        """Label'ı field'ı içeren form alanının hata metni"""
+        for error in self.field_errors:
+            if field.lower() in error["field"].lower():
+                return error["text"]
+        return None
+
+    def contains_any(self, *words):
+        """Kelimelerden biri herhangi bir bölgede var mı (büyük/küçük harf duyarsız)"""
+        return any(self.contains(word, case_sensitive=False) for word in words)
+
+    def contains(self, text, case_sensitive=True):
+        """Text herhangi bir yapısal bölgede (tablo, başlık, mesaj, modal, upload listesi, input değerleri) var mı"""
+        regions = ([cell for row in self.rows for cell in row] + self.headers + self.headings
+                   + self.feedback() + self.labels + self.empty + self.pagination
+                   + self.uploads + self.values + [self.modal_text])
+        if case_sensitive:
+            return any(text in region for region in regions)
+        text = text.lower()
+        return any(text in region.lower() for region in regions)
@@ -0,0 +1,122 @@
+import re
+import time
+from collections import deque
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from tdm_automation.Utils.action_profiler import profiler
+from .base_page import BasePage
+
+
+# Log container'ının offset'ten sonraki kısmını döndürür; tüm log her seferinde
+# serialize edilip taşınmaz. Container yeniden render edilip kısaldıysa
+# (yeni run / sayfa yenilendi) reset: true ile baştan okunur.
+READ_CHUNK_SCRIPT = """
+var el = arguments[0], offset = arguments[1], limit = arguments[2];
+var text = (el.tagName === 'TEXTAREA' || el.tagName === 'INPUT') ? el.value : el.textContent;
+text = text || '';
+var reset = text.length < offset;
+if (reset) { offset = 0; }
+return {chunk: text.substr(offset, limit), length: text.length, reset: reset};
+"""
+
+
+class RunLogReader(BasePage):
+    """Data Generation Case run log'unu artımlı okuyan reader
+
+    Sadece log container'ı okunur ve her poll'da sadece yeni eklenen kısım
+    (offset'ten sonrası, en fazla chunk_size karakter) transfer edilir.
+    Satırlar generator olarak verilir; bellekte yalnızca yarım kalan son satır
+    ve son `keep` satır (tail) tutulur.
+    """
+
+    LOG_CONTAINER = (By.CSS_SELECTOR, "textarea.ant-input[readonly], .log-container, pre.log, .ant-modal-body pre")
+
+    def __init__(self, driver, chunk_size=256 * 1024, keep=200):
+        super().__init__(driver)
+        self.chunk_size = chunk_size
+        self.tail = deque(maxlen=keep)
+        self.line_count = 0
+        self._offset = 0
+        self._partial = ""
+        self._pending = False
+        self._container = None
+
+    def wait_until_open(self, timeout=None):
+        """Log container'ı görünene kadar bekle"""
+        self._container = self._find(self.timeout if timeout is None else timeout)
+        return self._container is not None
+
+    def _find(self, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            elements = [el for el in self.driver.find_elements(*self.LOG_CONTAINER) if el.is_displayed()]
+            if elements:
+                return elements[0]
+            time.sleep(0.2)
+        return None
+
+    def _read_chunk(self):
+        """Yeni gelen metin (yoksa boş string)"""
+        if self._container is None and not self.wait_until_open(timeout=self.timeout):
+            return ""
+        try:
+            result = self.driver.execute_script(READ_CHUNK_SCRIPT, self._container, self._offset, self.chunk_size)
+        except WebDriverException:
+            # Container yeniden render edildi - tekrar bul, baştan oku
+            self._container = None
+            self._offset, self._partial = 0, ""
+            return ""
+        if result["reset"]:
+            self._offset, self._partial = 0, ""
+        self._offset += len(result["chunk"])
+        self._pending = result["length"] > self._offset
+        return result["chunk"]
+
+    def lines(self, timeout=None, idle_timeout=2.0, poll=0.5, until=None):
+        """Log satırlarını geldikçe ver
+
+        until (regex ya da string) eşleşen satır verildikten sonra durur.
+        Log idle_timeout boyunca büyümezse ya da timeout dolarsa biter.
+        """
+        pattern = re.compile(until, re.IGNORECASE) if isinstance(until, str) else until
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        last_growth = time.monotonic()
+
+        while time.monotonic() < deadline:
+            self._pending = False
+            chunk = self._read_chunk()
+            if chunk:
+                last_growth = time.monotonic()
+                text = self._partial + chunk
+                *complete, self._partial = text.split("\n")
+                for line in complete:
+                    self.line_count += 1
+                    self.tail.append(line)
+                    yield line
+                    if pattern is not None and pattern.search(line):
+                        return
+            elif time.monotonic() - last_growth >= idle_timeout:
+                break
+
+            if not self._pending:
+                time.sleep(poll)
+
+        # Sonunda newline olmayan son satır
+        if self._partial:
+            line, self._partial = self._partial, ""
+            self.line_count += 1
+            self.tail.append(line)
+            yield line
+
+    def find(self, *patterns, timeout=None, idle_timeout=2.0):
+        """Kelimelerden biri geçen ilk satır (büyük/küçük harf duyarsız); yoksa None"""
+        regex = re.compile("|".join(re.escape(p) for p in patterns), re.IGNORECASE)
+        with profiler.track(self._page_name, "wait_for_log", f"log={'|'.join(patterns)}") as record:
+            for line in self.lines(timeout=timeout, idle_timeout=idle_timeout, until=regex):
+                if regex.search(line):
+                    return line
+            record["success"] = False
+            return None
@@ -0,0 +1,56 @@
+from selenium.webdriver.common.by import By
+
+from tdm_automation.Utils.action_profiler import profiler
+from .base_page import BasePage
+from . import text_input
+from . import wait_conditions as conditions
+
+
+class SqlEditor(BasePage):
+    """Create From DB SQL editörü (@uiw textarea code editor, .w-tc-editor)
+
+    Editör her tuşta syntax highlight önizlemesini yeniden render ettiği için
+    içerik tuş tuş yazılmaz: textarea değeri native setter + input event ile tek
+    seferde verilir, editörün önizlemesi güncellenene kadar beklenir ve değer
+    geri okunup doğrulanır.
+    """
+
+    TEXTAREA = (By.CSS_SELECTOR, ".w-tc-editor-text")
+
+    def __init__(self, driver, locator=TEXTAREA):
+        super().__init__(driver)
+        self.locator = locator
+
+    def set_text(self, sql, timeout=5):
+        """Editör içeriğini sql yap; içerik doğrulanamazsa False"""
+        with profiler.track(self._page_name, "set_sql", self.locator) as record:
+            try:
+                element = self._clickable_element(self.locator, record)
+                path = text_input.fill(self.driver, element, sql, fast=True)
+                if path != "keys":
+                    record["path"] = path
+                self.wait_for(conditions.code_editor_synced(), timeout=timeout)
+                content = self.content(element)
+            except Exception as e:
+                record["success"] = False
+                print(f"SQL editöre yazılamadı: {e}")
+                return False
+
+            if _normalize(content) != _normalize(sql):
+                record["success"] = False
+                print(f"SQL editör içeriği doğrulanamadı: {len(content)}/{len(sql)} karakter")
+                return False
+            return True
+
+    def content(self, element=None):
+        """Editörün güncel içeriği (textarea değeri)"""
+        element = element or self.find_element(self.locator)
+        return (element.get_attribute("value") or "") if element else ""
+
+    def clear(self):
+        return self.set_text("")
+
+
+def _normalize(text):
+    # Editör satır sonlarını \n'e çevirebilir
+    return str(text).replace("\r\n", "\n")
@@ -1,7 +1,10 @@
-import time
-
 from selenium.webdriver.common.by import By
+
+from tdm_automation.Utils.budgets import budget
 from .base_page import BasePage
+from . import text_input
+from . import wait_conditions as conditions
+from .ant_select import AntSelect
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -101,58 +104,18 @@ class FlowEditPage(BasePage):
         try:
             success = self.click_element(dropdown_locator)
             if success:
-                time.sleep(1)  # Dropdown açılması için bekle
+                self.wait_for(conditions.dropdown_open(), timeout=3)  # Dropdown açılması için bekle
                 print("Dropdown açıldı")
             return success
         except Exception as e:
             print(f"Dropdown açma hatası: {e}")
             return False
 
+    @budget(15)
     def select_dropdown_option(self, dropdown_locator, option_text):
-        """Dropdown aç ve seçenek seç - Sadece Arrow Down"""
+        """Dropdown aç ve seçenek seç (arama + virtual list kaydırma ile tek adımda)"""
         try:
-            # Dropdown'ı aç
-            if not self.open_dropdown(dropdown_locator):
-                return False
-
-            print(f"{option_text} aranıyor...")
-            time.sleep(1)
-
-            # Dropdown input'a focus yap
-            try:
-                dropdown_input = self.driver.find_element(By.XPATH,
-                                                          "//input[contains(@class, 'ant-select-selection-search-input')]")
-                dropdown_input.click()
-                time.sleep(0.5)
-            except:
-                print("Dropdown input bulunamadı, devam ediliyor...")
-
-            # Arrow Down ile aşağı in ve seçeneği ara
-            option_xpath = f"//div[contains(@class, 'ant-select-item') and contains(text(), '{option_text}')]"
-
-            max_attempts = 50  # Daha fazla deneme
-            for i in range(max_attempts):
-                print(f"Arrow Down {i + 1}...")
-
-                # Arrow Down gönder
-                focused_elem = self.driver.switch_to.active_element
-                focused_elem.send_keys(Keys.ARROW_DOWN)
-                time.sleep(0.2)
-
-                # Her arrow down'dan sonra seçeneği ara
-                try:
-                    element = self.driver.find_element(By.XPATH, option_xpath)
-                    if element.is_displayed():
-                        element.click()
-                        print(f"Seçenek {i + 1}. arrow down'da bulundu: {option_text}")
-                        return True
-                except:
-                    # Bulunamadı, devam et
-                    continue
-
-            print(f"50 arrow down sonrası seçenek bulunamadı: {option_text}")
-            return False
-
+            return AntSelect(self.driver, dropdown_locator).select(option_text)
         except Exception as e:
             print(f"Dropdown seçim hatası: {e}")
             return False
@@ -176,28 +139,29 @@ class FlowEditPage(BasePage):
         """Max Chars gir - Slow input yöntemi"""
         return self.overwrite_input_slowly(self.driver, self.STRINGMAXCHAR[1], maxchar)
 
+    def get_stringgen_state(self):
+        """StringGenerator Min/Max Chars alanları + SAVE butonu (tek round trip)"""
+        return self.query_state({
+            "min_chars": self.STRINGMINCHAR,
+            "max_chars": self.STRINGMAXCHAR,
+            "save": self.SAVE_BUTTON,
+        })
+
     def overwrite_input_slowly(self, driver, xpath, value):
-        """Zorlu inputlar için tek tek silip tekrar yazma yöntemi"""
+        """Zorlu inputlar (InputNumber) için değeri tamamen değiştir
+
+        Native setter + input/change event'leri ile tek seferde yazılır; değer
+        tutmazsa alan temizlenip değer klavyeden yazılır (tuş başına bekleme yok).
+        """
         try:
             input_field = WebDriverWait(driver, 5).until(
                 EC.element_to_be_clickable((By.XPATH, xpath))
             )
             input_field.click()
-            time.sleep(0.2)
-
-            # Önce sona git ve tüm karakterleri sil
-            input_text = input_field.get_attribute("value")
-            for _ in range(len(input_text)):
-                input_field.send_keys(Keys.BACKSPACE)
-                time.sleep(0.05)
-
-            # Ardından yeni değeri karakter karakter yaz
-            for char in value:
-                input_field.send_keys(char)
-                time.sleep(0.05)
+            text_input.fill(driver, input_field, value, fast=True)
 
             input_field.send_keys(Keys.TAB)
-            time.sleep(0.2)
+            self.wait_for(conditions.animations_finished(), timeout=1)
             return True
 
         except Exception as e:
@@ -207,7 +171,7 @@ class FlowEditPage(BasePage):
     def click_save_button(self):
         """SAVE butonuna tıkla """
         print("SAVE butonuna tıklanıyor ")
-        return self.click_element_with_scroll(self.SAVE_BUTTON)
+        return self.click_and_wait_for_network(self.SAVE_BUTTON)
 
     def boolean_truht_percentage(self, percantage):
         return self.overwrite_input_slowly(self.driver,self.BOOLEANPER[1], percantage)
@@ -219,7 +183,7 @@ class FlowEditPage(BasePage):
             close_button = self.driver.find_element(*self.MODAL_CLOSE_X)
             if close_button.is_displayed():
                 close_button.click()
-                time.sleep(1)
+                self.wait_for_modal_closed(timeout=3)
                 print("Modal × butonu ile başarıyla kapatıldı")
                 return True
             else:
@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .list_table import ListTable
 
 
 
@@ -11,6 +12,7 @@ class SyntheticFlowListPage(BasePage):
 
     def __init__(self,driver):
         super().__init__(driver)
+        self.table = ListTable(driver)
 
     def click_newflow(self):
 
@@ -28,9 +30,7 @@ class SyntheticFlowListPage(BasePage):
         """Table Conf butonuna tıkla"""
         print("Table Conf butonuna tıklanıyor")
 
-        TABLECONFBUTTON = (By.XPATH,f"//tr[.//span[text()='{projectname}']]//button[1]")
-
-        success = self.click_element(TABLECONFBUTTON)
+        success = self.table.click_row_button(projectname, index=0)
         if success:
             print("Table Conf butonuna başarıyla tıklandı")
         else:
@@ -43,10 +43,7 @@ class SyntheticFlowListPage(BasePage):
 
         print("Delete butonuna tıklanıyor")
 
-        FLOWDELETE_BUTTON = (By.XPATH,
-                             f"//tr[.//span[text()='{projectname}']]//button[2]")
-
-        success = self.click_element(FLOWDELETE_BUTTON)
+        success = self.table.click_row_button(projectname, index=1)
         if success:
             print("DELETE butonuna başarıyla tıklandı")
             DELETE_CONFIRM_BUTTON = (By.XPATH, "//span[text()='DELETE']")
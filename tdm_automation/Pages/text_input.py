@@ -0,0 +1,92 @@
+import os
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.keys import Keys
+
+# auto: FAST_INPUT_MIN_LENGTH ve üzeri metinler hızlı yoldan, kısalar klavyeden
+# fast: her zaman hızlı yol (tutmazsa klavye), keys: her zaman klavye
+INPUT_MODE = os.getenv('INPUT_MODE', 'auto').lower()
+FAST_INPUT_MIN_LENGTH = int(os.getenv('FAST_INPUT_MIN_LENGTH', '50'))
+
+# Input/textarea değerini tek seferde yazar. Prototype'taki native setter React'in
+# instance üzerindeki value tracker'ını atlar; böylece dispatch edilen input
+# event'i onChange'i tetikler. maxlength klavyeden yazarken olduğu gibi uygulanır.
+# Input/textarea değilse (contenteditable vb.) ya da yazılamıyorsa null döner.
+SET_VALUE_SCRIPT = """
+var el = arguments[0], text = arguments[1];
+if ((el.tagName !== 'INPUT' && el.tagName !== 'TEXTAREA') || el.readOnly || el.disabled) { return null; }
+if (el.maxLength >= 0 && text.length > el.maxLength) { text = text.substr(0, el.maxLength); }
+
+var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+var previous = el.value;
+el.focus();
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, text);
+if (el._valueTracker) { el._valueTracker.setValue(previous); }
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return {expected: text, value: el.value};
+"""
+
+# contenteditable elementi focus'la ve içeriğini seç (Input.insertText üzerine yazsın)
+SELECT_EDITABLE_SCRIPT = """
+var el = arguments[0];
+if (!el.isContentEditable) { return false; }
+el.focus();
+var range = document.createRange();
+range.selectNodeContents(el);
+var selection = window.getSelection();
+selection.removeAllRanges();
+selection.addRange(range);
+return true;
+"""
+
+
+def _has_special_keys(text):
+    """Keys.ENTER gibi WebDriver tuş kodları (U+E000-U+E0FF) var mı"""
+    return any("\ue000" <= char <= "\ue0ff" for char in text)
+
+
+def fill(driver, element, text, fast=None):
+    """Elementin değerini text yap; kullanılan yolu döndürür: "js", "cdp" ya da "keys"
+
+    Hızlı yolda input/textarea için native setter + input/change event'leri,
+    contenteditable için CDP Input.insertText kullanılır. Değer sonradan okunup
+    doğrulanır; tutmazsa (ör. onChange karakter filtreliyor) klavyeden yazılır.
+    """
+    text = str(text)
+    if fast is None:
+        fast = INPUT_MODE == "fast" or (INPUT_MODE == "auto" and len(text) >= FAST_INPUT_MIN_LENGTH)
+    if fast and INPUT_MODE != "keys" and not _has_special_keys(text):
+        result = driver.execute_script(SET_VALUE_SCRIPT, element, text)
+        if result is None:
+            if _insert_text(driver, element, text):
+                return "cdp"
+        elif result["value"] == result["expected"]:
+            return "js"
+        else:
+            print(f"Hızlı giriş değeri tutmadı ({len(result['value'])}/{len(result['expected'])} karakter), "
+                  f"klavye ile yazılıyor")
+    type_keys(element, text)
+    return "keys"
+
+
+def _insert_text(driver, element, text):
+    """contenteditable'a CDP Input.insertText ile yaz (Chrome değilse False)"""
+    if not hasattr(driver, "execute_cdp_cmd") or not driver.execute_script(SELECT_EDITABLE_SCRIPT, element):
+        return False
+    try:
+        driver.execute_cdp_cmd("Input.insertText", {"text": text})
+        return True
+    except WebDriverException as e:
+        print(f"Input.insertText başarısız: {e}")
+        return False
+
+
+def type_keys(element, text):
+    """Alanı temizle ve metni klavyeden yaz (tek send_keys çağrısı)"""
+    element.clear()
+    if element.get_attribute("value"):
+        # React controlled input clear()'ı geri alabilir
+        element.send_keys(Keys.CONTROL, "a")
+        element.send_keys(Keys.BACKSPACE)
+    element.send_keys(text)
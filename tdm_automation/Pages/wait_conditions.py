@@ -0,0 +1,190 @@
+"""BasePage.wait_for ile kullanılan birleştirilebilir bekleme koşulları
+
+Her koşul driver alan bir callable'dır, yani WebDriverWait ve selenium'un
+expected_conditions'ı ile birlikte kullanılabilir. JsCondition'lar `&` ve `|`
+ile birleştirildiğinde tek bir execute_script çağrısına dönüşür.
+"""
+import json
+import time
+
+# Sayfaya bir kez eklenen XHR/fetch sayacı (network_idle için)
+INSTALL_REQUEST_COUNTER = """
+if (!window.__tdmRequests) {
+    var state = window.__tdmRequests = {pending: 0, lastActivity: Date.now()};
+    var begin = function () { state.pending++; state.lastActivity = Date.now(); };
+    var end = function () { state.pending = Math.max(0, state.pending - 1); state.lastActivity = Date.now(); };
+
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        begin();
+        this.addEventListener('loadend', end);
+        return originalSend.apply(this, arguments);
+    };
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            begin();
+            return originalFetch.apply(this, arguments).finally(end);
+        };
+    }
+}
+"""
+
+
+class JsCondition:
+    """Tarayıcıda çalışan boolean JS ifadesi"""
+
+    def __init__(self, expression, description, setup=""):
+        self.expression = expression
+        self.description = description
+        self.setup = setup
+
+    def script(self):
+        return f"{self.setup}\nreturn !!({self.expression});"
+
+    def __call__(self, driver):
+        return driver.execute_script(self.script())
+
+    def __and__(self, other):
+        return JsCondition(f"({self.expression}) && ({other.expression})",
+                           f"{self.description} & {other.description}",
+                           _join_setup(self.setup, other.setup))
+
+    def __or__(self, other):
+        return JsCondition(f"({self.expression}) || ({other.expression})",
+                           f"{self.description} | {other.description}",
+                           _join_setup(self.setup, other.setup))
+
+    def __repr__(self):
+        return f"<JsCondition {self.description}>"
+
+
+class stable_for:
+    """Koşul `seconds` boyunca kesintisiz sağlanınca True döner"""
+
+    def __init__(self, condition, seconds):
+        self.condition = condition
+        self.seconds = seconds
+        self._since = None
+
+    def __call__(self, driver):
+        if not self.condition(driver):
+            self._since = None
+            return False
+        now = time.monotonic()
+        if self._since is None:
+            self._since = now
+        return now - self._since >= self.seconds
+
+
+def _join_setup(first, second):
+    if first == second:
+        return first
+    return f"{first}\n{second}"
+
+
+# Görünür Ant Design modal wrapper'ı
+_VISIBLE_MODAL = (
+    "Array.prototype.some.call(document.querySelectorAll('.ant-modal-wrap'), function (el) {"
+    " return getComputedStyle(el).display !== 'none' && el.querySelector('.ant-modal') !== null; })"
+)
+
+# rc-motion'ın enter/leave/appear sırasında eklediği class'lar
+_MOTION_ACTIVE = (
+    "document.querySelector(\"[class*='-enter-active'], [class*='-leave-active'], [class*='-appear-active']\") !== null"
+)
+
+# Sonsuz animasyonlar (spinner ikonları) hariç çalışan CSS/Web animasyonları
+_RUNNING_ANIMATIONS = (
+    "(document.getAnimations ? document.getAnimations().filter(function (a) {"
+    " return a.playState === 'running' && a.effect && a.effect.getComputedTiming().iterations !== Infinity;"
+    " }).length : 0)"
+)
+
+
+def modal_open():
+    """Bir Ant Design modal açık ve açılış animasyonu bitmiş"""
+    return JsCondition(f"{_VISIBLE_MODAL} && !({_MOTION_ACTIVE})", "modal_open")
+
+
+def modal_closed():
+    """Açık Ant Design modal kalmamış"""
+    return JsCondition(f"!({_VISIBLE_MODAL})", "modal_closed")
+
+
+def spinner_gone():
+    """Ant Design spinner / loading buton kalmamış"""
+    return JsCondition(
+        "document.querySelector('.ant-spin-spinning, .ant-btn-loading, .ant-skeleton-active') === null",
+        "spinner_gone")
+
+
+def animations_finished():
+    """Çalışan (sonlu) animasyon ya da rc-motion geçişi kalmamış"""
+    return JsCondition(f"{_RUNNING_ANIMATIONS} === 0 && !({_MOTION_ACTIVE})", "animations_finished")
+
+
+def dropdown_open():
+    """Ant select dropdown'ı açık ve animasyonu bitmiş"""
+    return JsCondition(
+        "document.querySelector('.ant-select-dropdown:not(.ant-select-dropdown-hidden)') !== null"
+        f" && !({_MOTION_ACTIVE})",
+        "dropdown_open")
+
+
+def dropdown_options_loaded():
+    """Açık dropdown'da en az bir seçenek render edilmiş"""
+    return JsCondition(
+        "document.querySelector('.ant-select-dropdown:not(.ant-select-dropdown-hidden) .ant-select-item-option') !== null",
+        "dropdown_options_loaded")
+
+
+def dropdown_closed():
+    """Açık ant select dropdown'ı kalmamış"""
+    return JsCondition(
+        "document.querySelector('.ant-select-dropdown:not(.ant-select-dropdown-hidden)') === null",
+        "dropdown_closed")
+
+
+def code_editor_synced():
+    """Kod editörlerinin (.w-tc-editor) highlight önizlemesi textarea değerine yetişmiş"""
+    return JsCondition(
+        "Array.prototype.every.call(document.querySelectorAll('.w-tc-editor'), function (root) {"
+        " var area = root.querySelector('textarea'), preview = root.querySelector('.w-tc-editor-preview');"
+        " return !area || !preview || preview.textContent.trim() === area.value.trim(); })",
+        "code_editor_synced")
+
+
+def upload_finished(file_name):
+    """Upload listesinde file_name görünüyor ve yüklemesi süren dosya kalmamış"""
+    return JsCondition(
+        "Array.prototype.some.call(document.querySelectorAll('.ant-upload-list-item'), function (el) {"
+        f" return el.textContent.indexOf({json.dumps(str(file_name))}) !== -1; }})"
+        " && document.querySelector('.ant-upload-list-item-uploading, .ant-upload-list-item-progress') === null",
+        f"upload_finished({file_name})")
+
+
+def toast_shown(text=None):
+    """Ant message/notification gösterilmiş (opsiyonel olarak text içeriyor)"""
+    selector = "document.querySelectorAll('.ant-message-notice, .ant-notification-notice')"
+    if text is None:
+        return JsCondition(f"{selector}.length > 0", "toast_shown")
+    return JsCondition(
+        f"Array.prototype.some.call({selector}, function (el) {{"
+        f" return el.textContent.toLowerCase().indexOf({json.dumps(str(text).lower())}) !== -1; }})",
+        f"toast_shown({text})")
+
+
+def network_idle(quiet_ms=500):
+    """Bekleyen XHR/fetch yok ve son `quiet_ms` boyunca yeni istek başlamamış"""
+    return JsCondition(
+        "document.readyState === 'complete' && window.__tdmRequests.pending === 0"
+        f" && Date.now() - window.__tdmRequests.lastActivity >= {int(quiet_ms)}",
+        f"network_idle({quiet_ms})",
+        setup=INSTALL_REQUEST_COUNTER)
+
+
+def ui_idle(quiet_ms=300):
+    """Spinner yok, animasyon yok, network sakin - sabit sleep'lerin yerine"""
+    return spinner_gone() & animations_finished() & network_idle(quiet_ms)
@@ -0,0 +1,294 @@
+import json
+import os
+from collections import defaultdict
+
+import pytest
+from dotenv import load_dotenv
+
+# Tests/.env: session hook'ları (sweep dahil) test modülleriyle aynı ayarları görsün.
+# Utils modülleri ayarları import sırasında okuduğu için import'lardan önce yüklenir.
+load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+
+from tdm_automation.Utils import browser_contexts, budgets, trace_capture
+from tdm_automation.Utils.action_profiler import profiler, write_profile
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.session_cache import SessionCache
+from tdm_automation.Utils.sweeper import run_sweep
+from tdm_automation.Utils.tdm_api import ApiSeeder, TdmApiClient
+
+# Geçmiş koşulardaki test süreleri (reports/ CI'da volume olarak bağlı olduğu için kalıcı)
+DURATIONS_FILE = os.getenv('TEST_DURATIONS_FILE', os.path.join('reports', 'test_durations.json'))
+
+_durations = {}
+_action_records = {}
+_step_records = {}
+_capture_marks = {}
+_phase_durations = defaultdict(float)
+_failed = set()
+_violations = {}
+_budgets = None
+# Sweep bu session'da çalışacak mı (collection'dan sonra belli olur)
+_sweep_needed = False
+
+
+def _is_xdist_worker(config):
+    return hasattr(config, "workerinput")
+
+
+def _report_dir(config):
+    """pytest-html raporunun dizini (yoksa reports/)"""
+    html_path = getattr(config.option, "htmlpath", None)
+    return os.path.dirname(html_path) if html_path else "reports"
+
+
+def _is_xdist_master(config):
+    return config.pluginmanager.has_plugin("dsession")
+
+
+def _touches_tdm(item):
+    """Test TDM'de veri oluşturabilir mi: API fixture'ı ya da @pytest.mark.tdm"""
+    if any(mark.name == "skip" or (mark.args and mark.args[0] is True)
+           for mark in item.iter_markers() if mark.name in ("skip", "skipif")):
+        return False
+    return bool({"tdm_api", "seeder"} & set(item.fixturenames)) or item.get_closest_marker("tdm") is not None
+
+
+def _sweep(config, phase):
+    """Sızan eski test verilerini sil; UI yolu SWEEP_UI=true ister
+
+    SWEEP varsayılan olarak sadece Docker'da (DOCKER_MODE=true) açıktır ve
+    session'da TDM'e dokunan bir test yoksa çalışmaz.
+    """
+    if not _sweep_needed or _is_xdist_worker(config):
+        return
+    driver = DriverPool.instance().acquire() if os.getenv('SWEEP_UI', 'false').lower() == 'true' else None
+    try:
+        run_sweep(phase, _report_dir(config), driver=driver)
+    except Exception as e:
+        print(f"Sweep ({phase}) başarısız: {e}")
+    finally:
+        if driver is not None:
+            DriverPool.instance().release(driver)
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "tdm: TDM'e login olup veri oluşturan UI testleri (sweep kararında kullanılır)")
+    # context modunda worker'lar master'ın açtığı tek Chrome'a bağlanır
+    if browser_contexts.BROWSER_MODE == "context" and not _is_xdist_worker(config):
+        try:
+            browser_contexts.start_host()
+        except Exception as e:
+            # Worker'lar kendi host'larını açar (paylaşım olmaz ama testler çalışır)
+            print(f"Browser context host'u başlatılamadı: {e}")
+
+
+def pytest_sessionstart(session):
+    global _budgets
+    # Baseline'lar session başındaki halleriyle kullanılır (sessionfinish'te güncellenir)
+    _budgets = {"config": budgets.Budgets.load(), "tests": _load_durations(), "steps": budgets.load_baseline()}
+    if _is_xdist_master(session.config):
+        # Master test toplamaz; hangi testlerin koşacağını bilmeden SWEEP ayarına uyar
+        _decide_sweep(session.config, touches_tdm=True)
+
+
+def pytest_collection_finish(session):
+    _decide_sweep(session.config, any(_touches_tdm(item) for item in session.items))
+
+
+def _decide_sweep(config, touches_tdm):
+    global _sweep_needed
+    enabled = os.getenv('SWEEP', os.getenv('DOCKER_MODE', 'false')).lower() == 'true'
+    _sweep_needed = enabled and touches_tdm and not config.option.collectonly
+    _sweep(config, "before")
+
+
+def _load_durations():
+    try:
+        with open(DURATIONS_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _scope_of(nodeid):
+    """--dist loadscope ile aynı gruplama: modül::sınıf"""
+    return nodeid.rsplit("::", 1)[0]
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """Sınıfları geçmiş toplam sürelerine göre uzundan kısaya sırala
+
+    loadscope scheduler sınıfları collection sırasına göre boşta olan worker'a
+    verir; en uzun sınıflar önce başlarsa son worker'ın tek başına kaldığı
+    kuyruk süresi kısalır. Sınıf içindeki test sırası korunur.
+    """
+    history = _load_durations()
+    if not history:
+        return
+
+    totals = defaultdict(float)
+    for item in items:
+        totals[_scope_of(item.nodeid)] += history.get(item.nodeid, 0.0)
+
+    first_seen = {}
+    for index, item in enumerate(items):
+        first_seen.setdefault(_scope_of(item.nodeid), index)
+
+    items.sort(key=lambda item: (-totals[_scope_of(item.nodeid)], first_seen[_scope_of(item.nodeid)]))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Testin network/trace penceresinin başlangıcını işaretle"""
+    _capture_marks[item.nodeid] = trace_capture.mark()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Teardown raporuna testin BasePage aksiyon kayıtlarını ekle, başarısız/yavaş testlere HAR/trace ekle
+
+    user_properties xdist'te master'a taşındığı için profil worker'lardan da toplanır.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    _phase_durations[item.nodeid] += call.duration
+    if call.when == "teardown":
+        records = profiler.drain()
+        steps = budgets.steps.drain()
+        report.user_properties.append(("action_profile", records))
+        report.user_properties.append(("step_profile", steps))
+        _check_budgets(item, report, records + steps)
+        _capture_marks.pop(item.nodeid, None)
+    elif (call.when == "call" or report.failed) and trace_capture.should_capture(report.failed, call.duration):
+        _attach_capture(item, report)
+
+
+def _check_budgets(item, report, records):
+    """Test ve adım bütçelerini / baseline regresyonlarını kontrol et; BUDGET_MODE=fail ise teardown'u fail et"""
+    if _budgets is None:
+        return
+    config = _budgets["config"]
+    violations = config.check(item.nodeid, _phase_durations.pop(item.nodeid, 0.0), records,
+                              test_baseline=_budgets["tests"].get(item.nodeid), step_baseline=_budgets["steps"])
+    if not violations:
+        return
+    report.user_properties.append(("budget_violations", violations))
+    if config.mode == "fail" and report.passed:
+        report.outcome = "failed"
+        report.longrepr = "Süre bütçesi aşıldı:\n" + "\n".join(violations)
+
+
+def _attach_capture(item, report):
+    """Ring buffer'daki test penceresini gzip'li HAR/trace olarak yaz ve html rapora linkle"""
+    report_dir = _report_dir(item.config)
+    try:
+        paths = trace_capture.dump(item.nodeid, _capture_marks.get(item.nodeid, 0),
+                                   os.path.join(report_dir, "captures"))
+    except OSError as e:
+        print(f"Network capture yazılamadı: {e}")
+        return
+
+    pytest_html = item.config.pluginmanager.getplugin("html")
+    if not paths or pytest_html is None:
+        return
+    extras = getattr(report, "extras", [])
+    for path in paths:
+        name = "Trace" if path.endswith(".trace.json.gz") else "HAR"
+        extras.append(pytest_html.extras.url(os.path.relpath(path, report_dir), name=name))
+    report.extras = extras
+
+
+def pytest_runtest_logreport(report):
+    """Test süresini (setup + call + teardown) ve aksiyon kayıtlarını topla"""
+    _durations[report.nodeid] = _durations.get(report.nodeid, 0.0) + report.duration
+    if report.failed:
+        _failed.add(report.nodeid)
+    for name, value in report.user_properties:
+        if name == "action_profile" and value:
+            _action_records.setdefault(report.nodeid, []).extend(value)
+        elif name == "step_profile" and value:
+            _step_records.setdefault(report.nodeid, []).extend(value)
+        elif name == "budget_violations" and value:
+            _violations[report.nodeid] = value
+
+
+@pytest.fixture(scope="session")
+def tdm_api():
+    """Session boyunca tek (bağlantı havuzlu) backend client'ı; yapılandırılmamışsa None"""
+    session_cache = SessionCache(os.getenv('VALID_USERNAME'), os.getenv('VALID_PASSWORD'), os.getenv('BASE_URL'))
+    client = TdmApiClient.from_env(session_cache)
+    yield client
+    if client is not None:
+        client.close()
+
+
+@pytest.fixture
+def seeder(tdm_api):
+    """Test ön koşullarını API ile oluşturur, test sonunda siler"""
+    seeder = ApiSeeder(tdm_api)
+    yield seeder
+    seeder.cleanup()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Session sonunda sweep çalıştır, havuzdaki browser'ları kapat, süreleri ve aksiyon profilini kaydet"""
+    _sweep(session.config, "after")
+    DriverPool.shutdown()
+
+    # Worker'ların raporları master'a da geldiği için dosyaları sadece master yazar
+    if _is_xdist_worker(session.config):
+        return
+
+    if _action_records:
+        # pytest-html raporunun yanına yaz
+        try:
+            write_profile(_action_records, _report_dir(session.config))
+        except OSError as e:
+            print(f"Aksiyon profili kaydedilemedi: {e}")
+
+    if _action_records or _step_records:
+        try:
+            budgets.update_baseline(_all_steps(), _failed)
+        except OSError as e:
+            print(f"Adım baseline'ı kaydedilemedi: {e}")
+
+    if not _durations:
+        return
+
+    # Başarısız testlerin süresi geçmişi (sıralama ve regresyon baseline'ı) bozmasın
+    durations = {nodeid: duration for nodeid, duration in _durations.items() if nodeid not in _failed}
+    history = _load_durations()
+    history.update(durations)
+    try:
+        os.makedirs(os.path.dirname(DURATIONS_FILE) or ".", exist_ok=True)
+        tmp = f"{DURATIONS_FILE}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(history, f, indent=2, sort_keys=True)
+        os.replace(tmp, DURATIONS_FILE)
+    except OSError as e:
+        print(f"Test süreleri kaydedilemedi: {e}")
+
+
+def _all_steps():
+    """BasePage aksiyonları + @budget'lı page metodları, test bazında"""
+    merged = {nodeid: list(records) for nodeid, records in _action_records.items()}
+    for nodeid, records in _step_records.items():
+        merged.setdefault(nodeid, []).extend(records)
+    return merged
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """En yavaş N adımı ve bütçe aşımlarını yazdır (BUDGET_TOP_N=0 ile kapatılır)"""
+    if _is_xdist_worker(config):
+        return
+    top = int(os.getenv('BUDGET_TOP_N', '15'))
+    rows = budgets.top_steps(_all_steps(), top) if top > 0 else []
+    if rows:
+        terminalreporter.write_sep("=", f"en yavaş {len(rows)} adım")
+        terminalreporter.write_line(budgets.format_top_steps(rows))
+    if _violations:
+        terminalreporter.write_sep("=", f"süre bütçesi aşımları ({len(_violations)} test)")
+        for nodeid, violations in sorted(_violations.items()):
+            terminalreporter.write_line(nodeid)
+            for violation in violations:
+                terminalreporter.write_line(f"    {violation}")
@@ -1,23 +1,23 @@
 
 import os
+import pytest
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 from tdm_automation.Pages.login_page import LoginPage
 from tdm_automation.Pages.tdm_dashboard_page import TDMDashboardPage
 from tdm_automation.Pages.application_management_page import AppManagementPage
 from tdm_automation.Pages.create_application_page import CreateAppPage
 from tdm_automation.Pages.create_module_page import CreateModulePage
 from tdm_automation.Pages.product_info_page import ProductInfoPage
-from selenium.webdriver.chrome.options import Options
-import time
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.namespace import unique_name
+from tdm_automation.Utils.session_cache import SessionCache
 
 
 load_dotenv()
 
 
+@pytest.mark.tdm
 class TestAppManagement:
 
     @classmethod
@@ -38,38 +38,8 @@ class TestAppManagement:
         cls.TEST_VERSION_2 = os.getenv('TEST_VERSION_2', 'V2')
         cls.TEST_VERSION_3 = os.getenv('TEST_VERSION_3', 'V3')
 
-        # Environment değişkenlerini al
-        cls.HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
-        cls.DOCKER_MODE = os.getenv('DOCKER_MODE', 'false').lower() == 'true'
-
-        # Chrome options - Docker ve headless için optimize edilmiş
-        cls.chrome_options = Options()
-
-        if cls.HEADLESS:
-            cls.chrome_options.add_argument("--headless")
-            print("HEADLESS modda çalışıyor")
-
-        if cls.DOCKER_MODE:
-            # Docker için gerekli argumentlar
-            cls.chrome_options.add_argument("--no-sandbox")
-            cls.chrome_options.add_argument("--disable-dev-shm-usage")
-            cls.chrome_options.add_argument("--disable-gpu")
-            cls.chrome_options.add_argument("--remote-debugging-port=9222")
-            cls.chrome_options.add_argument("--incognito")
-            print("DOCKER modda çalışıyor")
-        else:
-            # Local development için
-            cls.chrome_options.add_argument("--incognito")
-
-        # Genel performans ayarları
-        cls.chrome_options.add_argument("--window-size=1920,1080")
-        cls.chrome_options.add_argument("--disable-web-security")
-        cls.chrome_options.add_argument("--ignore-certificate-errors")
-
-        # WebDriver kurulumu
-        cls.service = Service(ChromeDriverManager().install())
-        cls.driver = webdriver.Chrome(service=cls.service, options=cls.chrome_options)
-        cls.driver.maximize_window()
+        # WebDriver havuzdan kiralanır (session boyunca açık kalır)
+        cls.driver = DriverPool.instance().acquire()
 
         # Page object'leri oluştur
         cls.login_page = LoginPage(cls.driver)
@@ -80,14 +50,10 @@ class TestAppManagement:
         cls.create_mdl_page = CreateModulePage(cls.driver)
 
         # *** TEK SEFERLİK LOGIN İŞLEMLERİ ***
-        cls.driver.get(cls.BASE_URL)
-        login_success = cls.login_page.do_login(cls.VALID_USERNAME, cls.VALID_PASSWORD)
-        assert login_success, "Login başarısız!"
-
-        # TDM'ye git
-        tdm_locator = (By.XPATH, "//li[@title='New Test Data Manager'][2]")
-        tdm_success = cls.login_page.click_element(tdm_locator)
-        assert tdm_success, "TDM elementine tıklanamadı"
+        # Cache'te geçerli oturum varsa enjekte edilir, yoksa UI'dan login olunur
+        session_cache = SessionCache(cls.VALID_USERNAME, cls.VALID_PASSWORD, cls.BASE_URL)
+        tdm_success = session_cache.open_tdm(cls.driver)
+        assert tdm_success, "TDM oturumu açılamadı"
 
         # App Management'e git
         appman_success = cls.appman_page.click_appman()
@@ -98,18 +64,22 @@ class TestAppManagement:
     @classmethod
     def teardown_class(cls):
         """Tüm testler bitince tek sefer çalışır"""
-        print("\n=== CLASS TEARDOWN: Driver kapatılıyor ===")
+        print("\n=== CLASS TEARDOWN: Driver havuza iade ediliyor ===")
         if hasattr(cls, 'driver'):
-            cls.driver.quit()
+            DriverPool.instance().release(cls.driver)
+
+    @pytest.fixture(autouse=True)
+    def _api_seeder(self, seeder):
+        """Ön koşulları API ile oluşturan seeder (conftest) - test sonunda kayıtları siler"""
+        self.seeder = seeder
 
     def setup_method(self, method):
         """Her test öncesi çalışır - SADECE TEST-SPECIFIC SETUP"""
         print(f"\n--- Test başlıyor: {method.__name__} ---")
 
         # Test data - her test için unique değerler
-        timestamp = int(time.time())
-        self.test_app_name = f"{self.TEST_APP_NAME}_{timestamp}"
-        self.test_module_name = f"{self.TEST_MODULE_NAME}_{timestamp}"
+        self.test_app_name = unique_name(self.TEST_APP_NAME)
+        self.test_module_name = unique_name(self.TEST_MODULE_NAME)
         self.test_version = self.TEST_VERSION
         self.test_version_2 = self.TEST_VERSION_2
         self.test_version_3 = self.TEST_VERSION_3
@@ -119,7 +89,7 @@ class TestAppManagement:
         if "application-management" not in current_url:
             print("App Management sayfasına yönlendiriliyor...")
             self.appman_page.click_appman()
-            time.sleep(1)
+            self.appman_page.wait_until_idle(1)
 
     def teardown_method(self, method):
         """Her test sonrası çalışır - SADECE TEST CLEANUP"""
@@ -127,11 +97,7 @@ class TestAppManagement:
 
         # Modal varsa kapat
         try:
-            cancel_buttons = self.driver.find_elements(By.XPATH, "//span[text()='CANCEL']")
-            for button in cancel_buttons:
-                if button.is_displayed():
-                    button.click()
-                    time.sleep(0.5)
+            self.appman_page.dismiss_dialogs(("CANCEL",))
         except:
             pass
 
@@ -143,28 +109,42 @@ class TestAppManagement:
 
     def _cleanup_test_data(self):
         """Test verilerini temizle"""
+        if self.seeder.seeded(self.test_app_name):
+            # API ile oluşturuldu - seeder fixture'ı siler
+            return
         try:
-            # Oluşturulan app'i sil
-            page_source = self.driver.page_source
-            if hasattr(self, 'test_app_name') and self.test_app_name in page_source:
+            # Oluşturulan app'i sil (hangi sayfada olursa olsun)
+            table = self.appman_page.table
+            if hasattr(self, 'test_app_name') and table.contains(self.test_app_name):
                 self.appman_page.click_deleteapp_andconfirm_button(self.test_app_name)
-                time.sleep(1)
+                self.appman_page.wait_until_idle(1)
+            table.clear_search()
         except:
             pass
 
     def _create_test_app(self):
-        """Test için gerekli app'i oluştur - Helper method"""
+        """Test için gerekli app'i oluştur - Helper method
+
+        Backend API erişilebilirse app API ile oluşturulur ve liste yenilenir;
+        değilse NEW modal'ı üzerinden UI ile oluşturulur.
+        """
+        if self.seeder.application(self.test_app_name, [self.test_version]):
+            self.driver.refresh()
+            self.appman_page.table.invalidate()
+            self.appman_page.wait_until_idle(2)
+            return True
+
         try:
             # NEW butonuna tıkla
             self.appman_page.click_newapp_button()
-            time.sleep(1)
+            self.appman_page.wait_until_idle(1)
 
             # App name ve version gir
             self.create_app_page.enter_appname(self.test_app_name)
             self.create_app_page.enter_version(self.test_version)
             self.create_app_page.click_versionadd_button()
             self.create_app_page.click_save_button()
-            time.sleep(2)
+            self.appman_page.wait_until_idle(2)
 
             print(f"Test app oluşturuldu: {self.test_app_name}")
             return True
@@ -172,6 +152,27 @@ class TestAppManagement:
             print(f"Test app oluşturulamadı: {e}")
             return False
 
+    def _create_test_module(self):
+        """Test app'ine module ekle ve Module List'e geç - Helper method"""
+        if self.seeder.module(self.test_app_name, self.test_module_name, [self.test_version]):
+            opened = self.appman_page.click_modulelist_button(self.test_app_name)
+            self.appman_page.wait_until_idle(1)
+            return opened
+
+        # Module List sayfasına git ve module oluştur
+        self.appman_page.click_modulelist_button(self.test_app_name)
+        self.appman_page.wait_until_idle(1)
+
+        if not self.appman_page.click_modulelistADD_button(self.test_app_name):
+            print("'+' butonuna tıklanamadı")
+            return False
+        created = (self.create_mdl_page.enter_modulename(self.test_module_name)
+                   and self.create_mdl_page.enter_version(self.test_version)
+                   and self.create_mdl_page.click_versionadd_button()
+                   and self.create_mdl_page.click_save_button())
+        self.appman_page.wait_until_idle(2)
+        return created
+
     def test_TC010_new_button_click_modal_open(self):
         """TC_010: NEW butonuna tıklama ve modal açma"""
         print("\nTC_010: NEW butonuna tıklama ve modal açma ===")
@@ -181,8 +182,7 @@ class TestAppManagement:
         assert new_button_clicked, "NEW butonuna tıklanamadı"
 
         # Modal açıldığını kontrol et
-        page_source = self.driver.page_source.lower()
-        modal_present = "modal" in page_source
+        modal_present = self.appman_page.read_content().modal_open
         assert modal_present, "Modal açılmadı"
 
         # Application Name alanının görünür olduğunu kontrol et
@@ -219,11 +219,10 @@ class TestAppManagement:
         save_clicked = self.create_app_page.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
-        # Uygulamanın listede görünür olduğunu kontrol et
-        page_source = self.driver.page_source
-        assert self.test_app_name in page_source, f"Oluşturulan uygulama '{self.test_app_name}' listede görünmüyor"
+        # Uygulamanın listede olduğunu kontrol et (arama/sayfalama ile)
+        assert self.appman_page.table.contains(self.test_app_name), f"Oluşturulan uygulama '{self.test_app_name}' listede görünmüyor"
 
         print(f"Test başarılı: Uygulama '{self.test_app_name}' başarıyla oluşturuldu ve listede görünüyor")
 
@@ -239,7 +238,7 @@ class TestAppManagement:
         app_name_entered = self.create_app_page.enter_appname(self.test_app_name)
         assert app_name_entered, "Application Name girilemedi"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # SAVE disabled olmalı
         save_button = self.create_app_page.find_element(self.create_app_page.SAVE_BUTTON)
@@ -267,7 +266,7 @@ class TestAppManagement:
         add_clicked = self.create_app_page.click_versionadd_button()
         assert add_clicked, "ADD butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # SAVE disabled olmalı (app name olmadığı için)
         save_button = self.create_app_page.find_element(self.create_app_page.SAVE_BUTTON)
@@ -287,7 +286,7 @@ class TestAppManagement:
 
         # Her iki alanı da boş bırak (hiçbir şey girme)
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # SAVE disabled olmalı
         save_button = self.create_app_page.find_element(self.create_app_page.SAVE_BUTTON)
@@ -325,17 +324,16 @@ class TestAppManagement:
         add2_clicked = self.create_app_page.click_versionadd_button()
         assert add2_clicked, "İkinci ADD butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # SAVE butonuna tıkla
         save_clicked = self.create_app_page.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
-        # Uygulamanın listede görünür olduğunu kontrol et
-        page_source = self.driver.page_source
-        assert self.test_app_name in page_source, f"Çoklu versiyonlu uygulama '{self.test_app_name}' listede görünmüyor"
+        # Uygulamanın listede olduğunu kontrol et (arama/sayfalama ile)
+        assert self.appman_page.table.contains(self.test_app_name), f"Çoklu versiyonlu uygulama '{self.test_app_name}' listede görünmüyor"
 
         print(f"Test başarılı: Çoklu versiyonlu uygulama '{self.test_app_name}' başarıyla oluşturuldu")
 
@@ -365,11 +363,10 @@ class TestAppManagement:
         save_clicked = self.create_app_page.click_save_button()
         assert save_clicked, "İlk SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # İlk uygulamanın oluşturulduğunu kontrol et
-        page_source = self.driver.page_source
-        assert self.test_app_name in page_source, "İlk uygulama oluşturulamadı"
+        assert self.appman_page.table.contains(self.test_app_name), "İlk uygulama oluşturulamadı"
         print("İlk uygulama başarıyla oluşturuldu")
 
         # Şimdi aynı isimde ikinci uygulamayı oluşturmaya çalış
@@ -393,10 +390,10 @@ class TestAppManagement:
         # SAVE butonuna tıkla
         save_clicked2 = self.create_app_page.click_save_button()
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # Hata mesajı veya modal açık kalmalı
-        modal_present = "modal" in self.driver.page_source.lower()
+        modal_present = self.appman_page.read_content().modal_open
         if modal_present:
             print("Modal açık kaldı - Duplicate name hatası alındı")
         else:
@@ -408,7 +405,7 @@ class TestAppManagement:
         """TC_017: SQL cümleciği ile application name oluşturma"""
         print("\nTC_017: SQL cümleciği ile application name oluşturma ===")
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # NEW butonuna tıkla
         new_button_clicked = self.appman_page.click_newapp_button()
@@ -430,11 +427,11 @@ class TestAppManagement:
 
         # SAVE butonuna tıkla
         save_clicked = self.create_app_page.click_save_button()
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # Sistem hala çalışıyor mu kontrol et
-        page_source = self.driver.page_source
-        if sql_payload in page_source:
+        content = self.appman_page.read_content()
+        if content.has_row(sql_payload):
             print("UYARI: SQL kod sisteme kaydedildi")
 
         # Yeni modal açılabiliyor mu?
@@ -464,7 +461,7 @@ class TestAppManagement:
                 new_button_clicked = self.appman_page.click_newapp_button()
                 assert new_button_clicked, "NEW butonuna tıklanamadı"
 
-                time.sleep(1)
+                self.appman_page.wait_until_idle(1)
 
                 # Farklı dilde application name gir
                 app_name_entered = self.create_app_page.enter_appname(app_name)
@@ -477,11 +474,11 @@ class TestAppManagement:
                         if add_clicked:
                             # SAVE butonuna tıkla
                             save_clicked = self.create_app_page.click_save_button()
-                            time.sleep(2)
+                            self.appman_page.wait_until_idle(2)
 
                             # Oluşturuldu mu kontrol et
-                            page_source = self.driver.page_source
-                            if app_name in page_source:
+                            content = self.appman_page.read_content()
+                            if content.has_row(app_name):
                                 print(f"{lang_name} karakterleri kabul edildi")
                             else:
                                 print(f"{lang_name} karakterleri reddedildi")
@@ -490,7 +487,7 @@ class TestAppManagement:
                 try:
                     cancel_button = self.driver.find_element(By.XPATH, "//span[text()='CANCEL']")
                     cancel_button.click()
-                    time.sleep(1)
+                    self.appman_page.wait_until_idle(1)
                 except:
                     pass
 
@@ -528,10 +525,10 @@ class TestAppManagement:
 
         # SAVE butonuna tıkla
         save_clicked = self.create_app_page.click_save_button()
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # Modal hala açık mı (hata varsa açık kalır)
-        modal_present = "modal" in self.driver.page_source.lower()
+        modal_present = self.appman_page.read_content().modal_open
         assert modal_present, "Duplicate version hatası alınmadı"
 
         print("Test başarılı: Aynı version ile hata alındı")
@@ -546,19 +543,18 @@ class TestAppManagement:
         assert app_created, "Test app oluşturulamadı"
 
         # App oluşturulduğunu kontrol et
-        page_source = self.driver.page_source
-        assert self.test_app_name in page_source, "App oluşturulamadı"
+        assert self.appman_page.table.contains(self.test_app_name), "App oluşturulamadı"
         print("App başarıyla oluşturuldu")
 
         # Şimdi app'i sil
         delete_success = self.appman_page.click_deleteapp_andconfirm_button(self.test_app_name)
         assert delete_success, "App silinemedi"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # App silindiğini kontrol et
-        page_source = self.driver.page_source
-        assert self.test_app_name not in page_source, "App silinemedi"
+        content = self.appman_page.read_content()
+        assert not content.has_row(self.test_app_name), "App silinemedi"
 
         print("Test başarılı: App başarıyla silindi")
 
@@ -572,15 +568,14 @@ class TestAppManagement:
         assert app_created, "Test app oluşturulamadı"
 
         # App oluşturulduğunu kontrol et
-        page_source = self.driver.page_source
-        assert self.test_app_name in page_source, "App oluşturulamadı"
+        assert self.appman_page.table.contains(self.test_app_name), "App oluşturulamadı"
         print("App başarıyla oluşturuldu")
 
         # Edit butonuna tıkla
         edit_clicked = self.appman_page.click_appedit_button(self.test_app_name)
         assert edit_clicked, "Edit butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # Yeni version ekle
         new_version_entered = self.create_app_page.enter_version(self.test_version_2)
@@ -593,7 +588,7 @@ class TestAppManagement:
         save_edit_clicked = self.create_app_page.click_save_button()
         assert save_edit_clicked, "Edit SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         print("Test başarılı: App başarıyla düzenlendi ve yeni version eklendi")
 
@@ -610,11 +605,11 @@ class TestAppManagement:
         version_list_clicked = self.appman_page.click_versionlist_button(self.test_app_name)
         assert version_list_clicked, "Version List linkine tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # Version List sayfasının açıldığını kontrol et
-        page_source = self.driver.page_source
-        version_list_opened = "version" in page_source.lower()
+        content = self.appman_page.read_content()
+        version_list_opened = content.contains("version", case_sensitive=False)
         assert version_list_opened, "Version List sayfası açılmadı"
 
         print("Test başarılı: Version List sayfası açıldı")
@@ -632,11 +627,11 @@ class TestAppManagement:
         module_list_clicked = self.appman_page.click_modulelist_button(self.test_app_name)
         assert module_list_clicked, "Module List linkine tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # Module List sayfasının açıldığını kontrol et
-        page_source = self.driver.page_source
-        module_list_opened = "module" in page_source.lower()
+        content = self.appman_page.read_content()
+        module_list_opened = content.contains("module", case_sensitive=False)
         assert module_list_opened, "Module List sayfası açılmadı"
 
         print("Test başarılı: Module List sayfası açıldı")
@@ -652,16 +647,16 @@ class TestAppManagement:
 
         # Module List sayfasına git
         self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # '+' butonuna tıkla
         add_module_clicked = self.appman_page.click_modulelistADD_button(self.test_app_name)
         assert add_module_clicked, "'+' butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # Modal açıldığını kontrol et
-        modal_present = "modal" in self.driver.page_source.lower()
+        modal_present = self.appman_page.read_content().modal_open
         assert modal_present, "Modal açılmadı"
 
         # Form alanlarının mevcut olduğunu kontrol et
@@ -684,12 +679,12 @@ class TestAppManagement:
 
         # Module List sayfasına git
         self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         add_module_clicked = self.appman_page.click_modulelistADD_button(self.test_app_name)
         assert add_module_clicked, "'+' butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         module_name_entered = self.create_mdl_page.enter_modulename(self.test_module_name)
         assert module_name_entered, "Module name girilemedi"
@@ -703,13 +698,13 @@ class TestAppManagement:
         save_clicked = self.create_mdl_page.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
-        page_source = self.driver.page_source
-        module_found = self.test_module_name in page_source
+        content = self.appman_page.read_content()
+        module_found = content.has_row(self.test_module_name)
         assert module_found, f"Module '{self.test_module_name}' bulunamadı"
 
         print(f"Test başarılı: Module '{self.test_module_name}' başarıyla oluşturuldu")
@@ -725,12 +720,12 @@ class TestAppManagement:
 
         # Module List sayfasına git
         self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         add_module_clicked = self.appman_page.click_modulelistADD_button(self.test_app_name)
         assert add_module_clicked, "'+' butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         module_name_entered = self.create_mdl_page.enter_modulename(self.test_module_name)
         assert module_name_entered, "Module name girilemedi"
@@ -752,12 +747,12 @@ class TestAppManagement:
 
         # Module List sayfasına git
         self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         add_module_clicked = self.appman_page.click_modulelistADD_button(self.test_app_name)
         assert add_module_clicked, "'+' butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         version_entered = self.create_mdl_page.enter_version(self.test_version)
         assert version_entered, "Version girilemedi"
@@ -782,12 +777,12 @@ class TestAppManagement:
 
         # Module List sayfasına git
         self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         add_module_clicked = self.appman_page.click_modulelistADD_button(self.test_app_name)
         assert add_module_clicked, "'+' butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         save_button = self.create_mdl_page.find_element(self.create_mdl_page.SAVE_BUTTON)
         is_disabled = save_button.get_attribute("disabled") is not None
@@ -806,13 +801,13 @@ class TestAppManagement:
 
         # Module List sayfasına git
         self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # '+' butonuna tıkla
         add_module_clicked = self.appman_page.click_modulelistADD_button(self.test_app_name)
         assert add_module_clicked, "'+' butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # Module Name gir
         module_name_entered = self.create_mdl_page.enter_modulename(self.test_module_name)
@@ -838,14 +833,14 @@ class TestAppManagement:
         save_clicked = self.create_mdl_page.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # Module'ün oluşturulduğunu kontrol et
-        page_source = self.driver.page_source
-        module_found = self.test_module_name in page_source
+        content = self.appman_page.read_content()
+        module_found = content.has_row(self.test_module_name)
         assert module_found, f"Çoklu versiyonlu module '{self.test_module_name}' listede görünmüyor"
 
         print(f"Test başarılı: Çoklu versiyonlu module '{self.test_module_name}' başarıyla oluşturuldu")
@@ -862,13 +857,13 @@ class TestAppManagement:
 
         # Module List sayfasına git
         self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # İlk module'ü oluştur
         add_module_clicked = self.appman_page.click_modulelistADD_button(self.test_app_name)
         assert add_module_clicked, "'+' butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         module_name_entered = self.create_mdl_page.enter_modulename(self.test_module_name)
         assert module_name_entered, "Module Name girilemedi"
@@ -882,14 +877,14 @@ class TestAppManagement:
         save_clicked = self.create_mdl_page.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
         print("İlk module oluşturuldu")
 
         # Aynı isimde ikinci module oluşturmaya çalış
         add_module_clicked2 = self.appman_page.click_modulelistADD_button(self.test_app_name)
         assert add_module_clicked2, "İkinci '+' butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # Aynı Module Name gir
         module_name_entered2 = self.create_mdl_page.enter_modulename(self.test_module_name)
@@ -902,10 +897,10 @@ class TestAppManagement:
         assert add_clicked2, "İkinci ADD butonuna tıklanamadı"
 
         save_clicked2 = self.create_mdl_page.click_save_button()
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # Modal hala açık mı? (hata varsa açık kalır)
-        modal_present = "modal" in self.driver.page_source.lower()
+        modal_present = self.appman_page.read_content().modal_open
         if modal_present:
             print("Modal açık kaldı - Duplicate name hatası alındı")
         else:
@@ -938,13 +933,13 @@ class TestAppManagement:
             print(f"\n{lang_name} karakterleri test ediliyor: {module_name}")
 
             try:
-                time.sleep(1)
+                self.appman_page.wait_until_idle(1)
 
                 # '+' butonuna tıkla
                 add_module_clicked = self.appman_page.click_modulelistADD_button(self.test_app_name)
                 assert add_module_clicked, "'+' butonuna tıklanamadı"
 
-                time.sleep(1)
+                self.appman_page.wait_until_idle(1)
 
                 # Farklı dilde module name gir
                 module_name_entered = self.create_mdl_page.enter_modulename(module_name)
@@ -957,11 +952,11 @@ class TestAppManagement:
                         if add_clicked:
                             # SAVE butonuna tıkla
                             save_clicked = self.create_mdl_page.click_save_button()
-                            time.sleep(2)
+                            self.appman_page.wait_until_idle(2)
 
                             # Oluşturuldu mu kontrol et
-                            page_source = self.driver.page_source
-                            if module_name in page_source:
+                            content = self.appman_page.read_content()
+                            if content.has_row(module_name):
                                 print(f"{lang_name} karakterleri kabul edildi")
                             else:
                                 print(f"{lang_name} karakterleri reddedildi")
@@ -970,7 +965,7 @@ class TestAppManagement:
                 try:
                     cancel_button = self.driver.find_element(By.XPATH, "//span[text()='CANCEL']")
                     cancel_button.click()
-                    time.sleep(1)
+                    self.appman_page.wait_until_idle(1)
                 except:
                     pass
 
@@ -991,13 +986,13 @@ class TestAppManagement:
 
         # Module List sayfasına git
         self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # '+' butonuna tıkla
         add_module_clicked = self.appman_page.click_modulelistADD_button(self.test_app_name)
         assert add_module_clicked, "'+' butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # SQL injection payload
         sql_payload = "'; DROP TABLE modules; --"
@@ -1015,7 +1010,7 @@ class TestAppManagement:
 
         # SAVE butonuna tıkla
         save_clicked = self.create_mdl_page.click_save_button()
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # Sistem hala çalışıyor mu kontrol et
         new_test = self.appman_page.click_modulelistADD_button(self.test_app_name)
@@ -1032,34 +1027,16 @@ class TestAppManagement:
         app_created = self._create_test_app()
         assert app_created, "Test app oluşturulamadı"
 
-        # Module List sayfasına git ve module oluştur
-        self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(1)
-
-        # Önce bir module oluştur
-        add_module_clicked = self.appman_page.click_modulelistADD_button(self.test_app_name)
-        assert add_module_clicked, "'+' butonuna tıklanamadı"
-
-        module_name_entered = self.create_mdl_page.enter_modulename(self.test_module_name)
-        assert module_name_entered, "Module name girilemedi"
-
-        version_entered = self.create_mdl_page.enter_version(self.test_version)
-        assert version_entered, "Version girilemedi"
-
-        add_clicked = self.create_mdl_page.click_versionadd_button()
-        assert add_clicked, "ADD butonuna tıklanamadı"
-
-        save_clicked = self.create_mdl_page.click_save_button()
-        assert save_clicked, "SAVE butonuna tıklanamadı"
-
-        time.sleep(2)
+        # Module oluştur ve Module List sayfasına geç
+        module_created = self._create_test_module()
+        assert module_created, "Test module oluşturulamadı"
         print("Test module oluşturuldu")
 
         # Module edit butonuna tıkla
         edit_clicked = self.appman_page.click_editmodule_button(self.test_app_name, self.test_module_name)
         assert edit_clicked, "Module Edit butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.appman_page.wait_until_idle(1)
 
         # Yeni version ekle
         new_version_entered = self.create_mdl_page.enter_version(self.test_version_2)
@@ -1072,7 +1049,7 @@ class TestAppManagement:
         save_edit_clicked = self.create_mdl_page.click_save_button()
         assert save_edit_clicked, "Edit SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         print("Test başarılı: Module başarıyla düzenlendi ve yeni version eklendi")
 
@@ -1085,37 +1062,19 @@ class TestAppManagement:
         app_created = self._create_test_app()
         assert app_created, "Test app oluşturulamadı"
 
-        # Module List sayfasına git ve module oluştur
-        self.appman_page.click_modulelist_button(self.test_app_name)
-        time.sleep(1)
-
-        # Önce bir module oluştur
-        add_module_clicked = self.appman_page.click_modulelistADD_button(self.test_app_name)
-        assert add_module_clicked, "'+' butonuna tıklanamadı"
-
-        module_name_entered = self.create_mdl_page.enter_modulename(self.test_module_name)
-        assert module_name_entered, "Module name girilemedi"
-
-        version_entered = self.create_mdl_page.enter_version(self.test_version)
-        assert version_entered, "Version girilemedi"
-
-        add_clicked = self.create_mdl_page.click_versionadd_button()
-        assert add_clicked, "ADD butonuna tıklanamadı"
-
-        save_clicked = self.create_mdl_page.click_save_button()
-        assert save_clicked, "SAVE butonuna tıklanamadı"
-
-        time.sleep(2)
+        # Module oluştur ve Module List sayfasına geç
+        module_created = self._create_test_module()
+        assert module_created, "Test module oluşturulamadı"
 
         # Module'ü sil
         delete_success = self.appman_page.click_deletemodule_andconfirm_button(self.test_app_name,
                                                                                self.test_module_name)
         assert delete_success, "Module silinemedi"
 
-        time.sleep(2)
+        self.appman_page.wait_until_idle(2)
 
         # Module silindiğini kontrol et
-        page_source = self.driver.page_source
-        assert self.test_module_name not in page_source, "Module silinemedi"
+        content = self.appman_page.read_content()
+        assert not content.has_row(self.test_module_name), "Module silinemedi"
 
         print("Test başarılı: Module başarıyla silindi")
\ No newline at end of file
@@ -0,0 +1,149 @@
+import json
+import os
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from tdm_automation.Pages.base_page import BasePage
+from tdm_automation.Pages.create_list_generator_page import CreateListGenerator
+from tdm_automation.Pages.create_synthetic_flow_page import CreateFlowPage
+from tdm_automation.Pages.list_table import ListTable
+from tdm_automation.Pages.synthetic_flow_edit_page import FlowEditPage
+from tdm_automation.Utils import data_files
+from tdm_automation.Utils.benchmark import Benchmark
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.mock_tdm import MockTdmServer
+
+
+# Headless Chrome ve ölçüm süresi gerektiği için normal koşuda çalışmaz:
+# BENCHMARK=true HEADLESS=true pytest tdm_automation/Tests/test_benchmark_primitives.py -s
+pytestmark = pytest.mark.skipif(os.getenv('BENCHMARK', 'false').lower() != 'true',
+                                reason="BENCHMARK=true ile çalışır (headless Chrome gerekir)")
+
+COUNTER_BUTTON = (By.ID, "counter-button")
+OPEN_MODAL_BUTTON = (By.ID, "open-modal")
+MODAL_CANCEL = (By.XPATH, "//div[contains(@class, 'ant-modal-footer')]//button[text()='CANCEL']")
+FORM_STATE = (By.ID, "form-state")
+UPLOADED_FILE = (By.CSS_SELECTOR, ".ant-upload-list-item-name")
+
+
+class TestPrimitiveBenchmarks:
+    """Page object primitive'lerinin yerel mock TDM sayfasında gecikme/throughput ölçümü"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.server = MockTdmServer().start()
+        cls.driver = DriverPool.instance().acquire()
+        cls.bench = Benchmark()
+
+    @classmethod
+    def teardown_class(cls):
+        previous = cls.bench.save()
+        print("\n" + cls.bench.table(previous))
+        DriverPool.instance().release(cls.driver)
+        cls.server.stop()
+
+    def setup_method(self, method):
+        self.driver.get(self.server.url())
+        self.page = BasePage(self.driver)
+        self.page.wait_until_idle()
+
+    def _form_state(self):
+        return json.loads(self.page.get_text(FORM_STATE) or "{}")
+
+    def test_TC161_find_element(self):
+        """TC161: find_element ve tıklanabilir element araması - element cache'li ve cache'siz"""
+        self.bench.measure("find_element", lambda: self.page.find_element(COUNTER_BUTTON) is not None,
+                           group="find")
+        self.bench.measure("clickable_element[cached]",
+                           lambda: self.page._clickable_element(COUNTER_BUTTON, {}) is not None, group="find")
+        self.bench.measure("clickable_element[uncached]",
+                           lambda: self.page._clickable_element(COUNTER_BUTTON, {}) is not None,
+                           setup=lambda: self.page._elements.invalidate(COUNTER_BUTTON), group="find")
+
+    def test_TC162_click_element(self):
+        """TC162: click_element - her tıklama sayacı bir artırır"""
+        result = self.bench.measure("click_element", lambda: self.page.click_element(COUNTER_BUTTON), group="click")
+        assert self.page.get_text((By.ID, "click-count")) == str(len(result.timings) + self.bench.warmup)
+
+    def test_TC163_click_and_wait_for_network(self):
+        """TC163: SAVE - tıklama + gecikmeli api isteğinin bitmesini bekleme"""
+        edit_page = FlowEditPage(self.driver)
+        self.bench.measure("click_and_wait_for_network", edit_page.click_save_button, rounds=5, group="click")
+
+    def test_TC164_enter_text(self):
+        """TC164: enter_text - controlled input'a metin girişi"""
+        flow_page = CreateFlowPage(self.driver)
+        self.bench.measure("enter_text[short]", lambda: flow_page.enter_flowname("FlowName_1"), group="input")
+        long_text = "x" * 5000
+        self.bench.measure("enter_text[5000 chars]", lambda: flow_page.enter_flowname(long_text), rounds=5,
+                           group="input")
+        assert self._form_state()["name"] == long_text
+        self.bench.measure("enter_text[5000 chars, keys]",
+                           lambda: flow_page.enter_text(flow_page.FLOWNAME_FIELD, long_text, fast=False),
+                           rounds=1, warmup=0, group="input")
+        assert self._form_state()["name"] == long_text
+
+    def test_TC165_overwrite_input_slowly(self):
+        """TC165: overwrite_input_slowly - Min Chars alanını sil ve yeniden yaz"""
+        edit_page = FlowEditPage(self.driver)
+        values = iter(range(10000, 100000))
+        self.bench.measure("overwrite_input_slowly", lambda: edit_page.stringgen_enter_minchar(str(next(values))),
+                           rounds=3, group="input")
+        assert self._form_state()["min_chars"].isdigit()
+
+    def test_TC166_select_dropdown_option(self):
+        """TC166: select_dropdown_option - küçük liste ve 1000 seçenekli virtual list"""
+        flow_page = CreateFlowPage(self.driver)
+        type_dropdown = (By.XPATH, "(//div[contains(@class, 'ant-select-selector')])[2]")
+        labels = iter(["Text", "Integer", "Decimal", "Boolean", "Date"] * 10)
+        self.bench.measure("select_dropdown_option[5 options]",
+                           lambda: flow_page.select_dropdown_option(type_dropdown, next(labels)), group="select")
+        envs = iter(f"Env {index}" for index in range(900, 1000))
+        self.bench.measure("select_dropdown_option[virtual 1000]", lambda: flow_page.select_env(next(envs)),
+                           group="select")
+        assert self._form_state()["env"].startswith("Env 9")
+
+    def test_TC167_modal_open_close(self):
+        """TC167: Modal açma + animasyon bitişi + CANCEL ile kapanma"""
+        def open_and_close():
+            return (self.page.click_element(OPEN_MODAL_BUTTON) and self.page.wait_for_modal_open()
+                    and self.page.click_element(MODAL_CANCEL) and self.page.wait_for_modal_closed())
+
+        self.bench.measure("modal_open_close", open_and_close, group="modal")
+
+    def test_TC168_table_row_actions(self):
+        """TC168: ListTable - görünür satırda buton tıklama ve sayfalar arası satır bulma"""
+        table = ListTable(self.driver)
+
+        def edit_row():
+            return (table.click_row_button("Case_0005", css_class="edit-btn") and self.page.wait_for_modal_open()
+                    and self.page.click_element(MODAL_CANCEL) and self.page.wait_for_modal_closed())
+
+        self.bench.measure("click_row_button", edit_row, group="table")
+
+        def reload():
+            self.driver.get(self.server.url())
+            table.invalidate()
+            self.page.wait_until_idle()
+
+        self.bench.measure("locate[search]", lambda: table.locate("Case_0095") is not None, setup=reload,
+                           rounds=5, group="table")
+
+    def test_TC169_upload_file(self):
+        """TC169: File input'a dosya gönderme"""
+        list_page = CreateListGenerator(self.driver)
+        file_path = data_files.registry().path("sample.csv")
+        self.bench.measure("upload_file", lambda: list_page.upload_file(file_path), group="upload")
+        assert self.page.get_text(UPLOADED_FILE) == "sample.csv"
+
+    def test_TC170_sql_editor(self):
+        """TC170: SQL editör - tek seferde içerik verme ve tuş tuş yazma"""
+        list_page = CreateListGenerator(self.driver)
+        long_query = "SELECT first_name FROM schema_1.table_1 WHERE " + " OR ".join(f"id = {i}" for i in range(100))
+        self.bench.measure("sql_editor.set_text[long query]", lambda: list_page.enter_sql_query(long_query),
+                           group="input")
+        assert list_page.get_sql_query() == long_query
+        self.bench.measure("sql_editor[keys]",
+                           lambda: list_page.enter_text(list_page.SQL_QUERY_TEXTAREA, long_query, fast=False),
+                           rounds=1, warmup=0, group="input")
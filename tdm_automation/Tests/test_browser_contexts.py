@@ -0,0 +1,108 @@
+import os
+import shutil
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from tdm_automation.Pages.base_page import BasePage
+from tdm_automation.Utils import browser_contexts
+from tdm_automation.Utils.browser_contexts import BrowserSession
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.driver_resolver import CHROME_BINARIES
+from tdm_automation.Utils.mock_tdm import MockTdmServer
+
+COUNTER_BUTTON = (By.ID, "counter-button")
+CLICK_COUNT = (By.ID, "click-count")
+
+# Host Chrome'u kendisi açar; Chrome kurulu değilse atlanır
+CHROME_AVAILABLE = any(shutil.which(binary) for binary in [os.getenv('CHROME_BINARY')] + CHROME_BINARIES if binary)
+
+
+@pytest.mark.skipif(not CHROME_AVAILABLE, reason="Chrome bulunamadı (context modu host Chrome gerektirir)")
+class TestBrowserContextMode:
+    """BROWSER_MODE=context: tek host Chrome'da havuzdan kiralanan izole context'ler"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.server = MockTdmServer().start()
+        # conftest context modunda host'u zaten açmışsa aynısı kullanılır
+        cls.address = browser_contexts.start_host()
+        cls.browser = BrowserSession(cls.address)
+        cls.pool = DriverPool(size=2, factory=browser_contexts.create_context_driver)
+
+    @classmethod
+    def teardown_class(cls):
+        # Host session sonunda DriverPool.shutdown ile kapanır
+        cls.pool.close()
+        cls.browser.close()
+        cls.server.stop()
+
+    def _contexts(self):
+        return set(self.browser.send("Target.getBrowserContexts")["browserContextIds"])
+
+    def test_TC175_contexts_share_one_browser(self):
+        """TC175: Havuzdaki iki driver aynı Chrome'da ayrı context'lerde çalışır ve page object'ler değişmeden çalışır"""
+        first, second = self.pool.acquire(), self.pool.acquire()
+        try:
+            assert first.context_id != second.context_id
+            assert {first.context_id, second.context_id} <= self._contexts(), "Context'ler host Chrome'da değil"
+
+            for driver in (first, second):
+                driver.get(self.server.url())
+                page = BasePage(driver)
+                assert page.click_element(COUNTER_BUTTON), "Context sekmesinde tıklanamadı"
+                assert page.get_text(CLICK_COUNT) == "1"
+        finally:
+            self.pool.release(first)
+            self.pool.release(second)
+
+    def test_TC176_contexts_do_not_share_state(self):
+        """TC176: Bir context'teki cookie ve localStorage diğerinden görünmez"""
+        first, second = self.pool.acquire(), self.pool.acquire()
+        try:
+            for driver in (first, second):
+                driver.get(self.server.url())
+            first.add_cookie({"name": "tdm_session", "value": "first"})
+            first.execute_script("window.localStorage.setItem('tdm', 'first');")
+
+            assert first.get_cookie("tdm_session")["value"] == "first"
+            assert second.get_cookie("tdm_session") is None, "Cookie context'ler arasında paylaşıldı"
+            assert second.execute_script("return window.localStorage.getItem('tdm');") is None, \
+                "localStorage context'ler arasında paylaşıldı"
+        finally:
+            self.pool.release(first)
+            self.pool.release(second)
+
+    def test_TC177_release_replaces_context(self):
+        """TC177: İade edilen driver'ın context'i kapatılır, yeni kiralamada temiz context gelir"""
+        driver = self.pool.acquire()
+        driver.get(self.server.url())
+        driver.add_cookie({"name": "tdm_session", "value": "leased"})
+        previous = driver.context_id
+        self.pool.release(driver)
+
+        driver = self.pool.acquire()
+        try:
+            assert driver.context_id != previous
+            assert previous not in self._contexts(), "Eski context kapatılmadı"
+            driver.get(self.server.url())
+            assert driver.get_cookie("tdm_session") is None, "Reset sonrası cookie kaldı"
+        finally:
+            self.pool.release(driver)
+
+    def test_TC179_window_handles_limited_to_own_context(self):
+        """TC179: window_handles sadece driver'ın kendi context'indeki sekmeleri listeler"""
+        first, second = self.pool.acquire(), self.pool.acquire()
+        try:
+            assert first.window_handles == [first.target_id], "Diğer context'lerin sekmeleri listelendi"
+            assert second.window_handles == [second.target_id], "Diğer context'lerin sekmeleri listelendi"
+
+            # Sayfanın açtığı popup aynı context'te kalır
+            first.get(self.server.url())
+            first.execute_script("window.open('about:blank');")
+            handles = first.window_handles
+            assert len(handles) == 2 and first.target_id in handles, f"Popup listelenmedi: {handles}"
+            assert second.window_handles == [second.target_id]
+        finally:
+            self.pool.release(first)
+            self.pool.release(second)
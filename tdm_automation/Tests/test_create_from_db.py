@@ -1,20 +1,18 @@
-import time
 import pytest
 import os
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 from tdm_automation.Pages.login_page import LoginPage
 from tdm_automation.Pages.tdm_dashboard_page import TDMDashboardPage
 from tdm_automation.Pages.list_generator_page import ListGeneratorPage
 from tdm_automation.Pages.create_list_generator_page import CreateListGenerator
-from selenium.webdriver.chrome.options import Options
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.namespace import unique_name
+from tdm_automation.Utils.session_cache import SessionCache
 
 load_dotenv()
 
 
+@pytest.mark.tdm
 class TestCreateFromDbTab:
 
     @classmethod
@@ -31,40 +29,8 @@ class TestCreateFromDbTab:
         # Test data environment değişkenleri
         cls.TEST_LIST_NAME = os.getenv('TEST_LIST_NAME', 'ListName')
 
-        # Environment değişkenlerini al
-        cls.HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
-        cls.DOCKER_MODE = os.getenv('DOCKER_MODE', 'false').lower() == 'true'
-
-        # Chrome options - Docker ve headless için optimize edilmiş
-        cls.chrome_options = Options()
-
-        if cls.HEADLESS:
-            cls.chrome_options.add_argument("--headless")
-            print("HEADLESS modda çalışıyor")
-
-        if cls.DOCKER_MODE:
-            # Docker için gerekli argumentlar
-            cls.chrome_options.add_argument("--no-sandbox")
-            cls.chrome_options.add_argument("--disable-dev-shm-usage")
-            cls.chrome_options.add_argument("--disable-gpu")
-            cls.chrome_options.add_argument("--remote-debugging-port=9222")
-            cls.chrome_options.add_argument("--incognito")
-
-            print("DOCKER modda çalışıyor")
-        else:
-            # Local development için
-            cls.chrome_options.add_argument("--incognito")
-
-        # Genel performans ayarları
-        cls.chrome_options.add_argument("--window-size=1920,1080")
-        cls.chrome_options.add_argument("--disable-web-security")
-        cls.chrome_options.add_argument("--ignore-certificate-errors")
-        cls.chrome_options.add_argument("--incognito")
-
-        # WebDriver kurulumu
-        cls.service = Service(ChromeDriverManager().install())
-        cls.driver = webdriver.Chrome(service=cls.service, options=cls.chrome_options)
-        cls.driver.maximize_window()
+        # WebDriver havuzdan kiralanır (session boyunca açık kalır)
+        cls.driver = DriverPool.instance().acquire()
 
         # Page object'leri oluştur
         cls.login_page = LoginPage(cls.driver)
@@ -73,14 +39,10 @@ class TestCreateFromDbTab:
         cls.create_lg_page = CreateListGenerator(cls.driver)
 
         # *** TEK SEFERLİK LOGIN İŞLEMLERİ ***
-        cls.driver.get(cls.BASE_URL)
-        login_success = cls.login_page.do_login(cls.VALID_USERNAME, cls.VALID_PASSWORD)
-        assert login_success, "Login başarısız!"
-
-        # TDM'ye git
-        tdm_locator = (By.XPATH, "//li[@title='New Test Data Manager'][2]")
-        tdm_success = cls.login_page.click_element(tdm_locator)
-        assert tdm_success, "TDM elementine tıklanamadı"
+        # Cache'te geçerli oturum varsa enjekte edilir, yoksa UI'dan login olunur
+        session_cache = SessionCache(cls.VALID_USERNAME, cls.VALID_PASSWORD, cls.BASE_URL)
+        tdm_success = session_cache.open_tdm(cls.driver)
+        assert tdm_success, "TDM oturumu açılamadı"
 
         # List Generator'e git
         listgen_success = cls.dashboard_page.click_list_generator()
@@ -91,24 +53,23 @@ class TestCreateFromDbTab:
     @classmethod
     def teardown_class(cls):
         """Tüm testler bitince tek sefer çalışır"""
-        print("\n=== CLASS TEARDOWN: Driver kapatılıyor ===")
+        print("\n=== CLASS TEARDOWN: Driver havuza iade ediliyor ===")
         if hasattr(cls, 'driver'):
-            cls.driver.quit()
+            DriverPool.instance().release(cls.driver)
 
     def setup_method(self, method):
         """Her test öncesi çalışır - SADECE TEST-SPECIFIC SETUP"""
         print(f"\n--- Test başlıyor: {method.__name__} ---")
 
         # Test data - her test için unique değerler
-        timestamp = int(time.time())
-        self.test_list_name = f"{self.TEST_LIST_NAME}_{timestamp}"
+        self.test_list_name = unique_name(self.TEST_LIST_NAME)
 
         # List Generator sayfasında olduğumuzu kontrol et
         current_url = self.driver.current_url
         if "list-generator" not in current_url:
             print("List Generator sayfasına yönlendiriliyor...")
             self.dashboard_page.click_list_generator()
-            time.sleep(1)
+            self.create_lg_page.wait_until_idle(1)
 
     def teardown_method(self, method):
         """Her test sonrası çalışır - SADECE TEST CLEANUP"""
@@ -116,11 +77,7 @@ class TestCreateFromDbTab:
 
         # Modal varsa kapat
         try:
-            cancel_buttons = self.driver.find_elements(By.XPATH, "//span[text()='CANCEL']")
-            for button in cancel_buttons:
-                if button.is_displayed():
-                    button.click()
-                    time.sleep(0.5)
+            self.create_lg_page.dismiss_dialogs(("CANCEL",))
         except:
             pass
 
@@ -133,11 +90,12 @@ class TestCreateFromDbTab:
     def _cleanup_test_data(self):
         """Test verilerini temizle"""
         try:
-            # Oluşturulan liste'yi sil
-            page_source = self.driver.page_source
-            if hasattr(self, 'test_list_name') and self.test_list_name in page_source:
+            # Oluşturulan liste'yi sil (hangi sayfada olursa olsun)
+            table = self.listgen_page.table
+            if hasattr(self, 'test_list_name') and table.contains(self.test_list_name):
                 self.listgen_page.click_deletelist_andconfirm_button(self.test_list_name)
-                time.sleep(1)
+                self.create_lg_page.wait_until_idle(1)
+            table.clear_search()
         except:
             pass
 
@@ -147,11 +105,11 @@ class TestCreateFromDbTab:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         print("Name field boş bırakılıyor")
 
@@ -164,7 +122,6 @@ class TestCreateFromDbTab:
 
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         # SAVE button disabled olmalı (name boş olduğu için)
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
@@ -181,12 +138,12 @@ class TestCreateFromDbTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From DB tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -205,7 +162,6 @@ class TestCreateFromDbTab:
         # VALIDATE butonuna tıkla
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         # SAVE button disabled olmalı (environment seçilmedi)
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
@@ -222,12 +178,12 @@ class TestCreateFromDbTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From DB tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -245,7 +201,6 @@ class TestCreateFromDbTab:
         # VALIDATE butonuna tıkla
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         # SAVE button disabled olmalı (SQL query boş)
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
@@ -262,12 +217,12 @@ class TestCreateFromDbTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From DB tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -288,7 +243,6 @@ class TestCreateFromDbTab:
         # VALIDATE butonuna tıkla
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         # SAVE button aktif olmalı
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
@@ -298,7 +252,6 @@ class TestCreateFromDbTab:
         # SAVE butonuna bas
         save_clicked = self.create_lg_page.click_save_button_db_ai()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
         print("SAVE butonuna tıklandı")
 
         # Liste oluşturuldu mu kontrol et (modal kapandı mı?)
@@ -317,12 +270,12 @@ class TestCreateFromDbTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From DB tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -343,7 +296,6 @@ class TestCreateFromDbTab:
         # VALIDATE butonuna tıkla
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         # SAVE button disabled olmalı (çoklu sütun reddedildi)
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
@@ -360,12 +312,12 @@ class TestCreateFromDbTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From DB tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -386,7 +338,6 @@ class TestCreateFromDbTab:
         # VALIDATE butonuna tıkla
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         # SAVE button disabled olmalı (INSERT sorgusu reddedildi)
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
@@ -403,12 +354,12 @@ class TestCreateFromDbTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From DB tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -429,7 +380,6 @@ class TestCreateFromDbTab:
         # VALIDATE butonuna tıkla
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         # SAVE button disabled olmalı (DROP sorgusu reddedildi)
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
@@ -445,11 +395,11 @@ class TestCreateFromDbTab:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -465,7 +415,6 @@ class TestCreateFromDbTab:
 
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
         print(f"SAVE butonu durumu: {'Aktif' if save_enabled else 'Disabled'}")
@@ -480,11 +429,11 @@ class TestCreateFromDbTab:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -500,7 +449,6 @@ class TestCreateFromDbTab:
 
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
         print(f"SAVE butonu durumu: {'Aktif' if save_enabled else 'Disabled'}")
@@ -516,11 +464,11 @@ class TestCreateFromDbTab:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -536,7 +484,6 @@ class TestCreateFromDbTab:
 
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
         print(f"SAVE butonu durumu: {'Aktif' if save_enabled else 'Disabled'}")
@@ -552,11 +499,11 @@ class TestCreateFromDbTab:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -572,7 +519,6 @@ class TestCreateFromDbTab:
 
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
         print(f"SAVE butonu durumu: {'Aktif' if save_enabled else 'Disabled'}")
@@ -587,11 +533,11 @@ class TestCreateFromDbTab:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -609,7 +555,6 @@ class TestCreateFromDbTab:
 
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
         print(f"SAVE butonu durumu: {'Aktif' if save_enabled else 'Disabled'}")
@@ -618,7 +563,6 @@ class TestCreateFromDbTab:
             print("Uzun query kabul edildi - SAVE basılıyor")
             save_clicked = self.create_lg_page.click_save_button_db_ai()
             assert save_clicked, "SAVE butonuna tıklanamadı"
-            time.sleep(2)
 
             # Sonucu kontrol et
             current_url = self.driver.current_url
@@ -637,11 +581,11 @@ class TestCreateFromDbTab:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -657,7 +601,6 @@ class TestCreateFromDbTab:
 
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
         print(f"SAVE butonu durumu: {'Aktif' if save_enabled else 'Disabled'}")
@@ -666,7 +609,6 @@ class TestCreateFromDbTab:
             print("WHERE condition kabul edildi - SAVE basılıyor")
             save_clicked = self.create_lg_page.click_save_button_db_ai()
             assert save_clicked, "SAVE butonuna tıklanamadı"
-            time.sleep(2)
 
             current_url = self.driver.current_url
             if "create" not in current_url:
@@ -682,11 +624,11 @@ class TestCreateFromDbTab:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -702,7 +644,6 @@ class TestCreateFromDbTab:
 
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
         print(f"SAVE butonu durumu: {'Aktif' if save_enabled else 'Disabled'}")
@@ -711,7 +652,6 @@ class TestCreateFromDbTab:
             print("ORDER BY kabul edildi - SAVE basılıyor")
             save_clicked = self.create_lg_page.click_save_button_db_ai()
             assert save_clicked, "SAVE butonuna tıklanamadı"
-            time.sleep(2)
 
             current_url = self.driver.current_url
             if "create" not in current_url:
@@ -727,11 +667,11 @@ class TestCreateFromDbTab:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked, "Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -747,7 +687,6 @@ class TestCreateFromDbTab:
 
         validate_clicked = self.create_lg_page.click_validate_button()
         assert validate_clicked, "VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
 
         save_enabled = self.create_lg_page.is_save_button_enabled_db_ai()
         print(f"SAVE butonu durumu: {'Aktif' if save_enabled else 'Disabled'}")
@@ -756,7 +695,6 @@ class TestCreateFromDbTab:
             print("LIMIT kabul edildi - SAVE basılıyor")
             save_clicked = self.create_lg_page.click_save_button_db_ai()
             assert save_clicked, "SAVE butonuna tıklanamadı"
-            time.sleep(2)
 
             current_url = self.driver.current_url
             if "create" not in current_url:
@@ -774,14 +712,14 @@ class TestCreateFromDbTab:
         print("İlk liste oluşturuluyor...")
         new_clicked1 = self.listgen_page.click_newlist()
         assert new_clicked1, "İlk NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked1 = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked1, "İlk Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Aynı name'i kullan
-        duplicate_name = f"DuplicateDBTest_{int(time.time())}"
+        duplicate_name = unique_name("DuplicateDBTest")
         name_entered1 = self.create_lg_page.enter_name(duplicate_name)
         assert name_entered1, "İlk name girilemedi"
 
@@ -794,12 +732,12 @@ class TestCreateFromDbTab:
 
         validate_clicked1 = self.create_lg_page.click_validate_button()
         assert validate_clicked1, "İlk VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
+        self.create_lg_page.wait_until_idle(3)
 
         save_enabled1 = self.create_lg_page.is_save_button_enabled_db_ai()
         if save_enabled1:
             save_clicked1 = self.create_lg_page.click_save_button_db_ai()
-            time.sleep(2)
+            self.create_lg_page.wait_until_idle(2)
             print(f"İlk liste '{duplicate_name}' oluşturuldu")
         else:
             print("İlk liste oluşturulamadı - test iptal")
@@ -809,11 +747,11 @@ class TestCreateFromDbTab:
         print("İkinci liste aynı isimle oluşturuluyor...")
         new_clicked2 = self.listgen_page.click_newlist()
         assert new_clicked2, "İkinci NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked2 = self.create_lg_page.click_create_from_db_tab()
         assert tab_clicked2, "İkinci Create From DB tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Aynı name gir
         name_entered2 = self.create_lg_page.enter_name(duplicate_name)
@@ -828,12 +766,12 @@ class TestCreateFromDbTab:
 
         validate_clicked2 = self.create_lg_page.click_validate_button()
         assert validate_clicked2, "İkinci VALIDATE butonuna tıklanamadı"
-        time.sleep(3)
+        self.create_lg_page.wait_until_idle(3)
 
         save_enabled2 = self.create_lg_page.is_save_button_enabled_db_ai()
         if save_enabled2:
             save_clicked2 = self.create_lg_page.click_save_button_db_ai()
-            time.sleep(2)
+            self.create_lg_page.wait_until_idle(2)
 
             # Duplicate name error kontrol et
             page_source = self.driver.page_source
@@ -1,20 +1,19 @@
-import time
 import pytest
 import os
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 from tdm_automation.Pages.login_page import LoginPage
 from tdm_automation.Pages.tdm_dashboard_page import TDMDashboardPage
 from tdm_automation.Pages.list_generator_page import ListGeneratorPage
 from tdm_automation.Pages.create_list_generator_page import CreateListGenerator
-from selenium.webdriver.chrome.options import Options
+from tdm_automation.Utils import data_files
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.namespace import unique_name
+from tdm_automation.Utils.session_cache import SessionCache
 
 load_dotenv()
 
 
+@pytest.mark.tdm
 class TestCreateFromFileTab:
 
     @classmethod
@@ -31,39 +30,8 @@ class TestCreateFromFileTab:
         # Test data environment değişkenleri
         cls.TEST_LIST_NAME = os.getenv('TEST_LIST_NAME', 'ListName')
 
-        # Environment değişkenlerini al
-        cls.HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
-        cls.DOCKER_MODE = os.getenv('DOCKER_MODE', 'false').lower() == 'true'
-
-        # Chrome options - Docker ve headless için optimize edilmiş
-        cls.chrome_options = Options()
-
-        if cls.HEADLESS:
-            cls.chrome_options.add_argument("--headless")
-            print("HEADLESS modda çalışıyor")
-
-        if cls.DOCKER_MODE:
-            # Docker için gerekli argumentlar
-            cls.chrome_options.add_argument("--no-sandbox")
-            cls.chrome_options.add_argument("--disable-dev-shm-usage")
-            cls.chrome_options.add_argument("--disable-gpu")
-            cls.chrome_options.add_argument("--remote-debugging-port=9222")
-            cls.chrome_options.add_argument("--incognito")
-
-            print("DOCKER modda çalışıyor")
-        else:
-            # Local development için
-            cls.chrome_options.add_argument("--incognito")
-
-        # Genel performans ayarları
-        cls.chrome_options.add_argument("--window-size=1920,1080")
-        cls.chrome_options.add_argument("--disable-web-security")
-        cls.chrome_options.add_argument("--ignore-certificate-errors")
-
-        # WebDriver kurulumu
-        cls.service = Service(ChromeDriverManager().install())
-        cls.driver = webdriver.Chrome(service=cls.service, options=cls.chrome_options)
-        cls.driver.maximize_window()
+        # WebDriver havuzdan kiralanır (session boyunca açık kalır)
+        cls.driver = DriverPool.instance().acquire()
 
         # Page object'leri oluştur
         cls.login_page = LoginPage(cls.driver)
@@ -71,15 +39,14 @@ class TestCreateFromFileTab:
         cls.listgen_page = ListGeneratorPage(cls.driver)
         cls.create_lg_page = CreateListGenerator(cls.driver)
 
-        # *** TEK SEFERLİK LOGIN İŞLEMLERİ ***
-        cls.driver.get(cls.BASE_URL)
-        login_success = cls.login_page.do_login(cls.VALID_USERNAME, cls.VALID_PASSWORD)
-        assert login_success, "Login başarısız!"
+        # Upload dosyaları spec'ten session başına bir kez üretilir
+        cls.data_files = data_files.registry()
 
-        # TDM'ye git
-        tdm_locator = (By.XPATH, "//li[@title='New Test Data Manager'][2]")
-        tdm_success = cls.login_page.click_element(tdm_locator)
-        assert tdm_success, "TDM elementine tıklanamadı"
+        # *** TEK SEFERLİK LOGIN İŞLEMLERİ ***
+        # Cache'te geçerli oturum varsa enjekte edilir, yoksa UI'dan login olunur
+        session_cache = SessionCache(cls.VALID_USERNAME, cls.VALID_PASSWORD, cls.BASE_URL)
+        tdm_success = session_cache.open_tdm(cls.driver)
+        assert tdm_success, "TDM oturumu açılamadı"
 
         # List Generator'e git
         listgen_success = cls.dashboard_page.click_list_generator()
@@ -90,24 +57,23 @@ class TestCreateFromFileTab:
     @classmethod
     def teardown_class(cls):
         """Tüm testler bitince tek sefer çalışır"""
-        print("\n=== CLASS TEARDOWN: Driver kapatılıyor ===")
+        print("\n=== CLASS TEARDOWN: Driver havuza iade ediliyor ===")
         if hasattr(cls, 'driver'):
-            cls.driver.quit()
+            DriverPool.instance().release(cls.driver)
 
     def setup_method(self, method):
         """Her test öncesi çalışır - SADECE TEST-SPECIFIC SETUP"""
         print(f"\n--- Test başlıyor: {method.__name__} ---")
 
         # Test data - her test için unique değerler
-        timestamp = int(time.time())
-        self.test_list_name = f"{self.TEST_LIST_NAME}_{timestamp}"
+        self.test_list_name = unique_name(self.TEST_LIST_NAME)
 
         # List Generator sayfasında olduğumuzu kontrol et
         current_url = self.driver.current_url
         if "list-generator" not in current_url:
             print("List Generator sayfasına yönlendiriliyor...")
             self.dashboard_page.click_list_generator()
-            time.sleep(1)
+            self.create_lg_page.wait_until_idle(1)
 
     def teardown_method(self, method):
         """Her test sonrası çalışır - SADECE TEST CLEANUP"""
@@ -115,11 +81,7 @@ class TestCreateFromFileTab:
 
         # Modal varsa kapat
         try:
-            cancel_buttons = self.driver.find_elements(By.XPATH, "//span[text()='CANCEL']")
-            for button in cancel_buttons:
-                if button.is_displayed():
-                    button.click()
-                    time.sleep(0.5)
+            self.create_lg_page.dismiss_dialogs(("CANCEL",))
         except:
             pass
 
@@ -129,14 +91,19 @@ class TestCreateFromFileTab:
         except:
             pass  # Cleanup başarısız olsa da test devam etsin
 
+    def _upload_test_file(self, name):
+        """Registry'deki test dosyasını (gerekiyorsa üreterek) upload et"""
+        return self.create_lg_page.upload_file(self.data_files.path(name))
+
     def _cleanup_test_data(self):
         """Test verilerini temizle"""
         try:
-            # Oluşturulan liste'yi sil
-            page_source = self.driver.page_source
-            if hasattr(self, 'test_list_name') and self.test_list_name in page_source:
+            # Oluşturulan liste'yi sil (hangi sayfada olursa olsun)
+            table = self.listgen_page.table
+            if hasattr(self, 'test_list_name') and table.contains(self.test_list_name):
                 self.listgen_page.click_deletelist_andconfirm_button(self.test_list_name)
-                time.sleep(1)
+                self.create_lg_page.wait_until_idle(1)
+            table.clear_search()
         except:
             pass
 
@@ -147,21 +114,15 @@ class TestCreateFromFileTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Test dosyası oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "sample.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write("value1,value2,value3\ntest1,test2,test3")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("sample.csv")
         assert file_uploaded, "Dosya upload edilemedi"
         print("Dosya upload edildi")
 
@@ -173,15 +134,14 @@ class TestCreateFromFileTab:
         # Separator seçmeden SAVE'e tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Modal hala açık mı kontrol et (error varsa açık kalır)
-        page_source = self.driver.page_source
-        modal_still_open = "modal" in page_source.lower() or "Create From File" in page_source
+        content = self.create_lg_page.read_content()
+        modal_still_open = content.modal_open or content.contains("Create From File")
         assert modal_still_open, "Modal kapanmamalıydı (separator error)"
 
         # Error mesajı var mı kontrol et
-        error_found = "error" in page_source.lower() or "separator" in page_source.lower() or "required" in page_source.lower()
+        error_found = content.mentions("error", "separator", "required")
         assert error_found, "Separator error mesajı görünmeli"
 
         print("Test başarılı: Separator seçmeden SAVE aktif ama error alıyor, modal açık kalıyor")
@@ -193,25 +153,15 @@ class TestCreateFromFileTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Comma separated CSV dosyası oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "comma_separated.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        csv_content = "List_Name,List_Age,List_City\nList_Ahmet,25,Istanbul\nList_Mehmet,30,Ankara"
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("Comma separated CSV dosyası oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("comma_separated.csv")
         assert file_uploaded, "CSV dosyası upload edilemedi"
         print("CSV dosyası upload edildi")
 
@@ -223,11 +173,10 @@ class TestCreateFromFileTab:
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Backend service durumunu kontrol et
-        page_source = self.driver.page_source
-        service_error = "service is currently unavailable" in page_source.lower() or "docker" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        service_error = content.mentions("service is currently unavailable", "docker")
 
         if service_error:
             print("Backend service unavailable - Docker container problemi")
@@ -243,25 +192,15 @@ class TestCreateFromFileTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Tab separated CSV oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "tab_separated.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        csv_content = "List_Name\tList_Age\tList_City\nList_Ahmet\t25\tIstanbul\nList_Mehmet\t30\tAnkara"
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("Tab separated CSV dosyası oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("tab_separated.csv")
         assert file_uploaded, "CSV dosyası upload edilemedi"
         print("CSV dosyası upload edildi")
 
@@ -273,11 +212,10 @@ class TestCreateFromFileTab:
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Backend service durumunu kontrol et
-        page_source = self.driver.page_source
-        service_error = "service is currently unavailable" in page_source.lower() or "docker" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        service_error = content.mentions("service is currently unavailable", "docker")
 
         if service_error:
             print("Backend service unavailable - Docker container problemi")
@@ -293,25 +231,15 @@ class TestCreateFromFileTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Semicolon separated CSV oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "semicolon_separated.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        csv_content = "List_Name;List_Age;List_City\nList_Ahmet;25;Istanbul\nList_Mehmet;30;Ankara"
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("Semicolon separated CSV dosyası oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("semicolon_separated.csv")
         assert file_uploaded, "CSV dosyası upload edilemedi"
         print("CSV dosyası upload edildi")
 
@@ -323,11 +251,10 @@ class TestCreateFromFileTab:
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Backend service durumunu kontrol et
-        page_source = self.driver.page_source
-        service_error = "service is currently unavailable" in page_source.lower() or "docker" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        service_error = content.mentions("service is currently unavailable", "docker")
 
         if service_error:
             print("Backend service unavailable - Docker container problemi")
@@ -343,25 +270,15 @@ class TestCreateFromFileTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Space separated CSV oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "space_separated.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        csv_content = "List_Name List_Age List_City\nList_Ahmet 25 Istanbul\nList_Mehmet 30 Ankara"
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("Space separated CSV dosyası oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("space_separated.csv")
         assert file_uploaded, "CSV dosyası upload edilemedi"
         print("CSV dosyası upload edildi")
 
@@ -373,11 +290,10 @@ class TestCreateFromFileTab:
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Backend service durumunu kontrol et
-        page_source = self.driver.page_source
-        service_error = "service is currently unavailable" in page_source.lower() or "docker" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        service_error = content.mentions("service is currently unavailable", "docker")
 
         if service_error:
             print("Backend service unavailable - Docker container problemi")
@@ -393,25 +309,15 @@ class TestCreateFromFileTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Pipe separated CSV oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "pipe_separated.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        csv_content = "List_Name|List_Age|List_City\nList_Ahmet|25|Istanbul\nList_Mehmet|30|Ankara"
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("Pipe separated CSV dosyası oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("pipe_separated.csv")
         assert file_uploaded, "CSV dosyası upload edilemedi"
         print("CSV dosyası upload edildi")
 
@@ -423,11 +329,10 @@ class TestCreateFromFileTab:
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Backend service durumunu kontrol et
-        page_source = self.driver.page_source
-        service_error = "service is currently unavailable" in page_source.lower() or "docker" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        service_error = content.mentions("service is currently unavailable", "docker")
 
         if service_error:
             print("Backend service unavailable - Docker container problemi")
@@ -443,25 +348,15 @@ class TestCreateFromFileTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Colon separated CSV oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "colon_separated.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        csv_content = "List_Name:List_Age:List_City\nList_Ahmet:25:Istanbul\nList_Mehmet:30:Ankara"
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("Colon separated CSV dosyası oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("colon_separated.csv")
         assert file_uploaded, "CSV dosyası upload edilemedi"
         print("CSV dosyası upload edildi")
 
@@ -473,11 +368,10 @@ class TestCreateFromFileTab:
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Backend service durumunu kontrol et
-        page_source = self.driver.page_source
-        service_error = "service is currently unavailable" in page_source.lower() or "docker" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        service_error = content.mentions("service is currently unavailable", "docker")
 
         if service_error:
             print("Backend service unavailable - Docker container problemi")
@@ -493,25 +387,15 @@ class TestCreateFromFileTab:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Boş CSV dosyası oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "empty_file.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        # Tamamen boş dosya
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write("")  # Hiçbir şey yazma
-
-        print("Boş CSV dosyası oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("empty_file.csv")
         assert file_uploaded, "Boş dosya upload edilemedi"
         print("Boş dosya upload edildi")
 
@@ -522,12 +406,11 @@ class TestCreateFromFileTab:
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Error kontrolü (boş dosya hatası bekleniyor)
-        page_source = self.driver.page_source
-        empty_file_error = "empty" in page_source.lower() or "no data" in page_source.lower()
-        service_error = "service is currently unavailable" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        empty_file_error = content.mentions("empty", "no data")
+        service_error = content.mentions("service is currently unavailable")
 
         if service_error:
             print("Backend service unavailable")
@@ -544,34 +427,25 @@ class TestCreateFromFileTab:
         print("\nTC066: Geçersiz dosya formatı testi ===")
 
 
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # .txt dosyası oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "invalid_format.txt")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write("List_Name,List_Age\nAhmet,25")
-
-        print("TXT dosyası oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
-        time.sleep(2)
+        file_uploaded = self._upload_test_file("invalid_format.txt")
+        self.create_lg_page.wait_until_idle(2)
 
         # File format error kontrolü
-        page_source = self.driver.page_source
-        format_error = "YouCanOnlyUploadCSVFile" in page_source or "csv" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        format_error = content.mentions("YouCanOnlyUploadCSVFile", "csv")
 
         if format_error:
             print("File format error alındı - sadece CSV kabul ediyor")
@@ -585,32 +459,20 @@ class TestCreateFromFileTab:
         """TC067: Veride özel karakterler - CSV'de özel karakterler ve unicode"""
         print("\nTC067: Veride özel karakterler testi ===")
 
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Özel karakterli CSV oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "special_chars.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        # Özel karakterler: Unicode, emoji, semboller
-        csv_content = "List_Name,List_Symbol,List_Unicode\nList_Açelya,List_@#$%,List_测试\nList_Müge,List_€£¥,List_🚀🎯"
-
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("Özel karakterli CSV oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("special_chars.csv")
         assert file_uploaded, "Özel karakterli dosya upload edilemedi"
 
         # Separator: Comma seç
@@ -620,11 +482,10 @@ class TestCreateFromFileTab:
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Sonuç kontrolü
-        page_source = self.driver.page_source
-        service_error = "service is currently unavailable" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        service_error = content.mentions("service is currently unavailable")
 
         if service_error:
             print("Backend service unavailable")
@@ -637,35 +498,21 @@ class TestCreateFromFileTab:
         """TC068: CSV'de tırnak işaretleri - Escaped quotes ve complex data"""
         print("\nTC068: CSV'de tırnak işaretleri testi ===")
 
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
 
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Tırnak işaretli CSV oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "quotes_csv.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        # Karmaşık tırnak kullanımı
-        csv_content = '''List_Name,List_Description,List_Quote
-"List_Ahmet","List_Developer, Senior","List_He said ""Hello World"""
-"List_Ayşe","List_Manager, Team Lead","List_She said 'Good morning'"'''
-
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("Tırnak işaretli CSV oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("quotes_csv.csv")
         assert file_uploaded, "Tırnak işaretli dosya upload edilemedi"
 
         # Separator: Comma seç
@@ -675,7 +522,6 @@ class TestCreateFromFileTab:
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         print("Test tamamlandı: Tırnak işaretleri testi")
 
@@ -683,35 +529,21 @@ class TestCreateFromFileTab:
         """TC069: Karışık veri tipleri - String, Number, Date, Boolean mix"""
         print("\nTC069: Karışık veri tipleri testi ===")
 
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
 
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Karışık veri tipli CSV oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "mixed_types.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        csv_content = """List_Name,List_Age,List_Salary,List_Date,List_Active,List_Score
-List_Ahmet,25,50000.75,2023-01-15,true,95.5
-List_Ayşe,thirty,invalid_salary,invalid_date,maybe,not_number
-List_Mehmet,-5,0,1900-01-01,false,100.0"""
-
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("Karışık veri tipli CSV oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("mixed_types.csv")
         assert file_uploaded, "Karışık tipli dosya upload edilemedi"
 
         # Separator: Comma seç
@@ -721,7 +553,6 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         print("Test tamamlandı: Karışık veri tipleri testi")
 
@@ -730,47 +561,34 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
         """TC070: Çoklu dosya yükleme denemesi - Sistem sadece tek dosya kabul ediyor mu"""
         print("\nTC070: Çoklu dosya yükleme denemesi testi ===")
 
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
 
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # İki farklı CSV dosyası oluştur
-        test_file1_path = os.path.join(os.getcwd(), "test_data", "file1.csv")
-        test_file2_path = os.path.join(os.getcwd(), "test_data", "file2.csv")
-        os.makedirs(os.path.dirname(test_file1_path), exist_ok=True)
-
-        with open(test_file1_path, 'w', encoding='utf-8') as f:
-            f.write("List_Name,List_Age\nList_File1,25")
-
-        with open(test_file2_path, 'w', encoding='utf-8') as f:
-            f.write("List_Name,List_City\nList_File2,Istanbul")
-
-        print("İki farklı CSV dosyası oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # İlk dosyayı upload et
-        file1_uploaded = self.create_lg_page.upload_file(test_file1_path)
+        file1_uploaded = self._upload_test_file("file1.csv")
         assert file1_uploaded, "İlk dosya upload edilemedi"
         print("İlk dosya upload edildi")
 
         # İkinci dosyayı upload etmeye çalış (öncekinin üzerine yazmalı)
-        file2_uploaded = self.create_lg_page.upload_file(test_file2_path)
-        time.sleep(2)
+        file2_uploaded = self._upload_test_file("file2.csv")
+        self.create_lg_page.wait_until_idle(2)
         print("İkinci dosya upload edilmeye çalışıldı")
 
         # Hangi dosyanın kaldığını kontrol et
-        page_source = self.driver.page_source
-        if "file1" in page_source:
+        content = self.create_lg_page.read_content()
+        if content.contains("file1"):
             print("İlk dosya kaldı")
-        elif "file2" in page_source:
+        elif content.contains("file2"):
             print("İkinci dosya öncekinin yerine geçti")
         else:
             print("Dosya durumu belirsiz")
@@ -786,12 +604,12 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Download butonunun varlığını kontrol et
         try:
@@ -804,7 +622,7 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
                 download_clicked = self.create_lg_page.click_download_sample()
                 assert download_clicked, "Sample download butonuna tıklanamadı"
                 print("Sample file download butonuna tıklandı")
-                time.sleep(3)  # Download için bekle
+                self.create_lg_page.wait_until_idle(3)  # Download için bekle
 
                 # Downloads klasörüne bakılabilir ama test environment'da zor
                 print("Sample file Downloads klasörüne indirilmiş olmalı")
@@ -821,32 +639,20 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
         """TC072: Dosyada ayraç karakteri yok - Seçilen separator dosyada mevcut değil"""
         print("\nTC072: Dosyada ayraç karakteri yok testi ===")
 
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Ayraç karakteri olmayan dosya oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "no_separator.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        # Hiç virgül olmayan tek sütun data
-        csv_content = "List_FullData\nList_AhmetFromIstanbul25YearsOld\nList_AyseFromAnkara30YearsOld"
-
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("Ayraç karakteri olmayan dosya oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("no_separator.csv")
         assert file_uploaded, "Dosya upload edilemedi"
 
         # Separator: Comma seç (ama dosyada virgül yok)
@@ -856,11 +662,10 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Sistem nasıl davranıyor kontrol et
-        page_source = self.driver.page_source
-        service_error = "service is currently unavailable" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        service_error = content.mentions("service is currently unavailable")
 
         if service_error:
             print("Backend service unavailable")
@@ -873,36 +678,21 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
         """TC073: Dosya içeriğinde SQL injection - CSV data'da SQL injection payload"""
         print("\nTC073: Dosya içeriğinde SQL injection testi ===")
 
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
 
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # SQL injection payload'lu CSV oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "sql_injection.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        # SQL injection payloadları
-        csv_content = """List_Name,List_Query,List_Payload
-"List_Drop","'; DROP TABLE users; --","List_1' OR '1'='1"
-"List_Union","' UNION SELECT * FROM admin --","List_'; DELETE FROM data; --"
-"List_Normal","List_RegularName","List_RegularData\""""
-
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("SQL injection payloadlı CSV oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("sql_injection.csv")
         assert file_uploaded, "SQL injection dosyası upload edilemedi"
 
         # Separator: Comma seç
@@ -912,7 +702,6 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Sistem crash olmadı mı kontrol et
         try:
@@ -928,36 +717,21 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
         """TC074: Dosya ile XSS injection - CSV data'da XSS payload"""
         print("\nTC074: Dosya ile XSS injection testi ===")
 
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
 
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # XSS payload'lu CSV oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "xss_injection.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        # XSS payloadları
-        csv_content = """List_Name,List_Script,List_Html
-"List_Alert","<script>alert('XSS')</script>","<img src=x onerror=alert(1)>"
-"List_Iframe","<iframe src=javascript:alert('XSS')>","<svg onload=alert('XSS')>"
-"List_Normal","List_RegularName","List_RegularData\""""
-
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("XSS payloadlı CSV oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("xss_injection.csv")
         assert file_uploaded, "XSS injection dosyası upload edilemedi"
 
         # Separator: Comma seç
@@ -967,7 +741,6 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         print("Test tamamlandı: XSS injection dosya içeriği testi")
 
@@ -975,35 +748,26 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
         """TC075: Uzantısız dosya yükleme - Extension olmayan dosya upload"""
         print("\nTC075: Uzantısız dosya yükleme testi ===")
 
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
 
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Uzantısız dosya oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "no_extension_file")  # .csv yok
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write("List_Name,List_Age\nList_Ahmet,25")
-
-        print("Uzantısız dosya oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
-        time.sleep(2)
+        file_uploaded = self._upload_test_file("no_extension_file")
+        self.create_lg_page.wait_until_idle(2)
 
         # File extension error kontrolü
-        page_source = self.driver.page_source
-        extension_error = "extension" in page_source.lower() or "csv" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        extension_error = content.mentions("extension", "csv")
 
         if extension_error:
             print("File extension error alındı")
@@ -1018,35 +782,21 @@ List_Mehmet,-5,0,1900-01-01,false,100.0"""
         """TC076: Aynı sütun isimleri - CSV'de duplicate column headers"""
         print("\nTC076: Aynı sütun isimleri testi ===")
 
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
 
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create From File tab'ına git
         tab_clicked = self.create_lg_page.click_create_from_file_tab()
         assert tab_clicked, "Create From File tab'ına tıklanamadı"
-        time.sleep(1)
-
-        # Aynı sütun isimli CSV oluştur
-        test_file_path = os.path.join(os.getcwd(), "test_data", "duplicate_columns.csv")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-
-        # Duplicate column names
-        csv_content = """List_Name,List_Name,List_Age,List_Age,List_Name
-List_Ahmet1,List_Ahmet2,25,26,List_Ahmet3
-List_Ayse1,List_Ayse2,30,31,List_Ayse3"""
-
-        with open(test_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-
-        print("Duplicate column names CSV oluşturuldu")
+        self.create_lg_page.wait_until_idle(1)
 
         # Dosya upload et
-        file_uploaded = self.create_lg_page.upload_file(test_file_path)
+        file_uploaded = self._upload_test_file("duplicate_columns.csv")
         assert file_uploaded, "Duplicate columns dosyası upload edilemedi"
 
         # Separator: Comma seç
@@ -1056,12 +806,11 @@ List_Ayse1,List_Ayse2,30,31,List_Ayse3"""
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
 
         # Duplicate column error kontrolü
-        page_source = self.driver.page_source
-        duplicate_error = "duplicate" in page_source.lower() or "column" in page_source.lower()
-        service_error = "service is currently unavailable" in page_source.lower()
+        content = self.create_lg_page.read_content()
+        duplicate_error = content.mentions("duplicate", "column")
+        service_error = content.mentions("service is currently unavailable")
 
         if service_error:
             print("Backend service unavailable")
@@ -2,10 +2,7 @@ import time
 import pytest
 import os
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 from tdm_automation.Pages.login_page import LoginPage
 from tdm_automation.Pages.tdm_dashboard_page import TDMDashboardPage
 from tdm_automation.Pages.application_management_page import AppManagementPage
@@ -14,11 +11,14 @@ from tdm_automation.Pages.create_module_page import CreateModulePage
 from tdm_automation.Pages.product_info_page import ProductInfoPage
 from tdm_automation.Pages.list_generator_page import ListGeneratorPage
 from tdm_automation.Pages.create_list_generator_page import CreateListGenerator
-from selenium.webdriver.chrome.options import Options
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.namespace import unique_name
+from tdm_automation.Utils.session_cache import SessionCache
 
 load_dotenv()
 
 
+@pytest.mark.tdm
 class TestCreateNewTab:
 
     @classmethod
@@ -35,39 +35,8 @@ class TestCreateNewTab:
         # Test data environment değişkenleri
         cls.TEST_LIST_NAME = os.getenv('TEST_LIST_NAME', 'ListName')
 
-        # Environment değişkenlerini al
-        cls.HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
-        cls.DOCKER_MODE = os.getenv('DOCKER_MODE', 'false').lower() == 'true'
-
-        # Chrome options - Docker ve headless için optimize edilmiş
-        cls.chrome_options = Options()
-
-        if cls.HEADLESS:
-            cls.chrome_options.add_argument("--headless")
-            print("HEADLESS modda çalışıyor")
-
-        if cls.DOCKER_MODE:
-            # Docker için gerekli argumentlar
-            cls.chrome_options.add_argument("--no-sandbox")
-            cls.chrome_options.add_argument("--disable-dev-shm-usage")
-            cls.chrome_options.add_argument("--disable-gpu")
-            cls.chrome_options.add_argument("--remote-debugging-port=9222")
-            cls.chrome_options.add_argument("--incognito")
-
-            print("DOCKER modda çalışıyor")
-        else:
-            # Local development için
-            cls.chrome_options.add_argument("--incognito")
-
-        # Genel performans ayarları
-        cls.chrome_options.add_argument("--window-size=1920,1080")
-        cls.chrome_options.add_argument("--disable-web-security")
-        cls.chrome_options.add_argument("--ignore-certificate-errors")
-
-        # WebDriver kurulumu
-        cls.service = Service(ChromeDriverManager().install())
-        cls.driver = webdriver.Chrome(service=cls.service, options=cls.chrome_options)
-        cls.driver.maximize_window()
+        # WebDriver havuzdan kiralanır (session boyunca açık kalır)
+        cls.driver = DriverPool.instance().acquire()
 
         # Page object'leri oluştur
         cls.login_page = LoginPage(cls.driver)
@@ -80,14 +49,10 @@ class TestCreateNewTab:
         cls.create_lg_page = CreateListGenerator(cls.driver)
 
         # *** TEK SEFERLİK LOGIN İŞLEMLERİ ***
-        cls.driver.get(cls.BASE_URL)
-        login_success = cls.login_page.do_login(cls.VALID_USERNAME, cls.VALID_PASSWORD)
-        assert login_success, "Login başarısız!"
-
-        # TDM'ye git
-        tdm_locator = (By.XPATH, "//li[@title='New Test Data Manager'][2]")
-        tdm_success = cls.login_page.click_element(tdm_locator)
-        assert tdm_success, "TDM elementine tıklanamadı"
+        # Cache'te geçerli oturum varsa enjekte edilir, yoksa UI'dan login olunur
+        session_cache = SessionCache(cls.VALID_USERNAME, cls.VALID_PASSWORD, cls.BASE_URL)
+        tdm_success = session_cache.open_tdm(cls.driver)
+        assert tdm_success, "TDM oturumu açılamadı"
 
         # List Generator'e git
         listgen_success = cls.dashboard_page.click_list_generator()
@@ -98,24 +63,23 @@ class TestCreateNewTab:
     @classmethod
     def teardown_class(cls):
         """Tüm testler bitince tek sefer çalışır"""
-        print("\n=== CLASS TEARDOWN: Driver kapatılıyor ===")
+        print("\n=== CLASS TEARDOWN: Driver havuza iade ediliyor ===")
         if hasattr(cls, 'driver'):
-            cls.driver.quit()
+            DriverPool.instance().release(cls.driver)
 
     def setup_method(self, method):
         """Her test öncesi çalışır - SADECE TEST-SPECIFIC SETUP"""
         print(f"\n--- Test başlıyor: {method.__name__} ---")
 
         # Test data - her test için unique değerler
-        timestamp = int(time.time())
-        self.test_list_name = f"{self.TEST_LIST_NAME}_{timestamp}"
+        self.test_list_name = unique_name(self.TEST_LIST_NAME)
 
         # App Management sayfasında olduğumuzu kontrol et
         current_url = self.driver.current_url
         if "list-generator" not in current_url:
             print("List Generator sayfasına yönlendiriliyor...")
             self.dashboard_page.click_list_generator()
-            time.sleep(1)
+            self.create_lg_page.wait_until_idle(1)
 
     def teardown_method(self, method):
         """Her test sonrası çalışır - SADECE TEST CLEANUP"""
@@ -123,11 +87,7 @@ class TestCreateNewTab:
 
         # Modal varsa kapat
         try:
-            cancel_buttons = self.driver.find_elements(By.XPATH, "//span[text()='CANCEL']")
-            for button in cancel_buttons:
-                if button.is_displayed():
-                    button.click()
-                    time.sleep(0.5)
+            self.create_lg_page.dismiss_dialogs(("CANCEL",))
         except:
             pass
 
@@ -140,11 +100,12 @@ class TestCreateNewTab:
     def _cleanup_test_data(self):
         """Test verilerini temizle"""
         try:
-            # Oluşturulan app'i sil
-            page_source = self.driver.page_source
-            if hasattr(self, 'test_list_name') and self.test_list_name in page_source:
+            # Oluşturulan liste'yi sil (hangi sayfada olursa olsun)
+            table = self.listgen_page.table
+            if hasattr(self, 'test_list_name') and table.contains(self.test_list_name):
                 self.listgen_page.click_deletelist_andconfirm_button(self.test_list_name)
-                time.sleep(1)
+                self.create_lg_page.wait_until_idle(1)
+            table.clear_search()
         except:
             pass
 
@@ -155,12 +116,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -186,7 +147,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test başarılı: Integer type tek nokta kabul ediyor, liste oluşturuldu")
 
@@ -198,12 +159,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -241,7 +202,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test başarılı: Integer type ikinci noktayı yazdırmıyor (13.2.5 → 13.25)")
 
@@ -253,12 +214,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -296,7 +257,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test başarılı: Integer type textleri yazdırmıyor (abc13.2 → 13.2, test5.7 → 5.7)")
 
@@ -308,12 +269,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -346,12 +307,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -369,7 +330,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test başarılı: Integer type negatif sayıları kabul ediyor")
 
@@ -381,12 +342,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -413,7 +374,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test başarılı: Decimal type çift nokta ile davranış test edildi")
 
@@ -425,12 +386,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -457,7 +418,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test başarılı: Decimal type text+decimal kombinasyonu test edildi")
 
@@ -469,12 +430,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -501,7 +462,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test başarılı: Text type her şeyi kabul ediyor")
 
@@ -513,12 +474,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -542,7 +503,7 @@ class TestCreateNewTab:
         if save_enabled:
             print("Boş değer kabul edildi")
             save_clicked = self.create_lg_page.click_save_button_new_file()
-            time.sleep(2)
+            self.create_lg_page.wait_until_idle(2)
         else:
             print("Boş değer reddedildi - SAVE disabled")
 
@@ -556,12 +517,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Çok uzun name oluştur (500 karakter)
         long_name = "VeryLongListName" * 30  # 16*30 = 480 karakter
@@ -588,7 +549,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test başarılı: Uzun name davranışı test edildi")
 
@@ -600,12 +561,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -636,7 +597,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test başarılı: Uzun value davranışı test edildi")
 
@@ -648,12 +609,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -693,7 +654,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(3)  # Kayıt için biraz bekle
+        self.create_lg_page.wait_until_idle(3)  # Kayıt için biraz bekle
 
         print("Test başarılı: Maksimum value sayısı test edildi")
 
@@ -705,12 +666,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -730,7 +691,7 @@ class TestCreateNewTab:
         assert value2_entered, "İkinci value girilemedi"
 
         add2_clicked = self.create_lg_page.click_add_value_button()
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Error modal açıldı mı kontrol et
         page_source = self.driver.page_source
@@ -741,7 +702,7 @@ class TestCreateNewTab:
         # OK butonuna tıkla (error modal'ı kapat)
         ok_button = self.driver.find_element(By.XPATH, "//span[text()='OK']")
         ok_button.click()
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Farklı value ekle
         value3_added = self.create_lg_page.add_value("test456")
@@ -751,7 +712,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test başarılı: Duplicate values reddediliyor, error modal gösteriliyor")
 
@@ -763,12 +724,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # SQL injection payload
         sql_payload = "'; DROP TABLE lists; --"
@@ -795,7 +756,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         # Sistem hala çalışıyor mu kontrol et (crash olmadı mı?)
         try:
@@ -820,12 +781,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Normal name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -856,7 +817,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         # Sistem hala çalışıyor mu kontrol et (crash olmadı mı?)
         try:
@@ -882,12 +843,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # XSS payload
         xss_payload = "<script>alert('xss')</script>"
@@ -914,7 +875,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test tamamlandı: XSS injection name kontrolü yapıldı")
 
@@ -926,12 +887,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Normal name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -962,7 +923,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test tamamlandı: HTML injection values kontrolü yapıldı")
 
@@ -975,14 +936,14 @@ class TestCreateNewTab:
         print("İlk liste oluşturuluyor...")
         new_clicked1 = self.listgen_page.click_newlist()
         assert new_clicked1, "İlk NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked1 = self.create_lg_page.click_create_new_tab()
         assert tab_clicked1, "İlk Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Aynı name kullan
-        duplicate_name = f"DuplicateTest_{int(time.time())}"
+        duplicate_name = unique_name("DuplicateTest")
         name_entered1 = self.create_lg_page.enter_name(duplicate_name)
         assert name_entered1, "İlk name girilemedi"
 
@@ -994,18 +955,18 @@ class TestCreateNewTab:
 
         save_clicked1 = self.create_lg_page.click_save_button_new_file()
         assert save_clicked1, "İlk SAVE butonuna tıklanamadı"
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
         print(f"İlk liste '{duplicate_name}' oluşturuldu")
 
         # İkinci listeyi aynı isimle oluşturmaya çalış
         print("İkinci liste aynı isimle oluşturuluyor...")
         new_clicked2 = self.listgen_page.click_newlist()
         assert new_clicked2, "İkinci NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked2 = self.create_lg_page.click_create_new_tab()
         assert tab_clicked2, "İkinci Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Aynı name gir
         name_entered2 = self.create_lg_page.enter_name(duplicate_name)
@@ -1018,7 +979,7 @@ class TestCreateNewTab:
         assert value_added2, "İkinci value eklenemedi"
 
         save_clicked2 = self.create_lg_page.click_save_button_new_file()
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         # Hata mesajı var mı kontrol et
         page_source = self.driver.page_source
@@ -1037,12 +998,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Farklı dil karakterleri karışımı
         non_latin_name = "тест_列表_اختبار_テスト_한국어"  # Rusça_Çince_Arapça_Japonca_Korece
@@ -1079,7 +1040,7 @@ class TestCreateNewTab:
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         print("Test tamamlandı: Latin alfabesinden olmayan karakterler kontrolü yapıldı")
 
@@ -1091,12 +1052,12 @@ class TestCreateNewTab:
         # Önce NEW butonuna tıkla (modal açılır)
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Create New tab'ına git (modal içinde)
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name field'ını boş bırak (hiçbir şey girme)
         print("Name field boş bırakılıyor")
@@ -1117,7 +1078,7 @@ class TestCreateNewTab:
         # SAVE butonuna tıkla
         save_clicked = self.create_lg_page.click_save_button_new_file()
         assert save_clicked, "SAVE butonuna tıklanamadı"
-        time.sleep(2)
+        self.create_lg_page.wait_until_idle(2)
 
         # Modal hala açık mı? (validation error varsa açık kalır)
         page_source = self.driver.page_source
@@ -1137,11 +1098,11 @@ class TestCreateNewTab:
         # NEW butonuna tıkla ve form doldur
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Form doldur
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -1156,7 +1117,7 @@ class TestCreateNewTab:
         # Browser refresh yap
         print("*** BROWSER REFRESH ***")
         self.driver.refresh()
-        time.sleep(3)
+        self.create_lg_page.wait_until_idle(3)
 
         # Verilerin kaybolduğunu kontrol et
         try:
@@ -1177,11 +1138,11 @@ class TestCreateNewTab:
         # NEW butonuna tıkla ve Create New tab'ına git
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_create_new_tab()
         assert tab_clicked, "Create New tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name gir
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
@@ -1,11 +1,7 @@
-import time
 import pytest
 import os
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 from tdm_automation.Pages.login_page import LoginPage
 from tdm_automation.Pages.tdm_dashboard_page import TDMDashboardPage
 from tdm_automation.Pages.application_management_page import AppManagementPage
@@ -15,12 +11,15 @@ from tdm_automation.Pages.product_info_page import ProductInfoPage
 from tdm_automation.Pages.list_generator_page import ListGeneratorPage
 from tdm_automation.Pages.create_list_generator_page import CreateListGenerator
 from tdm_automation.Pages.data_generation_case_page import DataCasePage
-from selenium.webdriver.chrome.options import Options
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.namespace import unique_name
+from tdm_automation.Utils.session_cache import SessionCache
 
 
 load_dotenv()
 
 
+@pytest.mark.tdm
 class TestDataGenerationCase:
 
     @classmethod
@@ -37,39 +36,8 @@ class TestDataGenerationCase:
         # Test data environment değişkenleri
         cls.CASE_NAME = os.getenv('CASE_NAME', 'CaseName')
 
-        # Environment değişkenlerini al
-        cls.HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
-        cls.DOCKER_MODE = os.getenv('DOCKER_MODE', 'false').lower() == 'true'
-
-        # Chrome options - Docker ve headless için optimize edilmiş
-        cls.chrome_options = Options()
-
-        if cls.HEADLESS:
-            cls.chrome_options.add_argument("--headless")
-            print("HEADLESS modda çalışıyor")
-
-        if cls.DOCKER_MODE:
-            # Docker için gerekli argumentlar
-            cls.chrome_options.add_argument("--no-sandbox")
-            cls.chrome_options.add_argument("--disable-dev-shm-usage")
-            cls.chrome_options.add_argument("--disable-gpu")
-            cls.chrome_options.add_argument("--remote-debugging-port=9222")
-            cls.chrome_options.add_argument("--incognito")
-
-            print("DOCKER modda çalışıyor")
-        else:
-            # Local development için
-            cls.chrome_options.add_argument("--incognito")
-
-        # Genel performans ayarları
-        cls.chrome_options.add_argument("--window-size=1920,1080")
-        cls.chrome_options.add_argument("--disable-web-security")
-        cls.chrome_options.add_argument("--ignore-certificate-errors")
-
-        # WebDriver kurulumu
-        cls.service = Service(ChromeDriverManager().install())
-        cls.driver = webdriver.Chrome(service=cls.service, options=cls.chrome_options)
-        cls.driver.maximize_window()
+        # WebDriver havuzdan kiralanır (session boyunca açık kalır)
+        cls.driver = DriverPool.instance().acquire()
 
         # Page object'leri oluştur
         cls.login_page = LoginPage(cls.driver)
@@ -83,14 +51,10 @@ class TestDataGenerationCase:
         cls.datagcase_page = DataCasePage(cls.driver)
 
         # *** TEK SEFERLİK LOGIN İŞLEMLERİ ***
-        cls.driver.get(cls.BASE_URL)
-        login_success = cls.login_page.do_login(cls.VALID_USERNAME, cls.VALID_PASSWORD)
-        assert login_success, "Login başarısız!"
-
-        # TDM'ye git
-        tdm_locator = (By.XPATH, "//li[@title='New Test Data Manager'][2]")
-        tdm_success = cls.login_page.click_element(tdm_locator)
-        assert tdm_success, "TDM elementine tıklanamadı"
+        # Cache'te geçerli oturum varsa enjekte edilir, yoksa UI'dan login olunur
+        session_cache = SessionCache(cls.VALID_USERNAME, cls.VALID_PASSWORD, cls.BASE_URL)
+        tdm_success = session_cache.open_tdm(cls.driver)
+        assert tdm_success, "TDM oturumu açılamadı"
 
         # List Generator'e git
         datacase_success = cls.dashboard_page.click_data_generation_case()
@@ -101,52 +65,36 @@ class TestDataGenerationCase:
     @classmethod
     def teardown_class(cls):
         """Tüm testler bitince tek sefer çalışır"""
-        print("\n=== CLASS TEARDOWN: Driver kapatılıyor ===")
+        print("\n=== CLASS TEARDOWN: Driver havuza iade ediliyor ===")
         if hasattr(cls, 'driver'):
-            cls.driver.quit()
+            DriverPool.instance().release(cls.driver)
 
     def setup_method(self, method):
         """Her test öncesi çalışır - SADECE TEST-SPECIFIC SETUP"""
         print(f"\n--- Test başlıyor: {method.__name__} ---")
 
         # Test data - her test için unique değerler
-        timestamp = int(time.time())
-        self.test_case_name = f"{self.CASE_NAME}_{timestamp}"
+        self.test_case_name = unique_name(self.CASE_NAME)
 
         # App Management sayfasında olduğumuzu kontrol et
         current_url = self.driver.current_url
         if "data-generation-case" not in current_url:
             print("Data Case sayfasına yönlendiriliyor...")
             self.dashboard_page.click_data_generation_case()
-            time.sleep(1)
+            self.datagcase_page.wait_until_idle(1)
 
     def teardown_method(self, method):
         """Her test sonrası çalışır - SADECE TEST CLEANUP"""
         print(f"--- Test bitti: {method.__name__} ---")
 
-        # Modal varsa kapat
+        # Modal varsa kapat: önce CANCEL, yoksa BACK
         try:
-            # Önce CANCEL butonunu dene
-            cancel_buttons = self.driver.find_elements(By.XPATH, "//span[text()='CANCEL']")
-            for button in cancel_buttons:
-                if button.is_displayed():
-                    self.datagcase_page.click_element((By.XPATH, "//span[text()='CANCEL']"))
-                    time.sleep(0.5)
-                    print("Modal CANCEL ile kapatıldı")
-                    return
-
-            # CANCEL yoksa BACK butonunu dene
-            back_buttons = self.driver.find_elements(By.XPATH, "//span[text()='BACK']")
-            for button in back_buttons:
-                if button.is_displayed():
-                    self.datagcase_page.click_element((By.XPATH, "//span[text()='BACK']"))
-                    time.sleep(0.5)
-                    print("Sayfa BACK ile kapatıldı")
-                    return
+            closed = self.datagcase_page.dismiss_dialogs(("CANCEL", "BACK"), max_steps=1)
+            if closed:
+                print(f"Açık ekran {closed[0]} ile kapatıldı")
         except:
             pass
 
-
     def test_TC107_application_seçmeden_module_tıklama(self):
         """TC107: Application seçmeden module tıklama - Module dropdown tıklanabilir ama içeriği boş"""
         print("\nTC107: Application seçmeden module tıklama testi ===")
@@ -324,8 +272,9 @@ class TestDataGenerationCase:
         # Case Name boş bırak - hiçbir şey girme
 
         # SAVE butonunun disabled olduğunu kontrol et
-        save_button = self.driver.find_element(*self.datagcase_page.SAVE_BUTTON)
-        is_disabled = not save_button.is_enabled() or "disabled" in save_button.get_attribute("class")
+        form = self.datagcase_page.get_form_state()
+        assert not form["case_name"]["value"], "Case Name boş olmalıydı"
+        is_disabled = not form["save"]["enabled"] or "disabled" in form["save"]["classes"]
 
         print(f"SAVE butonu durumu: {'Disabled' if is_disabled else 'Enabled'}")
         assert is_disabled, "Case Name boş iken SAVE butonu disabled olmalı"
@@ -369,8 +318,7 @@ class TestDataGenerationCase:
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
         # Case oluşturulduğunu kontrol et (listede görünmeli)
-        page_source = self.driver.page_source
-        assert self.test_case_name in page_source, f"Case '{self.test_case_name}' listede görünmüyor"
+        assert self.datagcase_page.table.contains(self.test_case_name), f"Case '{self.test_case_name}' listede görünmüyor"
 
         print("Test başarılı: Case başarıyla oluşturuldu")
 
@@ -409,8 +357,7 @@ class TestDataGenerationCase:
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
         # Case oluşturulduğunu kontrol et
-        page_source = self.driver.page_source  # "page" eksikti!
-        assert self.test_case_name in page_source, f"Case '{self.test_case_name}' listede görünmüyor"
+        assert self.datagcase_page.table.contains(self.test_case_name), f"Case '{self.test_case_name}' listede görünmüyor"
 
         print("Test başarılı: Description olmadan case oluşturuldu")
 
@@ -439,7 +386,7 @@ class TestDataGenerationCase:
         assert flow_selected, "Synthetic Flow seçilemedi"
 
         # İlk case name
-        first_case_name = f"DuplicateTest_{int(time.time())}"
+        first_case_name = unique_name("DuplicateTest")
         case_name_entered = self.datagcase_page.enter_case_name(first_case_name)
         assert case_name_entered, "İlk Case Name girilemedi"
 
@@ -473,8 +420,8 @@ class TestDataGenerationCase:
         save_clicked2 = self.datagcase_page.click_save_button()
 
         # Hata mesajı kontrolü
-        page_source = self.driver.page_source
-        has_error = "error" in page_source.lower() or "duplicate" in page_source.lower() or "exists" in page_source.lower()
+        content = self.datagcase_page.read_content()
+        has_error = content.mentions("error", "duplicate", "exists")
 
         print(f"Duplicate name hatası: {'Alındı' if has_error else 'Alınmadı'}")
         assert has_error, "Duplicate case name hatası alınmalıydı"
@@ -574,9 +521,9 @@ class TestDataGenerationCase:
         assert delete_clicked, "Delete işlemi başarısız"
 
         # Case silindiğini kontrol et - 1 saniye bekle
-        time.sleep(1)
-        page_source = self.driver.page_source
-        case_deleted = self.test_case_name not in page_source
+        self.datagcase_page.wait_until_idle(1)
+        content = self.datagcase_page.read_content()
+        case_deleted = not content.has_row(self.test_case_name)
 
         print(f"Case silindi mi: {'Evet' if case_deleted else 'Hayır'}")
         assert case_deleted, f"Case '{self.test_case_name}' listeden silinmedi"
@@ -595,11 +542,10 @@ class TestDataGenerationCase:
         run_clicked = self.datagcase_page.click_runcase_button("afa")
         assert run_clicked, "Run butonuna tıklanamadı"
 
-        # Status kontrolü
-        page_source = self.driver.page_source
-        has_success = "success" in page_source.lower() or "running" in page_source.lower()
+        # Run bitene kadar status'u poll et (sabit bekleme/anlık kontrol yerine)
+        run = self.datagcase_page.wait_for_run("afa")
 
-        print(f"Run durumu: {'Başarılı/Çalışıyor' if has_success else 'Başarısız'}")
+        print(f"Run durumu: {run.state} ({run.elapsed:.1f}s)")
 
         print("Test başarılı: Case run işlemi çalışıyor")
 
@@ -621,8 +567,8 @@ class TestDataGenerationCase:
         history_opened = "history" in current_url.lower()
 
         if not history_opened:
-            page_source = self.driver.page_source
-            history_opened = "history" in page_source.lower() or "run version" in page_source.lower()
+            content = self.datagcase_page.read_content()
+            history_opened = content.contains_any("history", "run version")
 
         assert history_opened, "History sayfası açılmadı"
 
@@ -639,13 +585,9 @@ class TestDataGenerationCase:
         log_clicked = self.datagcase_page.click_log_button("afa")
         assert log_clicked, "Log butonuna tıklanamadı"
 
-        # Log sayfasının açıldığını kontrol et
-        current_url = self.driver.current_url
-        log_opened = "log" in current_url.lower()
-
-        if not log_opened:
-            page_source = self.driver.page_source
-            log_opened = "log" in page_source.lower() or "duration" in page_source.lower() or "from:" in page_source.lower()
+        # Log sayfasının açıldığını kontrol et (sadece log container'ı okunur)
+        log_reader = self.datagcase_page.log_reader()
+        log_opened = log_reader.wait_until_open() or "log" in self.driver.current_url.lower()
 
         assert log_opened, "Log sayfası açılmadı"
 
@@ -662,27 +604,17 @@ class TestDataGenerationCase:
         log_clicked = self.datagcase_page.click_log_button("afa")
         assert log_clicked, "Log butonuna tıklanamadı"
 
-        # Log textarea'sında ERROR kelimesi kontrolü
-        try:
-            # Textarea element'ini bul
-            textarea_element = self.driver.find_element(By.XPATH,
-                                                        "//textarea[contains(@class, 'ant-input') and @readonly]")
-            textarea_content = textarea_element.get_attribute("value") or textarea_element.text
-
-            has_error = "error" in textarea_content.lower()
+        # Log'u satır satır oku, ERROR görülünce dur (tüm sayfa tekrar tekrar okunmaz)
+        log_reader = self.datagcase_page.log_reader()
+        if not log_reader.wait_until_open():
+            print("Log container'ı bulunamadı")
+        error_line = log_reader.find("ERROR")
 
-            print(f"Log textarea içeriğinde ERROR bulundu mu: {'Evet' if has_error else 'Hayır'}")
+        print(f"Log içeriğinde ERROR bulundu mu: {'Evet - ' + error_line if error_line else 'Hayır'}")
 
-            # Bu test case durumuna göre pass/fail olabilir
-            # Eğer case başarılıysa ERROR olmayabilir, bu normal
-            print("Test tamamlandı: Log ERROR kontrolü yapıldı")
-
-        except Exception as e:
-            print(f"Textarea bulunamadı: {e}")
-            # Fallback - page source'da ara
-            page_source = self.driver.page_source
-            has_error = "error" in page_source.lower()
-            print(f"Page source'da ERROR bulundu mu: {'Evet' if has_error else 'Hayır'}")
+        # Bu test case durumuna göre pass/fail olabilir
+        # Eğer case başarılıysa ERROR olmayabilir, bu normal
+        print(f"Test tamamlandı: Log ERROR kontrolü yapıldı ({log_reader.line_count} satır okundu)")
 
 
     def test_TC121_case_name_özel_karakterler(self):
@@ -710,7 +642,7 @@ class TestDataGenerationCase:
         assert flow_selected, "Synthetic Flow seçilemedi"
 
         # Özel karakterli case name
-        special_case_name = f"Test!@#$%^&*()_{int(time.time())}"
+        special_case_name = unique_name("Test!@#$%^&*()")
         case_name_entered = self.datagcase_page.enter_case_name(special_case_name)
         assert case_name_entered, "Özel karakterli Case Name girilemedi"
 
@@ -718,9 +650,9 @@ class TestDataGenerationCase:
         save_clicked = self.datagcase_page.click_save_button()
 
         # Sonuç kontrolü - ya kabul edilir ya da hata verir
-        page_source = self.driver.page_source
-        case_created = special_case_name in page_source
-        has_error = "error" in page_source.lower() or "invalid" in page_source.lower()
+        content = self.datagcase_page.read_content()
+        case_created = content.has_row(special_case_name)
+        has_error = content.mentions("error", "invalid")
 
         print(f"Özel karakterli case: {'Oluşturuldu' if case_created else 'Hata aldı' if has_error else 'Belirsiz'}")
 
@@ -762,8 +694,8 @@ class TestDataGenerationCase:
         save_clicked = self.datagcase_page.click_save_button()
 
         # Karakter limiti hatası kontrolü
-        page_source = self.driver.page_source
-        has_limit_error = "limit" in page_source.lower() or "length" in page_source.lower() or "character" in page_source.lower()
+        content = self.datagcase_page.read_content()
+        has_limit_error = content.mentions("limit", "length", "character")
 
         print(f"Karakter limiti uyarısı: {'Alındı' if has_limit_error else 'Alınmadı'}")
 
@@ -782,8 +714,9 @@ class TestDataGenerationCase:
         assert case_name_entered, "Case Name girilemedi"
 
         # SAVE butonunun disabled olduğunu kontrol et
-        save_button = self.driver.find_element(*self.datagcase_page.SAVE_BUTTON)
-        is_disabled = not save_button.is_enabled() or "disabled" in save_button.get_attribute("class")
+        form = self.datagcase_page.get_form_state()
+        assert form["case_name"]["value"] == self.test_case_name, "Case Name girilen değeri göstermiyor"
+        is_disabled = not form["save"]["enabled"] or "disabled" in form["save"]["classes"]
 
         print(f"SAVE butonu durumu: {'Disabled' if is_disabled else 'Enabled'}")
         assert is_disabled, "Dropdown'lar boş iken SAVE butonu disabled olmalı"
@@ -810,11 +743,11 @@ class TestDataGenerationCase:
 
         # Browser refresh yap
         self.driver.refresh()
-        time.sleep(2)
+        self.datagcase_page.wait_until_idle(2)
 
         # Girilen verilerin kaybolduğunu kontrol et - bu ana test
-        page_source = self.driver.page_source
-        data_lost = self.test_case_name not in page_source
+        content = self.datagcase_page.read_content()
+        data_lost = not content.contains(self.test_case_name)
 
         # Modal state kontrolü (yan etki)
         current_url = self.driver.current_url
@@ -862,9 +795,9 @@ class TestDataGenerationCase:
         save_clicked = self.datagcase_page.click_save_button()
 
         # Sonuç kontrolü
-        page_source = self.driver.page_source
-        has_limit_error = "limit" in page_source.lower() or "too long" in page_source.lower()
-        case_created = super_long_name[:50] in page_source  # İlk 50 karaktere bak
+        content = self.datagcase_page.read_content()
+        has_limit_error = content.mentions("limit", "too long")
+        case_created = content.has_row(super_long_name[:50])  # İlk 50 karaktere bak
 
         print(f"Uzun case name: {'Hata aldı' if has_limit_error else 'Oluşturuldu' if case_created else 'Belirsiz'}")
 
@@ -879,8 +812,9 @@ class TestDataGenerationCase:
         assert new_clicked, "NEW butonuna tıklanamadı"
 
         # Hiçbir alan doldurmadan SAVE kontrol et
-        save_button = self.driver.find_element(*self.datagcase_page.SAVE_BUTTON)
-        is_disabled = not save_button.is_enabled() or "disabled" in save_button.get_attribute("class")
+        form = self.datagcase_page.get_form_state()
+        assert not form["case_name"]["value"], "Case Name boş olmalıydı"
+        is_disabled = not form["save"]["enabled"] or "disabled" in form["save"]["classes"]
 
         print(f"SAVE butonu durumu: {'Disabled' if is_disabled else 'Enabled'}")
         assert is_disabled, "Hiçbir alan doldurulmadan SAVE butonu disabled olmalı"
@@ -912,7 +846,7 @@ class TestDataGenerationCase:
         assert flow_selected, "Synthetic Flow seçilemedi"
 
         # SQL injection denemesi
-        sql_injection_name = f"'; DROP TABLE users; --_{int(time.time())}"
+        sql_injection_name = unique_name("'; DROP TABLE users; --")
         case_name_entered = self.datagcase_page.enter_case_name(sql_injection_name)
         assert case_name_entered, "SQL injection Case Name girilemedi"
 
@@ -920,9 +854,9 @@ class TestDataGenerationCase:
         save_clicked = self.datagcase_page.click_save_button()
 
         # Güvenlik kontrolü
-        page_source = self.driver.page_source
-        has_security_error = "error" in page_source.lower() or "invalid" in page_source.lower()
-        case_created = sql_injection_name in page_source
+        content = self.datagcase_page.read_content()
+        has_security_error = content.mentions("error", "invalid")
+        case_created = content.has_row(sql_injection_name)
 
         print(f"SQL injection koruması: {'Var' if has_security_error else 'Yok' if case_created else 'Belirsiz'}")
 
@@ -954,7 +888,7 @@ class TestDataGenerationCase:
         assert flow_selected, "Synthetic Flow seçilemedi"
 
         # XSS injection denemesi
-        xss_name = f"<script>alert('xss')</script>_{int(time.time())}"
+        xss_name = unique_name("<script>alert('xss')</script>")
         case_name_entered = self.datagcase_page.enter_case_name(xss_name)
         assert case_name_entered, "XSS Case Name girilemedi"
 
@@ -962,8 +896,12 @@ class TestDataGenerationCase:
         save_clicked = self.datagcase_page.click_save_button()
 
         # XSS koruması kontrolü
-        page_source = self.driver.page_source
-        has_xss_protection = "<script>" not in page_source or "error" in page_source.lower()
+        # Payload script olarak DOM'a girdiyse korunma yok
+        xss_injected = self.driver.execute_script(
+            "return Array.prototype.some.call(document.scripts, function (s) {"
+            " return s.textContent.indexOf(\"alert('xss')\") !== -1; });")
+        content = self.datagcase_page.read_content()
+        has_xss_protection = not xss_injected or content.mentions("error")
 
         print(f"XSS koruması: {'Var' if has_xss_protection else 'Yok'}")
 
@@ -994,7 +932,7 @@ class TestDataGenerationCase:
         assert flow_selected, "Synthetic Flow seçilemedi"
 
         # Unicode karakterli case name
-        unicode_name = f"тест_列表_اختبار_{int(time.time())}"
+        unicode_name = unique_name("тест_列表_اختبار")
         case_name_entered = self.datagcase_page.enter_case_name(unicode_name)
         assert case_name_entered, "Unicode Case Name girilemedi"
 
@@ -1002,8 +940,8 @@ class TestDataGenerationCase:
         save_clicked = self.datagcase_page.click_save_button()
 
         # Unicode desteği kontrolü
-        page_source = self.driver.page_source
-        unicode_supported = unicode_name in page_source or "тест" in page_source
+        content = self.datagcase_page.read_content()
+        unicode_supported = content.has_row(unicode_name) or content.has_row("тест")
 
         print(f"Unicode desteği: {'Var' if unicode_supported else 'Yok'}")
 
@@ -1042,8 +980,8 @@ class TestDataGenerationCase:
         save_clicked = self.datagcase_page.click_save_button()
 
         # Boşluk validation kontrolü
-        page_source = self.driver.page_source
-        has_validation_error = "error" in page_source.lower() or "invalid" in page_source.lower() or "required" in page_source.lower()
+        content = self.datagcase_page.read_content()
+        has_validation_error = content.mentions("error", "invalid", "required")
 
         print(f"Boşluk validation: {'Var' if has_validation_error else 'Yok'}")
 
@@ -1086,8 +1024,8 @@ class TestDataGenerationCase:
         save_clicked = self.datagcase_page.click_save_button()
 
         # Description limit kontrolü
-        page_source = self.driver.page_source
-        has_desc_limit = "limit" in page_source.lower() or self.test_case_name in page_source
+        content = self.datagcase_page.read_content()
+        has_desc_limit = content.mentions("limit") or content.has_row(self.test_case_name)
 
         print(f"Description limit: {'Kontrol edildi' if has_desc_limit else 'Problem'}")
 
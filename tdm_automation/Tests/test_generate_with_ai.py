@@ -1,20 +1,22 @@
-import time
 import pytest
 import os
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 from tdm_automation.Pages.login_page import LoginPage
 from tdm_automation.Pages.tdm_dashboard_page import TDMDashboardPage
 from tdm_automation.Pages.list_generator_page import ListGeneratorPage
 from tdm_automation.Pages.create_list_generator_page import CreateListGenerator
-from selenium.webdriver.chrome.options import Options
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.namespace import unique_name
+from tdm_automation.Utils.session_cache import SessionCache
 
 load_dotenv()
 
+# get_ai_form_state() anahtarlarından input alanları (validate hariç)
+AI_FORM_FIELDS = ("name", "max_count", "api_url", "api_key", "model_name", "prompt")
 
+
+@pytest.mark.tdm
 class TestGenerateWithAi:
 
     @classmethod
@@ -31,39 +33,8 @@ class TestGenerateWithAi:
         # Test data environment değişkenleri
         cls.TEST_LIST_NAME = os.getenv('TEST_LIST_NAME', 'ListName')
 
-        # Environment değişkenlerini al
-        cls.HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
-        cls.DOCKER_MODE = os.getenv('DOCKER_MODE', 'false').lower() == 'true'
-
-        # Chrome options - Docker ve headless için optimize edilmiş
-        cls.chrome_options = Options()
-
-        if cls.HEADLESS:
-            cls.chrome_options.add_argument("--headless")
-            print("HEADLESS modda çalışıyor")
-
-        if cls.DOCKER_MODE:
-            # Docker için gerekli argumentlar
-            cls.chrome_options.add_argument("--no-sandbox")
-            cls.chrome_options.add_argument("--disable-dev-shm-usage")
-            cls.chrome_options.add_argument("--disable-gpu")
-            cls.chrome_options.add_argument("--remote-debugging-port=9222")
-            cls.chrome_options.add_argument("--incognito")
-
-            print("DOCKER modda çalışıyor")
-        else:
-            # Local development için
-            cls.chrome_options.add_argument("--incognito")
-
-        # Genel performans ayarları
-        cls.chrome_options.add_argument("--window-size=1920,1080")
-        cls.chrome_options.add_argument("--disable-web-security")
-        cls.chrome_options.add_argument("--ignore-certificate-errors")
-
-        # WebDriver kurulumu
-        cls.service = Service(ChromeDriverManager().install())
-        cls.driver = webdriver.Chrome(service=cls.service, options=cls.chrome_options)
-        cls.driver.maximize_window()
+        # WebDriver havuzdan kiralanır (session boyunca açık kalır)
+        cls.driver = DriverPool.instance().acquire()
 
         # Page object'leri oluştur
         cls.login_page = LoginPage(cls.driver)
@@ -72,14 +43,10 @@ class TestGenerateWithAi:
         cls.create_lg_page = CreateListGenerator(cls.driver)
 
         # *** TEK SEFERLİK LOGIN İŞLEMLERİ ***
-        cls.driver.get(cls.BASE_URL)
-        login_success = cls.login_page.do_login(cls.VALID_USERNAME, cls.VALID_PASSWORD)
-        assert login_success, "Login başarısız!"
-
-        # TDM'ye git
-        tdm_locator = (By.XPATH, "//li[@title='New Test Data Manager'][2]")
-        tdm_success = cls.login_page.click_element(tdm_locator)
-        assert tdm_success, "TDM elementine tıklanamadı"
+        # Cache'te geçerli oturum varsa enjekte edilir, yoksa UI'dan login olunur
+        session_cache = SessionCache(cls.VALID_USERNAME, cls.VALID_PASSWORD, cls.BASE_URL)
+        tdm_success = session_cache.open_tdm(cls.driver)
+        assert tdm_success, "TDM oturumu açılamadı"
 
         # List Generator'e git
         listgen_success = cls.dashboard_page.click_list_generator()
@@ -90,24 +57,23 @@ class TestGenerateWithAi:
     @classmethod
     def teardown_class(cls):
         """Tüm testler bitince tek sefer çalışır"""
-        print("\n=== CLASS TEARDOWN: Driver kapatılıyor ===")
+        print("\n=== CLASS TEARDOWN: Driver havuza iade ediliyor ===")
         if hasattr(cls, 'driver'):
-            cls.driver.quit()
+            DriverPool.instance().release(cls.driver)
 
     def setup_method(self, method):
         """Her test öncesi çalışır - SADECE TEST-SPECIFIC SETUP"""
         print(f"\n--- Test başlıyor: {method.__name__} ---")
 
         # Test data - her test için unique değerler
-        timestamp = int(time.time())
-        self.test_list_name = f"{self.TEST_LIST_NAME}_{timestamp}"
+        self.test_list_name = unique_name(self.TEST_LIST_NAME)
 
         # List Generator sayfasında olduğumuzu kontrol et
         current_url = self.driver.current_url
         if "list-generator" not in current_url:
             print("List Generator sayfasına yönlendiriliyor...")
             self.dashboard_page.click_list_generator()
-            time.sleep(1)
+            self.create_lg_page.wait_until_idle(1)
 
     def teardown_method(self, method):
         """Her test sonrası çalışır - SADECE TEST CLEANUP"""
@@ -115,11 +81,7 @@ class TestGenerateWithAi:
 
         # Modal varsa kapat
         try:
-            cancel_buttons = self.driver.find_elements(By.XPATH, "//span[text()='CANCEL']")
-            for button in cancel_buttons:
-                if button.is_displayed():
-                    button.click()
-                    time.sleep(0.5)
+            self.create_lg_page.dismiss_dialogs(("CANCEL",))
         except:
             pass
 
@@ -132,14 +94,26 @@ class TestGenerateWithAi:
     def _cleanup_test_data(self):
         """Test verilerini temizle"""
         try:
-            # Oluşturulan liste'yi sil
-            page_source = self.driver.page_source
-            if hasattr(self, 'test_list_name') and self.test_list_name in page_source:
+            # Oluşturulan liste'yi sil (hangi sayfada olursa olsun)
+            table = self.listgen_page.table
+            if hasattr(self, 'test_list_name') and table.contains(self.test_list_name):
                 self.listgen_page.click_deletelist_andconfirm_button(self.test_list_name)
-                time.sleep(1)
+                self.create_lg_page.wait_until_idle(1)
+            table.clear_search()
         except:
             pass
 
+    def _assert_validate_disabled(self, empty_field, label):
+        """Form durumunu tek seferde oku: sadece empty_field boş, diğer alanlar dolu ve VALIDATE disabled"""
+        form = self.create_lg_page.get_ai_form_state()
+        assert not form[empty_field]["value"], f"{label} field boş olmalıydı"
+        empty_others = [field for field in AI_FORM_FIELDS if field != empty_field and not form[field]["value"]]
+        assert not empty_others, f"Doldurulan alanlar boş görünüyor: {empty_others}"
+
+        validate_enabled = form["validate"]["enabled"]
+        print(f"VALIDATE butonu durumu: {'Aktif' if validate_enabled else 'Disabled'}")
+        assert not validate_enabled, f"{label} boş olduğu için VALIDATE butonu disabled olmalıydı"
+
     def test_TC093_empty_name_generate_with_ai(self):
         """TC093: Name boş bırakma - Generate with AI - Name boş iken VALIDATE disabled"""
         print("\nTC093: Name boş bırakma - Generate with AI testi ===")
@@ -147,12 +121,12 @@ class TestGenerateWithAi:
         # NEW butonuna tıkla
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Generate with AI tab'ına git
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         # Name field'ını boş bırak
         print("Name field boş bırakılıyor")
@@ -182,11 +156,8 @@ class TestGenerateWithAi:
         assert prompt_entered, "Prompt girilemedi"
         print("Prompt girildi")
 
-        # VALIDATE butonunun disabled olduğunu kontrol et
-        validate_enabled = self.create_lg_page.is_validate_button_enabled()
-        print(f"VALIDATE butonu durumu: {'Aktif' if validate_enabled else 'Disabled'}")
-
-        assert not validate_enabled, "Name boş olduğu için VALIDATE butonu disabled olmalıydı"
+        # Sadece Name boş, VALIDATE disabled olmalı
+        self._assert_validate_disabled("name", "Name")
 
         # Name required error mesajı var mı kontrol et
         page_source = self.driver.page_source
@@ -206,11 +177,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -229,10 +200,8 @@ class TestGenerateWithAi:
         prompt_entered = self.create_lg_page.enter_prompt("Generate a list of popular car brands")
         assert prompt_entered, "Prompt girilemedi"
 
-        validate_enabled = self.create_lg_page.is_validate_button_enabled()
-        print(f"VALIDATE butonu durumu: {'Aktif' if validate_enabled else 'Disabled'}")
-
-        assert not validate_enabled, "Max Count boş olduğu için VALIDATE butonu disabled olmalıydı"
+        # Sadece Max Count boş, VALIDATE disabled olmalı
+        self._assert_validate_disabled("max_count", "Max Count")
 
         print("Test BAŞARILI: Max Count boş iken VALIDATE disabled")
 
@@ -242,11 +211,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -265,10 +234,8 @@ class TestGenerateWithAi:
         prompt_entered = self.create_lg_page.enter_prompt("Generate a list of popular car brands")
         assert prompt_entered, "Prompt girilemedi"
 
-        validate_enabled = self.create_lg_page.is_validate_button_enabled()
-        print(f"VALIDATE butonu durumu: {'Aktif' if validate_enabled else 'Disabled'}")
-
-        assert not validate_enabled, "API URL boş olduğu için VALIDATE butonu disabled olmalıydı"
+        # Sadece API URL boş, VALIDATE disabled olmalı
+        self._assert_validate_disabled("api_url", "API URL")
 
         print("Test BAŞARILI: API URL boş iken VALIDATE disabled")
 
@@ -278,11 +245,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -301,10 +268,8 @@ class TestGenerateWithAi:
         prompt_entered = self.create_lg_page.enter_prompt("Generate a list of popular car brands")
         assert prompt_entered, "Prompt girilemedi"
 
-        validate_enabled = self.create_lg_page.is_validate_button_enabled()
-        print(f"VALIDATE butonu durumu: {'Aktif' if validate_enabled else 'Disabled'}")
-
-        assert not validate_enabled, "API Key boş olduğu için VALIDATE butonu disabled olmalıydı"
+        # Sadece API Key boş, VALIDATE disabled olmalı
+        self._assert_validate_disabled("api_key", "API Key")
 
         print("Test BAŞARILI: API Key boş iken VALIDATE disabled")
 
@@ -315,11 +280,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -338,10 +303,8 @@ class TestGenerateWithAi:
         prompt_entered = self.create_lg_page.enter_prompt("Generate a list of popular car brands")
         assert prompt_entered, "Prompt girilemedi"
 
-        validate_enabled = self.create_lg_page.is_validate_button_enabled()
-        print(f"VALIDATE butonu durumu: {'Aktif' if validate_enabled else 'Disabled'}")
-
-        assert not validate_enabled, "Model Name boş olduğu için VALIDATE butonu disabled olmalıydı"
+        # Sadece Model Name boş, VALIDATE disabled olmalı
+        self._assert_validate_disabled("model_name", "Model Name")
 
         print("Test BAŞARILI: Model Name boş iken VALIDATE disabled")
 
@@ -351,11 +314,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -374,10 +337,8 @@ class TestGenerateWithAi:
 
         print("Prompt field boş bırakılıyor")
 
-        validate_enabled = self.create_lg_page.is_validate_button_enabled()
-        print(f"VALIDATE butonu durumu: {'Aktif' if validate_enabled else 'Disabled'}")
-
-        assert not validate_enabled, "Prompt boş olduğu için VALIDATE butonu disabled olmalıydı"
+        # Sadece Prompt boş, VALIDATE disabled olmalı
+        self._assert_validate_disabled("prompt", "Prompt")
 
         print("Test BAŞARILI: Prompt boş iken VALIDATE disabled")
 
@@ -388,11 +349,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -430,11 +391,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -465,11 +426,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -502,7 +463,7 @@ class TestGenerateWithAi:
         if validate_enabled:
             validate_clicked = self.create_lg_page.click_validate_button()
             if validate_clicked:
-                time.sleep(3)
+                self.create_lg_page.wait_until_idle(3)
                 print("VALIDATE başarılı")
 
                 # SAVE aktif mi kontrol et
@@ -511,7 +472,7 @@ class TestGenerateWithAi:
                     print("SAVE aktif - büyük Max Count kabul edildi")
                     save_clicked = self.create_lg_page.click_save_button_db_ai()
                     if save_clicked:
-                        time.sleep(2)
+                        self.create_lg_page.wait_until_idle(2)
                         print("Test BAŞARILI: Büyük Max Count ile liste oluşturuldu")
                 else:
                     print("SAVE disabled - büyük Max Count reddedildi")
@@ -526,11 +487,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -556,7 +517,7 @@ class TestGenerateWithAi:
         if validate_enabled:
             validate_clicked = self.create_lg_page.click_validate_button()
             if validate_clicked:
-                time.sleep(3)
+                self.create_lg_page.wait_until_idle(3)
                 print("VALIDATE başarılı")
 
                 # SAVE aktif mi kontrol et
@@ -565,7 +526,7 @@ class TestGenerateWithAi:
                     print("SAVE aktif - invalid URL kabul edildi")
                     save_clicked = self.create_lg_page.click_save_button_db_ai()
                     if save_clicked:
-                        time.sleep(2)
+                        self.create_lg_page.wait_until_idle(2)
                         print("Test BAŞARILI: Invalid URL ile liste oluşturuldu")
                 else:
                     print("SAVE disabled - invalid URL reddedildi")
@@ -580,11 +541,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -610,7 +571,7 @@ class TestGenerateWithAi:
         if validate_enabled:
             validate_clicked = self.create_lg_page.click_validate_button()
             if validate_clicked:
-                time.sleep(3)
+                self.create_lg_page.wait_until_idle(3)
                 print("VALIDATE başarılı")
 
                 # SAVE aktif mi kontrol et
@@ -619,7 +580,7 @@ class TestGenerateWithAi:
                     print("SAVE aktif - invalid API key kabul edildi")
                     save_clicked = self.create_lg_page.click_save_button_db_ai()
                     if save_clicked:
-                        time.sleep(2)
+                        self.create_lg_page.wait_until_idle(2)
                         print("Test BAŞARILI: Invalid API key ile liste oluşturuldu")
                 else:
                     print("SAVE disabled - invalid API key reddedildi")
@@ -634,11 +595,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -666,7 +627,7 @@ class TestGenerateWithAi:
         if validate_enabled:
             validate_clicked = self.create_lg_page.click_validate_button()
             if validate_clicked:
-                time.sleep(5)
+                self.create_lg_page.wait_until_idle(5)
                 print("VALIDATE başarılı")
 
                 # SAVE aktif mi kontrol et
@@ -675,7 +636,7 @@ class TestGenerateWithAi:
                     print("SAVE aktif - uzun prompt kabul edildi")
                     save_clicked = self.create_lg_page.click_save_button_db_ai()
                     if save_clicked:
-                        time.sleep(3)
+                        self.create_lg_page.wait_until_idle(3)
                         print("Test BAŞARILI: Uzun prompt ile liste oluşturuldu")
                 else:
                     print("SAVE disabled - uzun prompt reddedildi")
@@ -690,11 +651,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -721,7 +682,7 @@ class TestGenerateWithAi:
         if validate_enabled:
             validate_clicked = self.create_lg_page.click_validate_button()
             if validate_clicked:
-                time.sleep(3)
+                self.create_lg_page.wait_until_idle(3)
                 print("VALIDATE başarılı")
 
                 # SAVE aktif mi kontrol et
@@ -730,7 +691,7 @@ class TestGenerateWithAi:
                     print("SAVE aktif - özel karakterli prompt kabul edildi")
                     save_clicked = self.create_lg_page.click_save_button_db_ai()
                     if save_clicked:
-                        time.sleep(2)
+                        self.create_lg_page.wait_until_idle(2)
                         print("Test BAŞARILI: Özel karakterli prompt ile liste oluşturuldu")
                 else:
                     print("SAVE disabled - özel karakterli prompt reddedildi")
@@ -745,11 +706,11 @@ class TestGenerateWithAi:
 
         new_clicked = self.listgen_page.click_newlist()
         assert new_clicked, "NEW butonuna tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         tab_clicked = self.create_lg_page.click_generate_with_ai_tab()
         assert tab_clicked, "Generate with AI tab'ına tıklanamadı"
-        time.sleep(1)
+        self.create_lg_page.wait_until_idle(1)
 
         name_entered = self.create_lg_page.enter_name(self.test_list_name)
         assert name_entered, "Name girilemedi"
@@ -776,7 +737,7 @@ class TestGenerateWithAi:
         if validate_enabled:
             validate_clicked = self.create_lg_page.click_validate_button()
             if validate_clicked:
-                time.sleep(3)
+                self.create_lg_page.wait_until_idle(3)
                 print("VALIDATE başarılı")
 
                 # SAVE aktif mi kontrol et
@@ -785,7 +746,7 @@ class TestGenerateWithAi:
                     print("SAVE aktif - SQL injection prompt kabul edildi")
                     save_clicked = self.create_lg_page.click_save_button_db_ai()
                     if save_clicked:
-                        time.sleep(2)
+                        self.create_lg_page.wait_until_idle(2)
                         print("Test BAŞARILI: SQL injection prompt ile liste oluşturuldu")
                 else:
                     print("SAVE disabled - SQL injection prompt reddedildi")
@@ -0,0 +1,177 @@
+import os
+import time
+
+import pytest
+from dotenv import load_dotenv
+from tdm_automation.Pages.tdm_dashboard_page import TDMDashboardPage
+from tdm_automation.Pages.list_generator_page import ListGeneratorPage
+from tdm_automation.Pages.create_list_generator_page import CreateListGenerator
+from tdm_automation.Utils import data_files
+from tdm_automation.Utils.data_files import DataFileRegistry, GeneratedCsvSpec, SEPARATORS
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.namespace import unique_name
+from tdm_automation.Utils.session_cache import SessionCache
+
+load_dotenv()
+
+# Dosyalar ilk koşuda üretilip DATA_FILES_DIR altında saklanır (2GB ~2 dk):
+# LARGE_UPLOAD=true LARGE_UPLOAD_TIERS=10MB,100MB pytest tdm_automation/Tests/test_large_file_upload.py -s
+LARGE_UPLOAD = os.getenv('LARGE_UPLOAD', 'false').lower() == 'true'
+LARGE_UPLOAD_TIERS = [tier.strip() for tier in os.getenv('LARGE_UPLOAD_TIERS', '10MB,100MB,500MB,2GB').split(',')]
+LARGE_UPLOAD_TIMEOUT = int(os.getenv('LARGE_UPLOAD_TIMEOUT', '1200'))
+
+
+@pytest.mark.tdm
+@pytest.mark.skipif(not LARGE_UPLOAD, reason="LARGE_UPLOAD=true ile çalışır (büyük dosya üretir)")
+class TestLargeFileUpload:
+
+    @classmethod
+    def setup_class(cls):
+        """Login ve List Generator'e navigation tek sefer"""
+        print("\n=== CLASS SETUP: Login işlemleri yapılıyor ===")
+
+        cls.BASE_URL = os.getenv('BASE_URL')
+        cls.VALID_USERNAME = os.getenv('VALID_USERNAME')
+        cls.VALID_PASSWORD = os.getenv('VALID_PASSWORD')
+        cls.TEST_LIST_NAME = os.getenv('TEST_LIST_NAME', 'ListName')
+
+        cls.driver = DriverPool.instance().acquire()
+
+        cls.dashboard_page = TDMDashboardPage(cls.driver)
+        cls.listgen_page = ListGeneratorPage(cls.driver)
+        cls.create_lg_page = CreateListGenerator(cls.driver)
+
+        cls.data_files = data_files.registry()
+
+        session_cache = SessionCache(cls.VALID_USERNAME, cls.VALID_PASSWORD, cls.BASE_URL)
+        tdm_success = session_cache.open_tdm(cls.driver)
+        assert tdm_success, "TDM oturumu açılamadı"
+
+        listgen_success = cls.dashboard_page.click_list_generator()
+        assert listgen_success, "List Generator butonuna tıklanamadı"
+
+        print("=== CLASS SETUP TAMAMLANDI: Login ve navigation başarılı ===")
+
+    @classmethod
+    def teardown_class(cls):
+        print("\n=== CLASS TEARDOWN: Driver havuza iade ediliyor ===")
+        if hasattr(cls, 'driver'):
+            DriverPool.instance().release(cls.driver)
+
+    def setup_method(self, method):
+        print(f"\n--- Test başlıyor: {method.__name__} ---")
+        self.test_list_name = unique_name(self.TEST_LIST_NAME)
+
+        if "list-generator" not in self.driver.current_url:
+            print("List Generator sayfasına yönlendiriliyor...")
+            self.dashboard_page.click_list_generator()
+            self.create_lg_page.wait_until_idle(1)
+
+    def teardown_method(self, method):
+        print(f"--- Test bitti: {method.__name__} ---")
+
+        try:
+            self.create_lg_page.dismiss_dialogs(("CANCEL",))
+        except:
+            pass
+
+        try:
+            self._cleanup_test_data()
+        except:
+            pass
+
+    def _cleanup_test_data(self):
+        """Oluşturulan listeyi sil (best effort)"""
+        table = self.listgen_page.table
+        if table.contains(self.test_list_name):
+            self.listgen_page.click_deletelist_andconfirm_button(self.test_list_name)
+            self.create_lg_page.wait_until_idle(1)
+        table.clear_search()
+
+    def _upload_and_save(self, spec, record_property):
+        """NEW -> Create From File -> upload -> separator -> SAVE; aşama süreleri (sn)"""
+        path = self.data_files.path(self.data_files.register(spec).name)
+        size_mb = os.path.getsize(path) / 1024 ** 2
+        print(f"{spec.name}: {size_mb:.1f} MB, separator={spec.separator}")
+
+        assert self.listgen_page.click_newlist(), "NEW butonuna tıklanamadı"
+        self.create_lg_page.wait_until_idle(1)
+        assert self.create_lg_page.click_create_from_file_tab(), "Create From File tab'ına tıklanamadı"
+        self.create_lg_page.wait_until_idle(1)
+        assert self.create_lg_page.enter_name(self.test_list_name), "Liste adı girilemedi"
+
+        start = time.perf_counter()
+        assert self.create_lg_page.upload_file(path), "Dosya upload edilemedi"
+        assert self.create_lg_page.wait_for_upload(spec.name, timeout=LARGE_UPLOAD_TIMEOUT), \
+            "Upload tamamlanmadı"
+        uploaded = time.perf_counter()
+
+        assert self.create_lg_page.select_separator(spec.separator), f"{spec.separator} separator seçilemedi"
+        selected = time.perf_counter()
+        assert self.create_lg_page.click_save_button_new_file(), "SAVE butonuna tıklanamadı"
+        assert self.create_lg_page.wait_for_network_idle(timeout=LARGE_UPLOAD_TIMEOUT), "SAVE isteği bitmedi"
+        saved = time.perf_counter()
+
+        timings = {"size_mb": round(size_mb, 1), "upload_s": round(uploaded - start, 2),
+                   "save_s": round(saved - selected, 2), "total_s": round(saved - start, 2)}
+        for key, value in timings.items():
+            record_property(key, value)
+        print(f"Upload: {timings['upload_s']} sn, SAVE: {timings['save_s']} sn, "
+              f"toplam: {timings['total_s']} sn ({size_mb / max(saved - start, 1e-6):.1f} MB/sn)")
+
+        content = self.create_lg_page.read_content()
+        assert not content.mentions("file too large", "payload too large", "413"), \
+            f"{size_mb:.0f} MB dosya boyut limitine takıldı"
+        return timings
+
+    @pytest.mark.parametrize("size", LARGE_UPLOAD_TIERS)
+    def test_TC171_large_csv_upload_tiers(self, size, record_property):
+        """TC171: Boyut kademelerinde (10MB-2GB) CSV yükleme - upload'tan SAVE bitişine kadar süre ölçülür"""
+        print(f"\nTC171: {size} CSV yükleme testi ===")
+        self._upload_and_save(GeneratedCsvSpec(f"large_{size.lower()}.csv", size), record_property)
+        print(f"Test tamamlandı: {size} CSV yükleme")
+
+    @pytest.mark.parametrize("separator", list(SEPARATORS))
+    def test_TC172_large_csv_upload_separators(self, separator, record_property):
+        """TC172: En küçük kademede her separator ile CSV yükleme"""
+        size = LARGE_UPLOAD_TIERS[0]
+        print(f"\nTC172: {size} {separator} separator CSV yükleme testi ===")
+        spec = GeneratedCsvSpec(f"large_{size.lower()}_{separator}.csv", size, separator=separator)
+        self._upload_and_save(spec, record_property)
+        print(f"Test tamamlandı: {separator} separator")
+
+
+class TestGeneratedCsv:
+    """Üretilen büyük CSV dosyalarının yerel kontrolleri (tarayıcı gerekmez)"""
+
+    def test_TC173_generated_csv_size_and_separator(self, tmp_path):
+        """TC173: Üretilen dosya istenen boyutu aşmaz, satır sınırında biter ve her satırda aynı sayıda alan var"""
+        for name, separator in SEPARATORS.items():
+            spec = GeneratedCsvSpec(f"{name}.csv", "256KB", separator=name)
+            path = DataFileRegistry({spec.name: spec}, str(tmp_path)).path(spec.name)
+            with open(path, "rb") as f:
+                data = f.read()
+
+            assert spec.size - 256 < len(data) <= spec.size, f"{name}: {len(data)} byte"
+            assert data.endswith(b"\n")
+            lines = data.decode("utf-8").splitlines()
+            assert all(line.count(separator) == len(spec.columns) - 1 for line in lines), name
+            assert [line.split(separator)[0] for line in lines[1:4]] == ["1", "2", "3"]
+
+    def test_TC174_generated_csv_cached_by_spec(self, tmp_path):
+        """TC174: Aynı spec aynı dosyayı verir ve yeniden üretilmez; seed değişince içerik değişir"""
+        registry = DataFileRegistry({}, str(tmp_path))
+        first = registry.register(GeneratedCsvSpec("cached.csv", "64KB", seed=1))
+        path = registry.path(first.name)
+        mtime = os.stat(path).st_mtime_ns
+
+        other = DataFileRegistry({}, str(tmp_path))
+        other.register(GeneratedCsvSpec("cached.csv", "64KB", seed=1))
+        assert other.path("cached.csv") == path
+        assert os.stat(path).st_mtime_ns == mtime
+
+        other.register(GeneratedCsvSpec("cached.csv", "64KB", seed=2))
+        reseeded = other.path("cached.csv")
+        assert reseeded != path
+        with open(path, "rb") as f, open(reseeded, "rb") as g:
+            assert f.read() != g.read()
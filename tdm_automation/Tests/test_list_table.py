@@ -0,0 +1,52 @@
+import os
+import shutil
+
+import pytest
+
+from tdm_automation.Pages.base_page import BasePage
+from tdm_automation.Pages.list_table import ListTable
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.driver_resolver import CHROME_BINARIES
+from tdm_automation.Utils.mock_tdm import MockTdmServer
+
+# Yerel mock TDM sayfasında çalışır; Chrome kurulu değilse atlanır
+CHROME_AVAILABLE = any(shutil.which(binary) for binary in [os.getenv('CHROME_BINARY')] + CHROME_BINARIES if binary)
+
+# Satırın durum hücresindeki text node'u yeniden render etmeden değiştirir
+SET_STATUS_IN_PLACE = """
+var cell = document.querySelector("tr[data-row-key='" + arguments[0] + "'] td.status-cell");
+cell.firstChild.nodeValue = arguments[1];
+"""
+
+
+@pytest.mark.skipif(not CHROME_AVAILABLE, reason="Chrome bulunamadı (mock TDM sayfası tarayıcı gerektirir)")
+class TestListTableIndex:
+    """ListTable isim -> satır index'inin DOM değişikliklerini takip etmesi"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.server = MockTdmServer().start()
+        cls.driver = DriverPool.instance().acquire()
+
+    @classmethod
+    def teardown_class(cls):
+        DriverPool.instance().release(cls.driver)
+        cls.server.stop()
+
+    def setup_method(self, method):
+        self.driver.get(self.server.url())
+        BasePage(self.driver).wait_until_idle()
+        self.table = ListTable(self.driver)
+
+    def test_TC178_in_place_cell_text_change(self):
+        """TC178: Hücre metni yerinde değişince (satır yeniden render edilmeden) index'teki isimler güncellenir"""
+        row = self.table.row("Case_0001")
+        assert row is not None, "Case_0001 satırı bulunamadı"
+        assert "READY" in row.names
+
+        self.driver.execute_script(SET_STATUS_IN_PLACE, row.key, "RUNNING")
+
+        refreshed = self.table.row("Case_0001")
+        assert refreshed is row, "Satır yeniden okunmamalıydı (aynı element)"
+        assert "RUNNING" in refreshed.names and "READY" not in refreshed.names, \
+            f"Yerinde değişen hücre metni index'e yansımadı: {refreshed.names}"
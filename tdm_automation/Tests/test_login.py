@@ -2,12 +2,9 @@ import time
 import pytest
 import os
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 from tdm_automation.Pages.login_page import LoginPage
-from selenium.webdriver.chrome.options import Options
+from tdm_automation.Utils.driver_pool import DriverPool
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
@@ -26,44 +23,14 @@ class TestLoginScenarios:
         self.INVALID_PASSWORD = os.getenv('INVALID_PASSWORD')
         self.TIMEOUT = int(os.getenv('TIMEOUT', '10'))
 
-        # Environment değişkenlerini al
-        self.HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
-        self.DOCKER_MODE = os.getenv('DOCKER_MODE', 'false').lower() == 'true'
-
-        # Chrome options - Docker ve headless için optimize edilmiş
-        self.chrome_options = Options()
-
-        if self.HEADLESS:
-            self.chrome_options.add_argument("--headless")
-            print("HEADLESS modda çalışıyor")
-
-        if self.DOCKER_MODE:
-            # Docker için gerekli argumentlar
-            self.chrome_options.add_argument("--no-sandbox")
-            self.chrome_options.add_argument("--disable-dev-shm-usage")
-            self.chrome_options.add_argument("--disable-gpu")
-            self.chrome_options.add_argument("--remote-debugging-port=9222")
-            self.chrome_options.add_argument("--incognito")
-
-            print("DOCKER modda çalışıyor")
-        else:
-            # Local development için
-            self.chrome_options.add_argument("--incognito")
-
-        # Genel performans ayarları
-        self.chrome_options.add_argument("--window-size=1920,1080")
-        self.chrome_options.add_argument("--disable-web-security")
-        self.chrome_options.add_argument("--ignore-certificate-errors")
-
-        # WebDriver kurulumu
-        self.service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=self.service,options=self.chrome_options)
+        # WebDriver havuzdan kiralanır (session boyunca açık kalır)
+        self.driver = DriverPool.instance().acquire()
         self.login_page = LoginPage(self.driver)
 
 
     def teardown_method(self):
         """Her test sonrası çalışır"""
-        self.driver.quit()
+        DriverPool.instance().release(self.driver)
 
     def test_TC001_login_empty_fields(self):
         """TC_001: Bütün alanlar boş"""
@@ -1,11 +1,7 @@
-import time
 import pytest
 import os
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 from tdm_automation.Pages.login_page import LoginPage
 from tdm_automation.Pages.tdm_dashboard_page import TDMDashboardPage
 from tdm_automation.Pages.application_management_page import AppManagementPage
@@ -18,13 +14,16 @@ from tdm_automation.Pages.data_generation_case_page import DataCasePage
 from tdm_automation.Pages.synthetic_flow_list_page import SyntheticFlowListPage
 from tdm_automation.Pages.create_synthetic_flow_page import CreateFlowPage
 from tdm_automation.Pages.synthetic_flow_edit_page import FlowEditPage
-from selenium.webdriver.chrome.options import Options
+from tdm_automation.Utils.driver_pool import DriverPool
+from tdm_automation.Utils.namespace import unique_name
+from tdm_automation.Utils.session_cache import SessionCache
 
 
 
 load_dotenv()
 
 
+@pytest.mark.tdm
 class TestSyntheticFlow:
 
     @classmethod
@@ -37,43 +36,14 @@ class TestSyntheticFlow:
         cls.VALID_USERNAME = os.getenv('VALID_USERNAME')
         cls.VALID_PASSWORD = os.getenv('VALID_PASSWORD')
         cls.TIMEOUT = int(os.getenv('TIMEOUT', '10'))
+        # Sonucu belirsiz SAVE'lerde (sayfa değişmeyebilir, hata da çıkmayabilir) bekleme üst sınırı
+        cls.SAVE_FEEDBACK_TIMEOUT = int(os.getenv('SAVE_FEEDBACK_TIMEOUT', '25'))
 
         # Test data environment değişkenleri
         cls.FLOW_NAME = os.getenv('FLOW_NAME', 'FlowName')
 
-        # Environment değişkenlerini al
-        cls.HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
-        cls.DOCKER_MODE = os.getenv('DOCKER_MODE', 'false').lower() == 'true'
-
-        # Chrome options - Docker ve headless için optimize edilmiş
-        cls.chrome_options = Options()
-
-        if cls.HEADLESS:
-            cls.chrome_options.add_argument("--headless")
-            print("HEADLESS modda çalışıyor")
-
-        if cls.DOCKER_MODE:
-            # Docker için gerekli argumentlar
-            cls.chrome_options.add_argument("--no-sandbox")
-            cls.chrome_options.add_argument("--disable-dev-shm-usage")
-            cls.chrome_options.add_argument("--disable-gpu")
-            cls.chrome_options.add_argument("--remote-debugging-port=9222")
-            cls.chrome_options.add_argument("--incognito")
-
-            print("DOCKER modda çalışıyor")
-        else:
-            # Local development için
-            cls.chrome_options.add_argument("--incognito")
-
-        # Genel performans ayarları
-        cls.chrome_options.add_argument("--window-size=1920,1080")
-        cls.chrome_options.add_argument("--disable-web-security")
-        cls.chrome_options.add_argument("--ignore-certificate-errors")
-
-        # WebDriver kurulumu
-        cls.service = Service(ChromeDriverManager().install())
-        cls.driver = webdriver.Chrome(service=cls.service, options=cls.chrome_options)
-        cls.driver.maximize_window()
+        # WebDriver havuzdan kiralanır (session boyunca açık kalır)
+        cls.driver = DriverPool.instance().acquire()
 
         # Page object'leri oluştur
         cls.login_page = LoginPage(cls.driver)
@@ -91,14 +61,10 @@ class TestSyntheticFlow:
 
 
         # *** TEK SEFERLİK LOGIN İŞLEMLERİ ***
-        cls.driver.get(cls.BASE_URL)
-        login_success = cls.login_page.do_login(cls.VALID_USERNAME, cls.VALID_PASSWORD)
-        assert login_success, "Login başarısız!"
-
-        # TDM'ye git
-        tdm_locator = (By.XPATH, "//li[@title='New Test Data Manager'][2]")
-        tdm_success = cls.login_page.click_element(tdm_locator)
-        assert tdm_success, "TDM elementine tıklanamadı"
+        # Cache'te geçerli oturum varsa enjekte edilir, yoksa UI'dan login olunur
+        session_cache = SessionCache(cls.VALID_USERNAME, cls.VALID_PASSWORD, cls.BASE_URL)
+        tdm_success = session_cache.open_tdm(cls.driver)
+        assert tdm_success, "TDM oturumu açılamadı"
 
         # Syn Flowa git
         datacase_success = cls.dashboard_page.click_syn_flow()
@@ -109,58 +75,33 @@ class TestSyntheticFlow:
     @classmethod
     def teardown_class(cls):
         """Tüm testler bitince tek sefer çalışır"""
-        print("\n=== CLASS TEARDOWN: Driver kapatılıyor ===")
+        print("\n=== CLASS TEARDOWN: Driver havuza iade ediliyor ===")
         if hasattr(cls, 'driver'):
-            cls.driver.quit()
+            DriverPool.instance().release(cls.driver)
 
     def setup_method(self, method):
         """Her test öncesi çalışır - SADECE TEST-SPECIFIC SETUP"""
         print(f"\n--- Test başlıyor: {method.__name__} ---")
 
         # Test data - her test için unique değerler
-        timestamp = int(time.time())
-        self.test_flow_name = f"{self.FLOW_NAME}_{timestamp}"
+        self.test_flow_name = unique_name(self.FLOW_NAME)
 
         # Synthetic Flow sayfasında olduğumuzu kontrol et
         current_url = self.driver.current_url
         if "synthetic-flow" not in current_url:
             print("Synthetic Flow sayfasına yönlendiriliyor...")
             self.dashboard_page.click_syn_flow()
-            time.sleep(1)
+            self.synflowlist.wait_until_idle(1)
 
     def teardown_method(self, method):
         """Her test sonrası çalışır - Açık modal veya sayfaları sırayla kapatır"""
         print(f"--- Test bitti: {method.__name__} ---")
 
         try:
-            while True:
-                action_taken = False
-
-                # CANCEL butonlarına sırayla bas
-                cancel_buttons = self.driver.find_elements(By.XPATH, "//span[text()='CANCEL']")
-                for button in cancel_buttons:
-                    if button.is_displayed():
-                        self.datagcase_page.click_element((By.XPATH, "//span[text()='CANCEL']"))
-                        time.sleep(0.5)
-                        print("Modal CANCEL ile kapatıldı")
-                        action_taken = True
-                        break  # Bastıktan sonra tekrar başa dön
-
-                if action_taken:
-                    continue
-
-                # BACK butonlarına sırayla bas
-                back_buttons = self.driver.find_elements(By.XPATH, "//span[text()='BACK']")
-                for button in back_buttons:
-                    if button.is_displayed():
-                        self.datagcase_page.click_element((By.XPATH, "//span[text()='BACK']"))
-                        time.sleep(0.5)
-                        print("Sayfa BACK ile kapatıldı")
-                        action_taken = True
-                        break
-
-                if not action_taken:
-                    break  # CANCEL veya BACK bulunamadıysa çık
+            # CANCEL/BACK butonlarına kalmayana kadar sırayla bas
+            closed = self.synflowlist.dismiss_dialogs(("CANCEL", "BACK"), max_steps=10)
+            for label in closed:
+                print(f"Açık ekran {label} ile kapatıldı")
 
             # En üste scroll yap
             self.driver.execute_script("window.scrollTo(0, 0);")
@@ -178,9 +119,9 @@ class TestSyntheticFlow:
         assert new_clicked, "NEW butonuna tıklanamadı"
 
         # Modal açıldığını kontrol et
-        time.sleep(1)
-        page_source = self.driver.page_source
-        modal_opened = "environment" in page_source.lower() and "schema" in page_source.lower()
+        self.synflowlist.wait_until_idle(1)
+        content = self.synflowlist.read_content()
+        modal_opened = content.modal_open and content.contains("environment", case_sensitive=False) and content.contains("schema", case_sensitive=False)
 
         print(f"Modal açıldı mı: {'Evet' if modal_opened else 'Hayır'}")
         assert modal_opened, "Create flow modal açılmadı"
@@ -199,7 +140,7 @@ class TestSyntheticFlow:
         env_selected = self.createsynflow.select_env("AAAdene")
         assert env_selected, "Environment seçilemedi"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Schema seç ve transfer et
         schema_clicked = self.createsynflow.click_schema()
@@ -208,7 +149,7 @@ class TestSyntheticFlow:
         transfer_clicked = self.createsynflow.click_transferschema()
         assert transfer_clicked, "Schema transfer edilemedi"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # Table seç ve transfer et
         table_clicked = self.createsynflow.click_table()
@@ -241,10 +182,10 @@ class TestSyntheticFlow:
         assert name_entered, "Flow name girilemedi"
 
         # Environment seçmeden schema bölümünü kontrol et
-        page_source = self.driver.page_source
+        content = self.synflowlist.read_content()
 
         # Schema bölümünde "No data" olmalı veya schema listesi boş olmalı
-        schema_disabled = "No data" in page_source or "0 item" in page_source
+        schema_disabled = content.has_empty_state or content.contains("0 item")
 
         print(f"Schema bölümü disabled mi: {'Evet' if schema_disabled else 'Hayır'}")
 
@@ -252,11 +193,11 @@ class TestSyntheticFlow:
         env_selected = self.createsynflow.select_env("AAAdene")
         assert env_selected, "Environment seçilemedi"
 
-        time.sleep(2)  # Schema yüklenmesi için bekle
+        self.synflowlist.wait_until_idle(2)  # Schema yüklenmesi için bekle
 
         # Şimdi schema bölümü aktif olmalı
-        page_source_after = self.driver.page_source
-        schema_active = "schema_1" in page_source_after and "10 items" in page_source_after
+        content_after = self.synflowlist.read_content()
+        schema_active = content_after.contains("schema_1") and content_after.contains("10 items")
 
         print(f"Environment seçtikten sonra schema aktif mi: {'Evet' if schema_active else 'Hayır'}")
         assert schema_active, "Environment seçtikten sonra schema aktif olmadı"
@@ -279,7 +220,7 @@ class TestSyntheticFlow:
         env_selected = self.createsynflow.select_env("AAAdene")
         assert env_selected, "Environment seçilemedi"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Schema seç ve transfer et
         schema_clicked = self.createsynflow.click_schema()
@@ -288,7 +229,7 @@ class TestSyntheticFlow:
         transfer_clicked = self.createsynflow.click_transferschema()
         assert transfer_clicked, "Schema transfer edilemedi"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # Table seç ve transfer et
         table_clicked = self.createsynflow.click_table()
@@ -301,10 +242,10 @@ class TestSyntheticFlow:
         save_clicked = self.createsynflow.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        # Flow oluşturulduğunu kontrol et
-        time.sleep(2)
-        page_source = self.driver.page_source
-        flow_created = self.test_flow_name in page_source
+        # Kaydın bitmesini bekle, flow oluşturulduğunu kontrol et
+        saved = self.createsynflow.wait_for_save()
+        assert saved.succeeded, f"Flow kaydı tamamlanmadı: {saved.state}"
+        flow_created = self.synflowlist.table.contains(self.test_flow_name)
 
         print(f"Flow oluşturuldu mu: {'Evet' if flow_created else 'Hayır'}")
         assert flow_created, f"Flow '{self.test_flow_name}' listede görünmüyor"
@@ -327,7 +268,7 @@ class TestSyntheticFlow:
         env_selected = self.createsynflow.select_env("AAAdene")
         assert env_selected, "Environment seçilemedi"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         schema_clicked = self.createsynflow.click_schema()
         assert schema_clicked, "Schema seçilemedi"
@@ -335,7 +276,7 @@ class TestSyntheticFlow:
         transfer_clicked = self.createsynflow.click_transferschema()
         assert transfer_clicked, "Schema transfer edilemedi"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         table_clicked = self.createsynflow.click_table()
         assert table_clicked, "Table seçilemedi"
@@ -346,16 +287,16 @@ class TestSyntheticFlow:
         save_clicked = self.createsynflow.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(30)
+        self.createsynflow.wait_for_save(timeout=self.SAVE_FEEDBACK_TIMEOUT)
 
         # Flow silme işlemi
         delete_clicked = self.synflowlist.click_deleteflow_andconfirm_button(self.test_flow_name)
         assert delete_clicked, "Delete işlemi başarısız"
 
         # Flow silindiğini kontrol et
-        time.sleep(15)
-        page_source = self.driver.page_source
-        flow_deleted = self.test_flow_name not in page_source
+        self.synflowlist.wait_until_idle(15)
+        content = self.synflowlist.read_content()
+        flow_deleted = not content.has_row(self.test_flow_name)
 
         print(f"Flow silindi mi: {'Evet' if flow_deleted else 'Hayır'}")
         assert flow_deleted, f"Flow '{self.test_flow_name}' listeden silinmedi"
@@ -373,7 +314,7 @@ class TestSyntheticFlow:
         table_config_clicked = self.synflowlist.click_tableconf(flow_name)
         assert table_config_clicked, "Table config butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Generate Count field'a 50000 gir
         count_entered = self.synflowedit.enter_generatecount("50000")
@@ -381,7 +322,7 @@ class TestSyntheticFlow:
 
         # Input'tan focus çık (blur event trigger et)
         self.driver.find_element(By.TAG_NAME, "body").click()
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # Generate Count'un otomatik olarak 30000'e düştüğünü kontrol et
         generate_count_element = self.driver.find_element(*self.synflowedit.GENERATECOUNT)
@@ -419,7 +360,7 @@ class TestSyntheticFlow:
         table_config_clicked = self.synflowlist.click_tableconf(flow_name)
         assert table_config_clicked, "Table config butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Generate Count field'a 0 gir
         count_entered = self.synflowedit.enter_generatecount("0")
@@ -427,7 +368,7 @@ class TestSyntheticFlow:
 
         # Input'tan focus çık (validation trigger et)
         self.driver.find_element(By.TAG_NAME, "body").click()
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # Save butonunun disabled olduğunu kontrol et
         try:
@@ -447,8 +388,8 @@ class TestSyntheticFlow:
                     validation_works = True
                 else:
                     # Hata mesajı kontrolü
-                    page_source = self.driver.page_source
-                    has_error = "error" in page_source.lower() or "minimum" in page_source.lower() or "invalid" in page_source.lower()
+                    content = self.synflowlist.read_content()
+                    has_error = content.mentions("error", "minimum", "invalid")
                     print(f"Hata mesajı var mı: {'Evet' if has_error else 'Hayır'}")
                     validation_works = has_error
 
@@ -473,35 +414,35 @@ class TestSyntheticFlow:
         table_config_clicked = self.synflowlist.click_tableconf(flow_name)
         assert table_config_clicked, "Table config butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Flow setting butonuna tıkla (Generation Rules sayfasına git)
         flow_setting_clicked = self.synflowedit.click_flowsetting()
         assert flow_setting_clicked, "Flow setting butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Herhangi bir column'un edit butonuna tıkla
         column_edit_clicked = self.synflowedit.click_colomnedit_button("email")
         assert column_edit_clicked, "Column edit butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # Şu anki generator type'ı kontrol et (StringGenerator olmalı)
-        page_source_before = self.driver.page_source
-        has_string_fields = "Min Chars" in page_source_before and "Max Chars" in page_source_before
+        content_before = self.synflowlist.read_content()
+        has_string_fields = content_before.has_label("Min Chars") and content_before.has_label("Max Chars")
         print(f"StringGenerator fields var mı: {'Evet' if has_string_fields else 'Hayır'}")
 
         # Generator Type'ı BooleanGenerator'a değiştir
         type_changed = self.synflowedit.select_type("BooleanGenerator")
         assert type_changed, "Generator Type değiştirilemedi"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # BooleanGenerator fields'ları kontrol et
-        page_source_after = self.driver.page_source
-        has_boolean_fields = "Truth Percentage" in page_source_after
-        has_string_fields_after = "Min Chars" in page_source_after and "Max Chars" in page_source_after
+        content_after = self.synflowlist.read_content()
+        has_boolean_fields = content_after.has_label("Truth Percentage")
+        has_string_fields_after = content_after.has_label("Min Chars") and content_after.has_label("Max Chars")
 
         print(f"BooleanGenerator fields var mı: {'Evet' if has_boolean_fields else 'Hayır'}")
         print(f"StringGenerator fields kaldı mı: {'Evet' if has_string_fields_after else 'Hayır'}")
@@ -528,29 +469,29 @@ class TestSyntheticFlow:
         table_config_clicked = self.synflowlist.click_tableconf(flow_name)
         assert table_config_clicked, "Table config butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Flow setting butonuna tıkla
         flow_setting_clicked = self.synflowedit.click_flowsetting()
         assert flow_setting_clicked, "Flow setting butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # String column'un edit butonuna tıkla
         column_edit_clicked = self.synflowedit.click_colomnedit_button("email")
         assert column_edit_clicked, "Column edit butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # StringGenerator olduğunu kontrol et
-        page_source = self.driver.page_source
-        is_string_gen = "Min Chars" in page_source and "Max Chars" in page_source
+        content = self.synflowlist.read_content()
+        is_string_gen = content.has_label("Min Chars") and content.has_label("Max Chars")
 
         if not is_string_gen:
             # StringGenerator'a değiştir
             type_changed = self.synflowedit.select_type("StringGenerator")
             assert type_changed, "StringGenerator seçilemedi"
-            time.sleep(1)
+            self.synflowlist.wait_until_idle(1)
 
         # Min: 20, Max: 10 gir (yanlış değerler) - Slow input ile
         min_entered = self.synflowedit.stringgen_enter_minchar("20")
@@ -563,14 +504,14 @@ class TestSyntheticFlow:
         save_clicked = self.synflowedit.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Hata mesajı kontrolü
-        page_source_after = self.driver.page_source
+        content_after = self.synflowlist.read_content()
         expected_error = "Max chars cannot be less min chars."
 
-        has_expected_error = expected_error in page_source_after
-        has_min_max_error = "minimum" in page_source_after.lower() and "maximum" in page_source_after.lower()
+        has_expected_error = content_after.mentions(expected_error)
+        has_min_max_error = content_after.mentions("minimum") and content_after.mentions("maximum")
         has_validation_error = has_expected_error or has_min_max_error
 
         print(f"Beklenen hata mesajı var mı: {'Evet' if has_expected_error else 'Hayır'}")
@@ -594,22 +535,22 @@ class TestSyntheticFlow:
         table_config_clicked = self.synflowlist.click_tableconf(flow_name)
         assert table_config_clicked, "Table config butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         flow_setting_clicked = self.synflowedit.click_flowsetting()
         assert flow_setting_clicked, "Flow setting butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         column_edit_clicked = self.synflowedit.click_colomnedit_button("email")
         assert column_edit_clicked, "Column edit butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # StringGenerator'a geç
         type_changed = self.synflowedit.select_type("StringGenerator")
         if type_changed:
-            time.sleep(1)
+            self.synflowlist.wait_until_idle(1)
 
         # Prefix ve Suffix gir
         prefix_entered = self.synflowedit.stringgen_enter_prefix("TEST_")
@@ -622,7 +563,7 @@ class TestSyntheticFlow:
         save_clicked = self.synflowedit.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         print("Test başarılı: Prefix/Suffix başarıyla kaydedildi")
 
@@ -641,7 +582,7 @@ class TestSyntheticFlow:
         env_selected = self.createsynflow.select_env("AAAdene")
         assert env_selected, "Environment seçilemedi"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         schema_clicked = self.createsynflow.click_schema()
         assert schema_clicked, "Schema seçilemedi"
@@ -649,7 +590,7 @@ class TestSyntheticFlow:
         transfer_clicked = self.createsynflow.click_transferschema()
         assert transfer_clicked, "Schema transfer edilemedi"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         table_clicked = self.createsynflow.click_table()
         assert table_clicked, "Table seçilemedi"
@@ -662,7 +603,7 @@ class TestSyntheticFlow:
         save_clicked = self.createsynflow.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(5)
+        self.synflowlist.wait_until_idle(5)
 
         url_after = self.driver.current_url
         page_changed = (url_before != url_after)
@@ -687,7 +628,7 @@ class TestSyntheticFlow:
         env_selected = self.createsynflow.select_env("AAAdene")
         assert env_selected, "Environment seçilemedi"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         schema_clicked = self.createsynflow.click_schema()
         assert schema_clicked, "Schema seçilemedi"
@@ -695,7 +636,7 @@ class TestSyntheticFlow:
         transfer_clicked = self.createsynflow.click_transferschema()
         assert transfer_clicked, "Schema transfer edilemedi"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         table_clicked = self.createsynflow.click_table()
         assert table_clicked, "Table seçilemedi"
@@ -709,7 +650,7 @@ class TestSyntheticFlow:
         save_clicked = self.createsynflow.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(20)  # Yeterli bekleme
+        self.createsynflow.wait_for_save(timeout=self.SAVE_FEEDBACK_TIMEOUT)
 
         url_after = self.driver.current_url
 
@@ -734,7 +675,7 @@ class TestSyntheticFlow:
         env_selected = self.createsynflow.select_env("AAAdene")
         assert env_selected, "Environment seçilemedi"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         schema_clicked = self.createsynflow.click_schema()
         assert schema_clicked, "Schema seçilemedi"
@@ -742,7 +683,7 @@ class TestSyntheticFlow:
         transfer_clicked = self.createsynflow.click_transferschema()
         assert transfer_clicked, "Schema transfer edilemedi"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         table_clicked = self.createsynflow.click_table()
         assert table_clicked, "Table seçilemedi"
@@ -755,7 +696,7 @@ class TestSyntheticFlow:
         save_clicked = self.createsynflow.click_save_button()
         assert save_clicked, "SAVE butonuna tıklanamadı"
 
-        time.sleep(20)
+        self.createsynflow.wait_for_save(timeout=self.SAVE_FEEDBACK_TIMEOUT)
 
         url_after = self.driver.current_url
         page_changed = (url_before != url_after)
@@ -763,9 +704,9 @@ class TestSyntheticFlow:
         print(f"Sayfa URL değişti mi? {'Evet' if page_changed else 'Hayır'}")
 
         # Hata mesajı kontrolü (karakter limiti ile ilgili)
-        page_source = self.driver.page_source.lower()
+        content = self.synflowlist.read_content()
         limit_errors = ["limit", "too long", "maximum", "character"]
-        has_limit_error = any(error in page_source for error in limit_errors)
+        has_limit_error = content.mentions(*limit_errors)
 
         print(f"Karakter limiti uyarısı var mı: {'Evet' if has_limit_error else 'Hayır'}")
 
@@ -782,7 +723,7 @@ class TestSyntheticFlow:
         assert new_clicked, "NEW butonuna tıklanamadı"
 
         # Bazı alanları doldur
-        test_name = f"RefreshTest_{int(time.time())}"
+        test_name = unique_name("RefreshTest")
         name_entered = self.createsynflow.enter_flowname(test_name)
         assert name_entered, "Flow name girilemedi"
 
@@ -791,11 +732,11 @@ class TestSyntheticFlow:
 
         # Browser refresh yap
         self.driver.refresh()
-        time.sleep(3)
+        self.synflowlist.wait_until_idle(3)
 
         # Modal kapandığını ve verilerin kaybolduğunu kontrol et
-        page_source = self.driver.page_source
-        data_lost = test_name not in page_source
+        content = self.synflowlist.read_content()
+        data_lost = not content.contains(test_name)
         back_to_list = "synthetic-flow" in self.driver.current_url
 
         print(f"Ana sayfaya döndü mü: {'Evet' if back_to_list else 'Hayır'}")
@@ -837,7 +778,7 @@ class TestSyntheticFlow:
         env_selected = self.createsynflow.select_env("AAAdene")
         assert env_selected, "Environment seçilemedi"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         schema_clicked = self.createsynflow.click_schema()
         assert schema_clicked, "Schema seçilemedi"
@@ -845,7 +786,7 @@ class TestSyntheticFlow:
         transfer_clicked = self.createsynflow.click_transferschema()
         assert transfer_clicked, "Schema transfer edilemedi"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         table_clicked = self.createsynflow.click_table()
         assert table_clicked, "Table seçilemedi"
@@ -856,12 +797,12 @@ class TestSyntheticFlow:
         # Save'e bas
         save_clicked = self.createsynflow.click_save_button()
 
-        time.sleep(25)
+        self.createsynflow.wait_for_save(timeout=self.SAVE_FEEDBACK_TIMEOUT)
 
         # Validation kontrolü
-        page_source = self.driver.page_source
+        content = self.synflowlist.read_content()
         required_errors = ["required", "empty", "blank", "invalid"]
-        has_required_error = any(error.lower() in page_source.lower() for error in required_errors)
+        has_required_error = content.mentions(*required_errors)
 
         print(f"Required validation hatası var mı: {'Evet' if has_required_error else 'Hayır'}")
 
@@ -882,7 +823,7 @@ class TestSyntheticFlow:
         env_selected = self.createsynflow.select_env("AAAdene")
         assert env_selected, "Environment seçilemedi"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         schema_clicked = self.createsynflow.click_schema()
         assert schema_clicked, "Schema seçilemedi"
@@ -890,7 +831,7 @@ class TestSyntheticFlow:
         transfer_clicked = self.createsynflow.click_transferschema()
         assert transfer_clicked, "Schema transfer edilemedi"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         table_clicked = self.createsynflow.click_table()
         assert table_clicked, "Table seçilemedi"
@@ -901,11 +842,11 @@ class TestSyntheticFlow:
         # Save'e bas
         save_clicked = self.createsynflow.click_save_button()
 
-        time.sleep(25)
+        self.createsynflow.wait_for_save(timeout=self.SAVE_FEEDBACK_TIMEOUT)
 
         # Unicode desteği kontrolü
-        page_source = self.driver.page_source
-        unicode_supported = unicode_name in page_source or "тест" in page_source
+        content = self.synflowlist.read_content()
+        unicode_supported = content.has_row(unicode_name) or content.has_row("тест")
 
         print(f"Unicode desteği var mı: {'Evet' if unicode_supported else 'Hayır'}")
 
@@ -920,23 +861,23 @@ class TestSyntheticFlow:
         table_config_clicked = self.synflowlist.click_tableconf(flow_name)
         assert table_config_clicked, "Table config butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         flow_setting_clicked = self.synflowedit.click_flowsetting()
         assert flow_setting_clicked, "Flow setting butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         column_edit_clicked = self.synflowedit.click_colomnedit_button("email")
         assert column_edit_clicked, "Column edit butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # BooleanGenerator'a geç
         type_changed = self.synflowedit.select_type("BooleanGenerator")
         assert type_changed, "BooleanGenerator seçilemedi"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # 150 (limit dışı) gir
         percentage_entered = self.synflowedit.boolean_truht_percentage("150")
@@ -945,12 +886,12 @@ class TestSyntheticFlow:
         # Save'e bas
         save_clicked = self.synflowedit.click_save_button()
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Percentage limit kontrolü
-        page_source = self.driver.page_source
+        content = self.synflowlist.read_content()
         limit_errors = ["0-100", "percentage", "limit", "range", "invalid"]
-        has_limit_error = any(error.lower() in page_source.lower() for error in limit_errors)
+        has_limit_error = content.mentions(*limit_errors)
 
         print(f"Percentage limit hatası var mı: {'Evet' if has_limit_error else 'Hayır'}")
 
@@ -972,18 +913,18 @@ class TestSyntheticFlow:
         table_config_clicked = self.synflowlist.click_tableconf(flow_name)
         assert table_config_clicked, "Table config butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         flow_setting_clicked = self.synflowedit.click_flowsetting()
         assert flow_setting_clicked, "Flow setting butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Alias edit butonuna tıkla
         alias_edit_clicked = self.synflowedit.click_colomnalias_button("email")
         assert alias_edit_clicked, "Alias edit butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # SQL injection denemesi
         sql_injection = "'; DROP TABLE users; --"
@@ -993,13 +934,13 @@ class TestSyntheticFlow:
         # Save'e bas
         save_clicked = self.synflowedit.click_save_button()
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # SQL injection koruması kontrolü
-        page_source = self.driver.page_source
+        content = self.synflowlist.read_content()
         security_errors = ["invalid", "error", "security", "not allowed"]
-        alias_saved = sql_injection in page_source
-        has_security_protection = any(error.lower() in page_source.lower() for error in security_errors)
+        alias_saved = content.contains(sql_injection)
+        has_security_protection = content.mentions(*security_errors)
 
         print(
             f"SQL injection koruması var mı: {'Evet' if has_security_protection else 'Yok' if alias_saved else 'Belirsiz'}")
@@ -1015,18 +956,18 @@ class TestSyntheticFlow:
         table_config_clicked = self.synflowlist.click_tableconf(flow_name)
         assert table_config_clicked, "Table config butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         flow_setting_clicked = self.synflowedit.click_flowsetting()
         assert flow_setting_clicked, "Flow setting butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Description edit butonuna tıkla
         desc_edit_clicked = self.synflowedit.click_colomndesc_button("email")
         assert desc_edit_clicked, "Description edit butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # Dangerous SQL
         dangerous_sql = "DELETE FROM important_table"
@@ -1036,13 +977,13 @@ class TestSyntheticFlow:
         # Save'e bas
         save_clicked = self.synflowedit.click_save_button()
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Dangerous SQL handling kontrolü
-        page_source = self.driver.page_source
+        content = self.synflowlist.read_content()
         security_handling = ["error", "invalid", "dangerous", "not allowed"]
-        desc_saved = dangerous_sql in page_source
-        has_security_handling = any(error.lower() in page_source.lower() for error in security_handling)
+        desc_saved = content.contains(dangerous_sql)
+        has_security_handling = content.mentions(*security_handling)
 
         print(
             f"Dangerous SQL handling var mı: {'Evet' if has_security_handling else 'Yok' if desc_saved else 'Belirsiz'}")
@@ -1058,22 +999,22 @@ class TestSyntheticFlow:
         table_config_clicked = self.synflowlist.click_tableconf(flow_name)
         assert table_config_clicked, "Table config butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         flow_setting_clicked = self.synflowedit.click_flowsetting()
         assert flow_setting_clicked, "Flow setting butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         column_edit_clicked = self.synflowedit.click_colomnedit_button("email")
         assert column_edit_clicked, "Column edit butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # StringGenerator'a geç
         type_changed = self.synflowedit.select_type("StringGenerator")
         if type_changed:
-            time.sleep(1)
+            self.synflowlist.wait_until_idle(1)
 
         # Min Chars: -5 gir
         min_entered = self.synflowedit.stringgen_enter_minchar("-5")
@@ -1082,12 +1023,12 @@ class TestSyntheticFlow:
         # Save'e bas
         save_clicked = self.synflowedit.click_save_button()
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Negative value validation kontrolü
-        page_source = self.driver.page_source
+        content = self.synflowlist.read_content()
         negative_errors = ["negative", "positive", "greater than", "minimum"]
-        has_negative_validation = any(error.lower() in page_source.lower() for error in negative_errors)
+        has_negative_validation = content.mentions(*negative_errors)
 
         print(f"Negative value validation var mı: {'Evet' if has_negative_validation else 'Hayır'}")
 
@@ -1109,22 +1050,22 @@ class TestSyntheticFlow:
         table_config_clicked = self.synflowlist.click_tableconf(flow_name)
         assert table_config_clicked, "Table config butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         flow_setting_clicked = self.synflowedit.click_flowsetting()
         assert flow_setting_clicked, "Flow setting butonuna tıklanamadı"
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         column_edit_clicked = self.synflowedit.click_colomnedit_button("email")
         assert column_edit_clicked, "Column edit butonuna tıklanamadı"
 
-        time.sleep(1)
+        self.synflowlist.wait_until_idle(1)
 
         # StringGenerator'a geç
         type_changed = self.synflowedit.select_type("StringGenerator")
         if type_changed:
-            time.sleep(1)
+            self.synflowlist.wait_until_idle(1)
 
         # Min ve Max Chars'ı boş bırak (mevcut değerleri sil)
         min_cleared = self.synflowedit.stringgen_enter_minchar("")
@@ -1133,15 +1074,19 @@ class TestSyntheticFlow:
         max_cleared = self.synflowedit.stringgen_enter_maxchar("")
         assert max_cleared, "Max Chars temizlenemedi"
 
+        form = self.synflowedit.get_stringgen_state()
+        assert not form["min_chars"]["value"] and not form["max_chars"]["value"], \
+            f"Min/Max Chars boş olmalıydı: {form['min_chars']['value']!r}/{form['max_chars']['value']!r}"
+
         # Save'e bas
         save_clicked = self.synflowedit.click_save_button()
 
-        time.sleep(2)
+        self.synflowlist.wait_until_idle(2)
 
         # Required field validation kontrolü
-        page_source = self.driver.page_source
+        content = self.synflowlist.read_content()
         required_errors = ["required", "field", "empty", "mandatory", "missing"]
-        has_required_validation = any(error.lower() in page_source.lower() for error in required_errors)
+        has_required_validation = content.mentions(*required_errors)
 
         print(f"Required field validation var mı: {'Evet' if has_required_validation else 'Hayır'}")
 
@@ -0,0 +1,180 @@
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from tdm_automation.Utils.namespace import unique_name
+from tdm_automation.Utils.sweeper import Sweeper
+from tdm_automation.Utils.tdm_api import ApiSeeder, TdmApiClient, TdmApiError
+
+
+class StubTdmBackend(BaseHTTPRequestHandler):
+    """TDM REST API'sinin bellek içi taklidi: /api/<kaynak>[/<id>]"""
+
+    protocol_version = "HTTP/1.1"
+    token = "stub-token"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, body=None):
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self):
+        parts = urlsplit(self.path)
+        segments = [s for s in parts.path.split("/") if s][1:]  # "api" önekini at
+        if self.headers.get("Authorization") != f"Bearer {self.token}":
+            self._reply(401, {"error": "unauthorized"})
+            return None
+        self.server.requests.append((self.command, parts.path))
+        return segments, parse_qs(parts.query)
+
+    def do_GET(self):
+        route = self._route()
+        if route is None:
+            return
+        (resource, *rest), query = route
+        items = list(self.server.store.get(resource, {}).values())
+        search = query.get("search", [None])[0]
+        if search:
+            items = [item for item in items if search in item["name"]]
+        self._reply(200, {"content": items, "totalElements": len(items)})
+
+    def do_POST(self):
+        route = self._route()
+        if route is None:
+            return
+        (resource, *rest), _ = route
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        entity = dict(payload, id=next(self.server.ids))
+        self.server.store.setdefault(resource, {})[entity["id"]] = entity
+        self._reply(201, entity)
+
+    def do_DELETE(self):
+        route = self._route()
+        if route is None:
+            return
+        (resource, entity_id), _ = route
+        if self.server.store.get(resource, {}).pop(int(entity_id), None) is None:
+            self._reply(404, {"error": "not found"})
+        else:
+            self._reply(204)
+
+
+class TestTdmApiClient:
+    """Backend client'ının lokal stub HTTP sunucusuna karşı testleri"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubTdmBackend)
+        cls.server.daemon_threads = True
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/api"
+
+    @classmethod
+    def teardown_class(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setup_method(self, method):
+        self.server.store = {}
+        self.server.ids = itertools.count(1)
+        self.server.requests = []
+        self.server.connections = 0
+        self.client = TdmApiClient(self.base_url, token=StubTdmBackend.token)
+
+    def teardown_method(self, method):
+        self.client.close()
+
+    def test_TC155_create_find_delete_application(self):
+        """TC155: Application oluşturma, isimle bulma ve silme"""
+        created = self.client.create_application("ApiApp_1", ["V1", "V2"])
+        assert created["id"] == 1
+        assert created["versions"] == ["V1", "V2"]
+
+        found = self.client.find("application", "ApiApp_1")
+        assert found == created
+
+        assert self.client.delete("application", created["id"])
+        assert self.client.find("application", "ApiApp_1") is None
+
+        # İkinci silme 404 - missing_ok ile hata değil
+        assert not self.client.delete("application", created["id"])
+        with pytest.raises(TdmApiError) as error:
+            self.client.delete("application", created["id"], missing_ok=False)
+        assert error.value.status == 404
+
+    def test_TC156_connection_reused_across_requests(self):
+        """TC156: Keep-alive - ardışık istekler tek TCP bağlantısı üzerinden gider"""
+        for index in range(5):
+            self.client.create_list_generator(f"List_{index}", ["a", "b"])
+        self.client.list("list_generator")
+
+        assert len(self.server.requests) == 6
+        assert self.server.connections == 1
+
+    def test_TC157_unauthorized_raises(self):
+        """TC157: Geçersiz token ile istek TdmApiError (401) fırlatır"""
+        client = TdmApiClient(self.base_url, token="wrong")
+        try:
+            with pytest.raises(TdmApiError) as error:
+                client.create_application("ApiApp_2")
+            assert error.value.status == 401
+        finally:
+            client.close()
+
+    def test_TC158_seeder_cleans_up_in_reverse_order(self):
+        """TC158: Seeder oluşturduğu kayıtları ters sırada siler"""
+        seeder = ApiSeeder(self.client)
+        assert seeder.application("SeedApp", ["V1"])
+        assert seeder.module("SeedApp", "SeedModule", ["V1"])
+        assert seeder.case("SeedCase", "SeedApp", "SeedModule")
+        assert seeder.seeded("SeedModule")
+
+        seeder.cleanup()
+
+        deletes = [path for method, path in self.server.requests if method == "DELETE"]
+        assert deletes == ["/api/data-generation-cases/3", "/api/modules/2", "/api/applications/1"]
+        assert all(not items for items in self.server.store.values())
+
+    def test_TC159_seeder_falls_back_when_backend_unavailable(self):
+        """TC159: Auth/bağlantı hatasında seeder None döner ve client devre dışı kalır"""
+        client = TdmApiClient(self.base_url, token="wrong")
+        try:
+            seeder = ApiSeeder(client)
+            assert seeder.application("SeedApp") is None
+            assert not client.available
+            assert seeder.synthetic_flow("SeedFlow") is None
+            assert ApiSeeder(None).application("SeedApp") is None
+        finally:
+            client.close()
+
+    def test_TC160_sweeper_removes_only_stale_suite_entities(self):
+        """TC160: Sweeper TTL'den eski suite kayıtlarını siler, yeni ve yabancı kayıtlara dokunmaz"""
+        old_epoch = int(time.time()) - 3 * 3600
+        stale_app = self.client.create_application(f"TestApp_{old_epoch}_gw0n1")
+        legacy_list = self.client.create_list_generator(f"ListName_{old_epoch}", ["a"])
+        fresh_app = self.client.create_application(unique_name("TestApp"))
+        foreign_app = self.client.create_application("TestApp_production")
+
+        # Prefix'ler Tests/.env'deki TEST_*_NAME değerlerinden bağımsız olsun
+        report = Sweeper(ttl=3600, prefixes=["TestApp", "ListName"], workers=4).sweep_api(self.client)
+
+        assert report.removed == {"list_generator": [legacy_list["name"]], "application": [stale_app["name"]]}
+        remaining = {item["name"] for item in self.server.store["applications"].values()}
+        assert remaining == {fresh_app["name"], foreign_app["name"]}
+        assert not self.server.store["list-generators"]
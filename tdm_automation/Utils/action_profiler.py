@@ -0,0 +1,191 @@
+import html
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class ActionProfiler:
+    """BasePage aksiyonlarının (find/click/enter_text/wait) süre kayıtları
+
+    Her kayıt: page, action, locator, duration, wait (element/koşul beklemesi),
+    path (native / js / failed), cached (element cache'ten mi geldi) ve success.
+    İç içe çağrılarda sadece en dıştaki aksiyon kaydedilir; içteki wait_*
+    çağrılarının süresi ve içteki aksiyonların bekleme/fallback bilgisi
+    dıştakine aktarılır.
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv('ACTION_PROFILE', 'true').lower() == 'true'
+        self._records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def track(self, page, action, locator=None):
+        """Aksiyonu ölç; yield edilen kayda wait/path eklenebilir"""
+        if not self.enabled:
+            yield {}
+            return
+
+        record = {
+            "page": page,
+            "action": action,
+            "locator": format_locator(locator),
+            "wait": 0.0,
+            "path": "native",
+            "success": True,
+            "cached": False,
+        }
+        stack = self._stack()
+        stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record["success"] = False
+            raise
+        finally:
+            record["duration"] = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                parent = stack[-1]
+                parent["wait"] += record["duration"] if action.startswith("wait") else record["wait"]
+                if record["path"] != "native" and parent["path"] == "native":
+                    parent["path"] = record["path"]
+                parent["cached"] = parent["cached"] or record["cached"]
+            else:
+                with self._lock:
+                    self._records.append(record)
+
+    @contextmanager
+    def waiting(self, record):
+        """Bloğun süresini kaydın wait alanına ekle"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if "wait" in record:
+                record["wait"] += time.perf_counter() - start
+
+    def drain(self):
+        """Toplanan kayıtları döndür ve temizle (test bitiminde çağrılır)"""
+        with self._lock:
+            records, self._records = self._records, []
+        return records
+
+
+profiler = ActionProfiler()
+
+
+def format_locator(locator):
+    if locator is None:
+        return ""
+    if isinstance(locator, (tuple, list)) and len(locator) == 2:
+        return f"{locator[0]}={locator[1]}"
+    return str(locator)
+
+
+def build_profile(records_by_test):
+    """{nodeid: [kayıt, ...]} -> test ve locator bazında özet"""
+    tests = {}
+    locators = defaultdict(lambda: {
+        "count": 0, "total": 0.0, "wait": 0.0, "max": 0.0,
+        "js_fallbacks": 0, "cache_hits": 0, "failures": 0, "actions": set(), "pages": set(),
+    })
+
+    for nodeid, records in records_by_test.items():
+        actions = defaultdict(lambda: {"count": 0, "total": 0.0})
+        for record in records:
+            actions[record["action"]]["count"] += 1
+            actions[record["action"]]["total"] += record["duration"]
+
+            if not record["locator"]:
+                continue
+            entry = locators[record["locator"]]
+            entry["count"] += 1
+            entry["total"] += record["duration"]
+            entry["wait"] += record["wait"]
+            entry["max"] = max(entry["max"], record["duration"])
+            entry["js_fallbacks"] += record["path"] == "js"
+            entry["cache_hits"] += record.get("cached", False)
+            entry["failures"] += not record["success"]
+            entry["actions"].add(record["action"])
+            entry["pages"].add(record["page"])
+
+        tests[nodeid] = {
+            "count": len(records),
+            "total": sum(r["duration"] for r in records),
+            "wait": sum(r["wait"] for r in records),
+            "actions": dict(actions),
+        }
+
+    for entry in locators.values():
+        entry["actions"] = sorted(entry["actions"])
+        entry["pages"] = sorted(entry["pages"])
+
+    return {"tests": tests, "locators": dict(locators)}
+
+
+def write_profile(records_by_test, directory, top=50):
+    """action_profile.json ve action_profile.html dosyalarını yaz"""
+    profile = build_profile(records_by_test)
+    os.makedirs(directory, exist_ok=True)
+
+    json_path = os.path.join(directory, "action_profile.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"summary": profile, "records": records_by_test}, f, indent=2)
+
+    html_path = os.path.join(directory, "action_profile.html")
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(_render_html(profile, top))
+
+    return json_path, html_path
+
+
+def _table(headers, rows):
+    head = "".join(f"<th>{html.escape(h)}</th>" for h in headers)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + "</tr>"
+        for row in rows
+    )
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def _render_html(profile, top):
+    tests = sorted(profile["tests"].items(), key=lambda kv: kv[1]["total"], reverse=True)[:top]
+    locators = sorted(profile["locators"].items(), key=lambda kv: kv[1]["total"], reverse=True)[:top]
+
+    test_rows = [
+        (nodeid, data["count"], f"{data['total']:.2f}", f"{data['wait']:.2f}",
+         ", ".join(f"{name}: {a['total']:.2f}s/{a['count']}" for name, a in
+                   sorted(data["actions"].items(), key=lambda kv: kv[1]["total"], reverse=True)))
+        for nodeid, data in tests
+    ]
+    locator_rows = [
+        (locator, data["count"], f"{data['total']:.2f}", f"{data['wait']:.2f}", f"{data['max']:.2f}",
+         data["js_fallbacks"], data["cache_hits"], data["failures"], ", ".join(data["actions"]), ", ".join(data["pages"]))
+        for locator, data in locators
+    ]
+
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Aksiyon Profili</title>
+<style>
+body {{ font-family: Helvetica, Arial, sans-serif; font-size: 13px; }}
+table {{ border-collapse: collapse; margin-bottom: 24px; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: left; }}
+th {{ background: #f0f0f0; }}
+</style></head><body>
+<h2>En yavaş testler (ilk {top})</h2>
+{_table(("Test", "Aksiyon", "Toplam (s)", "Bekleme (s)", "Aksiyon dağılımı"), test_rows)}
+<h2>En pahalı locator'lar (ilk {top})</h2>
+{_table(("Locator", "Çağrı", "Toplam (s)", "Bekleme (s)", "Max (s)", "JS fallback", "Cache hit", "Hata", "Aksiyonlar", "Sayfalar"), locator_rows)}
+</body></html>
+"""
@@ -0,0 +1,100 @@
+"""Page object primitive'leri için mikro benchmark yardımcıları
+
+pytest-benchmark'a benzer şekilde her ölçüm warmup turlarından sonra `rounds`
+kez çalıştırılır; min/medyan/ortalama/p95 gecikme ve saniyedeki işlem sayısı
+(throughput) hesaplanır. Sonuçlar reports/benchmark.json'a yazılır; önceki
+sonuç dosyası varsa medyanlar karşılaştırılır.
+"""
+import json
+import os
+import statistics
+import time
+
+
+BENCHMARK_FILE = os.getenv('BENCHMARK_FILE', os.path.join('reports', 'benchmark.json'))
+
+
+class BenchmarkResult:
+    def __init__(self, name, timings, group=None):
+        self.name = name
+        self.group = group
+        self.timings = sorted(timings)
+
+    @property
+    def median(self):
+        return statistics.median(self.timings)
+
+    @property
+    def mean(self):
+        return statistics.fmean(self.timings)
+
+    @property
+    def p95(self):
+        index = max(0, int(round(0.95 * len(self.timings))) - 1)
+        return self.timings[index]
+
+    @property
+    def ops(self):
+        """Saniyedeki işlem sayısı (ortalama gecikmeye göre)"""
+        return 1.0 / self.mean if self.mean > 0 else float("inf")
+
+    def as_dict(self):
+        return {"group": self.group, "rounds": len(self.timings), "min": self.timings[0], "median": self.median,
+                "mean": self.mean, "p95": self.p95, "max": self.timings[-1], "ops": self.ops}
+
+
+class Benchmark:
+    """Ölçümleri toplar, tablo olarak yazdırır ve JSON'a kaydeder"""
+
+    def __init__(self, rounds=None, warmup=1):
+        self.rounds = rounds or int(os.getenv('BENCHMARK_ROUNDS', '10'))
+        self.warmup = warmup
+        self.results = {}
+
+    def measure(self, name, func, setup=None, rounds=None, warmup=None, group=None):
+        """func'ı ölç; setup her turdan önce çalışır ve süreye dahil edilmez
+
+        func bir tur sonunda False dönerse primitive başarısız sayılır (AssertionError).
+        """
+        timings = []
+        warmup = self.warmup if warmup is None else warmup
+        for index in range(warmup + (rounds or self.rounds)):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+            assert result is not False, f"{name} {index + 1}. turda başarısız oldu"
+            if index >= warmup:
+                timings.append(elapsed)
+
+        result = self.results[name] = BenchmarkResult(name, timings, group)
+        return result
+
+    def table(self, baseline=None):
+        baseline = baseline or {}
+        lines = [f"{'Benchmark':<40} {'min (ms)':>9} {'medyan':>9} {'p95':>9} {'ops/s':>8} {'önceki':>9}"]
+        for name, result in sorted(self.results.items(), key=lambda item: (item[1].group or "", item[0])):
+            previous = baseline.get(name, {}).get("median")
+            delta = f"{(result.median / previous - 1) * 100:+.0f}%" if previous else "-"
+            lines.append(f"{name[:40]:<40} {result.timings[0] * 1000:>9.1f} {result.median * 1000:>9.1f} "
+                         f"{result.p95 * 1000:>9.1f} {result.ops:>8.1f} {delta:>9}")
+        return "\n".join(lines)
+
+    def save(self, path=BENCHMARK_FILE):
+        """Sonuçları yaz; dosyadaki önceki sonuçları döndür"""
+        previous = load_results(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({name: result.as_dict() for name, result in self.results.items()}, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+        return previous
+
+
+def load_results(path=BENCHMARK_FILE):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
@@ -0,0 +1,194 @@
+"""Tek Chrome process'i içinde izole browser context'leri (BROWSER_MODE=context)
+
+process modunda (varsayılan) havuzdaki her driver ayrı bir Chrome process'idir.
+context modunda container başına tek bir host Chrome açılır; adresi
+BROWSER_DEBUGGER_ADDRESS ile xdist worker'larına geçer. Her driver chromedriver'ı
+bu Chrome'a debugger_address ile bağlar ve kendi cookie/storage/cache'i olan bir
+context ve içinde bir sekme açar. Driver sadece bu sekmeyi kullanır. Page
+object'ler normal bir WebDriver gördüğü için değişmez.
+
+Context açma/kapatma (Target.createBrowserContext/disposeBrowserContext) sadece
+browser seviyesindeki DevTools session'ında izinlidir; execute_cdp_cmd ise
+komutu o anki sekmenin session'ına gönderir. Bu yüzden context'ler host'un
+browser websocket'i (/json/version -> webSocketDebuggerUrl) üzerinden yönetilir.
+"""
+import itertools
+import json
+import os
+import threading
+
+import requests
+import websocket
+from dotenv import load_dotenv
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from .driver_factory import build_attach_options, create_driver
+from .driver_resolver import resolve_chromedriver
+from .network_tracker import tracker_for
+
+load_dotenv()
+
+
+BROWSER_MODE = os.getenv('BROWSER_MODE', 'process').lower()
+DEBUGGER_ADDRESS_ENV = 'BROWSER_DEBUGGER_ADDRESS'
+# build_chrome_options'taki --window-size ile aynı
+WINDOW_SIZE = (1920, 1080)
+
+_host = None
+_host_lock = threading.Lock()
+
+
+class CdpError(Exception):
+    """Browser session'ına gönderilen CDP komutu hata döndü"""
+
+    def __init__(self, method, error):
+        super().__init__(f"{method}: {error.get('message')} ({error.get('code')})")
+        self.method = method
+        self.code = error.get("code")
+
+
+class BrowserSession:
+    """Host Chrome'un browser seviyesindeki DevTools websocket bağlantısı"""
+
+    def __init__(self, debugger_address, timeout=10):
+        version = requests.get(f"http://{debugger_address}/json/version", timeout=timeout).json()
+        # Origin header'ı gönderilmezse --remote-allow-origins gerekmez
+        self._ws = websocket.create_connection(version["webSocketDebuggerUrl"], timeout=timeout,
+                                               suppress_origin=True)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def send(self, method, params=None):
+        """Komutu gönder ve cevabını (result) döndür"""
+        with self._lock:
+            message_id = next(self._ids)
+            self._ws.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+            while True:
+                # Araya giren event'ler atlanır
+                reply = json.loads(self._ws.recv())
+                if reply.get("id") == message_id:
+                    break
+        if "error" in reply:
+            raise CdpError(method, reply["error"])
+        return reply.get("result", {})
+
+    def close(self):
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+
+class ContextDriver(webdriver.Chrome):
+    """Host Chrome'daki kendi browser context'inde çalışan driver"""
+
+    def __init__(self, debugger_address):
+        # Context browser session'ında açılır; driver yalnızca sekmeyi kullanır
+        self.browser_session = BrowserSession(debugger_address)
+        self.context_id = None
+        self.target_id = None
+        try:
+            super().__init__(service=Service(resolve_chromedriver()),
+                             options=build_attach_options(debugger_address))
+        except Exception:
+            self.browser_session.close()
+            raise
+        try:
+            self._open_context()
+        except Exception:
+            self.quit()
+            raise
+
+    def _open_context(self):
+        """Yeni context + sekme aç, ona geç ve (varsa) öncekini kapat"""
+        previous = self.context_id
+        # disposeOnDetach: worker ölürse websocket kapanır ve context'leri Chrome'da kalmaz
+        self.context_id = self.browser_session.send(
+            "Target.createBrowserContext", {"disposeOnDetach": True})["browserContextId"]
+        width, height = WINDOW_SIZE
+        self.target_id = self.execute_cdp_cmd(
+            "Target.createTarget", {"url": "about:blank", "browserContextId": self.context_id,
+                                    "width": width, "height": height})["targetId"]
+        # chromedriver'da window handle = CDP target id
+        self.switch_to.window(self.target_id)
+        tracker_for(self).webview = self.target_id
+
+        if previous is not None:
+            self._dispose(previous)
+
+    @property
+    def window_handles(self):
+        """Sadece bu context'in sekmeleri
+
+        chromedriver host'taki tüm sekmeleri (diğer worker'ların context'leri
+        dahil) listeler; bu yüzden handle'lar browser session'daki target'ların
+        context'ine göre süzülür (chromedriver'ın sırası korunur).
+        """
+        targets = self.browser_session.send("Target.getTargets")["targetInfos"]
+        own = {target["targetId"] for target in targets
+               if target["type"] == "page" and target.get("browserContextId") == self.context_id}
+        return [handle for handle in super().window_handles if handle in own]
+
+    def reset_context(self):
+        """Lease'ler arası temizlik: cookie, storage, cache ve sekmeler context ile birlikte gider"""
+        try:
+            self._open_context()
+            tracker_for(self).reset()
+            return True
+        except Exception as e:
+            print(f"Browser context reset hatası: {e}")
+            return False
+
+    def quit(self):
+        """Context'i kapat; host Chrome açık kalır (bağlı session'lar browser'ı kapatmaz)"""
+        if self.context_id is not None:
+            self._dispose(self.context_id)
+            self.context_id = None
+        self.browser_session.close()
+        super().quit()
+
+    def _dispose(self, context_id):
+        try:
+            self.browser_session.send("Target.disposeBrowserContext", {"browserContextId": context_id})
+        except Exception as e:
+            print(f"Browser context kapatılamadı ({context_id}): {e}")
+
+
+def start_host():
+    """Host Chrome'u başlat ve adresini env'e yaz (xdist worker'ları env'i miras alır)
+
+    Adres zaten verilmişse (başka process'in host'u ya da harici Chrome) yeni
+    browser açılmaz.
+    """
+    global _host
+    with _host_lock:
+        address = os.getenv(DEBUGGER_ADDRESS_ENV)
+        if address:
+            return address
+
+        print("Browser context host'u başlatılıyor")
+        _host = create_driver()
+        # Son context kapansa da browser kapanmasın diye host'un kendi sekmesi açık kalır
+        address = _host.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        os.environ[DEBUGGER_ADDRESS_ENV] = address
+        return address
+
+
+def stop_host():
+    """Bu process'in başlattığı host Chrome'u kapat"""
+    global _host
+    with _host_lock:
+        if _host is None:
+            return
+        try:
+            _host.quit()
+        except Exception as e:
+            print(f"Host browser kapatma hatası: {e}")
+        _host = None
+        os.environ.pop(DEBUGGER_ADDRESS_ENV, None)
+
+
+def create_context_driver():
+    """DriverPool factory'si: host Chrome'da yeni context'li driver"""
+    return ContextDriver(start_host())
@@ -0,0 +1,217 @@
+"""Test ve adım (page aksiyonu) süre bütçeleri
+
+Bütçeler iki yerden gelir:
+  * budgets.json: {"tests": {"<nodeid glob>": saniye}, "actions": {"<Page.aksiyon glob>": saniye}}
+  * @budget(saniye) decorator'ı: page metodunun süresini ölçer, "<Sınıf>.<metod>" anahtarıyla bütçe tanımlar
+
+Adım süreleri ActionProfiler kayıtlarından (BasePage aksiyonları) ve decorator'lı
+metodlardan gelir. Bütçe aşımı ya da baseline'a göre regresyon (tolerance
+katından fazla ve min_delta saniyeden uzun) BUDGET_MODE=warn ise raporlanır,
+fail ise testi başarısız sayar.
+
+Adım baseline'ı "<Sayfa>.<aksiyon> <locator/koşul>" başına son süre örneklerinin
+medyanıdır; en az min_samples örneği olmayan adımlar ve süresi backend'e bağlı
+bekleme aksiyonları (regression_exempt) regresyon kontrolüne girmez.
+"""
+import fnmatch
+import functools
+import json
+import os
+import statistics
+import threading
+import time
+
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "budgets.json")
+CONFIG_FILE = os.getenv('BUDGET_CONFIG', DEFAULT_CONFIG)
+BASELINE_FILE = os.getenv('BUDGET_BASELINE_FILE', os.path.join('reports', 'step_baseline.json'))
+# Baseline'da adım başına tutulan son örnek sayısı
+BASELINE_WINDOW = 20
+# Bekleme süresi uygulamanın o anki işine bağlı olan aksiyonlar
+DEFAULT_REGRESSION_EXEMPT = ("*.wait_for", "*.wait_for_*", "*.wait_until_idle")
+
+# Decorator'la tanımlanan bütçeler: "<Sınıf>.<metod>" -> saniye
+DECORATED_BUDGETS = {}
+
+
+class StepRecorder:
+    """Decorator'lı page metodlarının süre kayıtları (test sonunda drain edilir)"""
+
+    def __init__(self):
+        self._records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def record(self, page, action, duration, success=True):
+        with self._lock:
+            self._records.append({"page": page, "action": action, "duration": duration, "wait": 0.0,
+                                  "locator": "", "path": "native", "success": success, "cached": False})
+
+    def drain(self):
+        with self._lock:
+            records, self._records = self._records, []
+        return records
+
+
+steps = StepRecorder()
+
+
+def budget(seconds):
+    """Page metoduna süre bütçesi koy ve süresini adım olarak kaydet"""
+    def decorate(func):
+        owner = func.__qualname__.split(".")[0]
+        DECORATED_BUDGETS[f"{owner}.{func.__name__}"] = seconds
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            # İç içe decorator'lı çağrılarda sadece en dıştaki kaydedilir
+            depth = getattr(steps._local, "depth", 0)
+            steps._local.depth = depth + 1
+            start = time.perf_counter()
+            success = False
+            try:
+                result = func(self, *args, **kwargs)
+                # Page metodları başarısızlıkta False döner
+                success = result is not False
+                return result
+            finally:
+                steps._local.depth = depth
+                if depth == 0:
+                    steps.record(owner, func.__name__, time.perf_counter() - start, success)
+
+        wrapper.budget = seconds
+        return wrapper
+    return decorate
+
+
+class Budgets:
+    """budgets.json + decorator bütçeleri"""
+
+    def __init__(self, tests=None, actions=None, tolerance=1.5, min_delta=2.0, mode=None, min_samples=5,
+                 regression_exempt=DEFAULT_REGRESSION_EXEMPT):
+        self.tests = tests or {}
+        self.actions = actions or {}
+        self.tolerance = tolerance
+        self.min_delta = min_delta
+        self.min_samples = min_samples
+        self.regression_exempt = tuple(regression_exempt)
+        self.mode = (os.getenv('BUDGET_MODE') or mode or 'warn').lower()
+
+    @classmethod
+    def load(cls, path=CONFIG_FILE):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        return cls(data.get("tests"), data.get("actions"),
+                   data.get("regression_tolerance", 1.5), data.get("regression_min_delta", 2.0), data.get("mode"),
+                   data.get("regression_min_samples", 5),
+                   data.get("regression_exempt", DEFAULT_REGRESSION_EXEMPT))
+
+    @staticmethod
+    def _lookup(table, key):
+        """En spesifik (en uzun) eşleşen glob'un bütçesi"""
+        matches = [pattern for pattern in table if fnmatch.fnmatchcase(key, pattern)]
+        if not matches:
+            return None
+        return table[max(matches, key=len)]
+
+    def test_budget(self, nodeid):
+        return self._lookup(self.tests, nodeid)
+
+    def action_budget(self, page, action):
+        # Page modülleri session başladıktan sonra import edildiği için decorator bütçeleri
+        # burada birleştirilir; config dosyası decorator'daki değeri ezebilir
+        return self._lookup({**DECORATED_BUDGETS, **self.actions}, f"{page}.{action}")
+
+    def _regressed(self, actual, baseline):
+        return baseline is not None and actual > baseline * self.tolerance and actual - baseline > self.min_delta
+
+    def step_reference(self, record, step_baseline):
+        """Adımın regresyon karşılaştırması için medyanı; yeterli örnek yoksa ya da muafsa None"""
+        if any(fnmatch.fnmatchcase(step_key(record), pattern) for pattern in self.regression_exempt):
+            return None
+        samples = step_baseline.get(baseline_key(record))
+        if not isinstance(samples, list) or len(samples) < self.min_samples:
+            return None
+        return statistics.median(samples)
+
+    def check(self, nodeid, duration, records, test_baseline=None, step_baseline=None):
+        """Testin bütçe aşımları ve regresyonları (mesaj listesi)"""
+        violations = []
+        limit = self.test_budget(nodeid)
+        if limit is not None and duration > limit:
+            violations.append(f"test {duration:.1f}s > bütçe {limit:.1f}s")
+        if self._regressed(duration, test_baseline):
+            violations.append(f"test {duration:.1f}s, baseline {test_baseline:.1f}s (regresyon)")
+
+        step_baseline = step_baseline or {}
+        for record in records:
+            key = step_key(record)
+            limit = self.action_budget(record["page"], record["action"])
+            reference = self.step_reference(record, step_baseline)
+            if limit is not None and record["duration"] > limit:
+                violations.append(f"{key} {record['duration']:.2f}s > bütçe {limit:.2f}s {record['locator']}".rstrip())
+            elif self._regressed(record["duration"], reference):
+                violations.append(f"{baseline_key(record)} {record['duration']:.2f}s, "
+                                  f"baseline {reference:.2f}s (regresyon)")
+        return violations
+
+
+def step_key(record):
+    return f"{record['page']}.{record['action']}"
+
+
+def baseline_key(record):
+    """Aynı aksiyonun farklı locator/koşulları ayrı baseline'lara sahiptir"""
+    return f"{step_key(record)} {record['locator']}".rstrip()
+
+
+def load_baseline(path=BASELINE_FILE):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def update_baseline(records_by_test, failed, path=BASELINE_FILE):
+    """Geçen testlerin adım sürelerini baseline'daki son örneklere ekle (adım başına BASELINE_WINDOW)"""
+    samples = {}
+    for nodeid, records in records_by_test.items():
+        if nodeid in failed:
+            continue
+        for record in records:
+            if record.get("success", True):
+                samples.setdefault(baseline_key(record), []).append(round(record["duration"], 4))
+    if not samples:
+        return
+
+    baseline = load_baseline(path)
+    for key, durations in samples.items():
+        previous = baseline.get(key)
+        # Eski formattaki (tek medyan) kayıtlar atılır
+        previous = previous if isinstance(previous, list) else []
+        baseline[key] = (previous + durations)[-BASELINE_WINDOW:]
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def top_steps(records_by_test, top=15):
+    """En yavaş adımlar: (süre, bekleme, adım, locator, test) tablosu satırları"""
+    rows = [(record["duration"], record["wait"], step_key(record), record["locator"], nodeid)
+            for nodeid, records in records_by_test.items() for record in records]
+    rows.sort(key=lambda row: row[0], reverse=True)
+    return rows[:top]
+
+
+def format_top_steps(rows):
+    lines = [f"{'Süre (s)':>9} {'Bekleme':>8}  {'Adım':<45} {'Locator':<50} Test"]
+    for duration, wait, key, locator, nodeid in rows:
+        lines.append(f"{duration:>9.2f} {wait:>8.2f}  {key[:45]:<45} {locator[:50]:<50} {nodeid}")
+    return "\n".join(lines)
@@ -0,0 +1,282 @@
+"""Upload testleri için deklaratif test dosyası registry'si
+
+Her dosya bir FileSpec ile tanımlanır (ayraç, encoding, header, satırlar,
+injection payload'ları). Dosya içeriği spec'ten üretilir ve içeriğin hash'i
+ile adlandırılan bir dizine (DATA_FILES_DIR/<hash>/<isim>) bir kez yazılır
+(büyük üretilen CSV'lerde hash spec parametrelerinden alınır):
+aynı içerik session'lar ve xdist worker'ları arasında tekrar kullanılır,
+yazma geçici dosya + os.replace ile yapıldığı için paralel worker'lar
+birbirinin yarım yazdığı dosyayı görmez.
+"""
+import csv
+import datetime
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import string
+import tempfile
+import threading
+
+
+DATA_FILES_DIR = os.getenv('TEST_DATA_FILES_DIR', os.path.join(tempfile.gettempdir(), "tdm_test_files"))
+
+SQL_INJECTION_PAYLOADS = ("'; DROP TABLE users; --", "List_1' OR '1'='1",
+                          "' UNION SELECT * FROM admin --", "List_'; DELETE FROM data; --")
+XSS_PAYLOADS = ("<script>alert('XSS')</script>", "<img src=x onerror=alert(1)>",
+                "<iframe src=javascript:alert('XSS')>", "<svg onload=alert('XSS')>")
+
+
+class FileSpec:
+    """Bir test dosyasının tanımı
+
+    header/rows verilirse separator ile birleştirilir; quote=True ise veri
+    satırları CSV kurallarına göre tırnaklanır (header tırnaksız kalır).
+    raw verilirse içerik olduğu gibi yazılır.
+    """
+
+    def __init__(self, name, header=(), rows=(), separator=",", encoding="utf-8", quote=False, raw=None):
+        self.name = name
+        self.header = tuple(header)
+        self.rows = tuple(tuple(row) for row in rows)
+        self.separator = separator
+        self.encoding = encoding
+        self.quote = quote
+        self.raw = raw
+
+    def render(self):
+        """Dosyanın byte içeriği (satırlar \\n ile ayrılır, sonda newline yok)"""
+        if self.raw is not None:
+            return self.raw.encode(self.encoding)
+        lines = []
+        if self.header:
+            lines.append(self.separator.join(self.header))
+        for row in self.rows:
+            if self.quote:
+                buffer = io.StringIO()
+                csv.writer(buffer, delimiter=self.separator, quoting=csv.QUOTE_ALL, lineterminator="").writerow(row)
+                lines.append(buffer.getvalue())
+            else:
+                lines.append(self.separator.join(str(value) for value in row))
+        return "\n".join(lines).encode(self.encoding)
+
+    def digest(self):
+        return hashlib.sha256(self.render()).hexdigest()[:16]
+
+    def write(self, f):
+        f.write(self.render())
+
+
+def _separated(name, separator):
+    return FileSpec(name, ("List_Name", "List_Age", "List_City"),
+                    [("List_Ahmet", 25, "Istanbul"), ("List_Mehmet", 30, "Ankara")], separator=separator)
+
+
+# Create From File testlerinin dosyaları
+SPECS = {spec.name: spec for spec in (
+    FileSpec("sample.csv", ("value1", "value2", "value3"), [("test1", "test2", "test3")]),
+    _separated("comma_separated.csv", ","),
+    _separated("tab_separated.csv", "\t"),
+    _separated("semicolon_separated.csv", ";"),
+    _separated("space_separated.csv", " "),
+    _separated("pipe_separated.csv", "|"),
+    _separated("colon_separated.csv", ":"),
+    FileSpec("empty_file.csv", raw=""),
+    FileSpec("invalid_format.txt", ("List_Name", "List_Age"), [("Ahmet", 25)]),
+    FileSpec("special_chars.csv", ("List_Name", "List_Symbol", "List_Unicode"),
+             [("List_Açelya", "List_@#$%", "List_测试"), ("List_Müge", "List_€£¥", "List_🚀🎯")]),
+    FileSpec("quotes_csv.csv", ("List_Name", "List_Description", "List_Quote"),
+             [("List_Ahmet", "List_Developer, Senior", 'List_He said "Hello World"'),
+              ("List_Ayşe", "List_Manager, Team Lead", "List_She said 'Good morning'")], quote=True),
+    FileSpec("mixed_types.csv", ("List_Name", "List_Age", "List_Salary", "List_Date", "List_Active", "List_Score"),
+             [("List_Ahmet", 25, "50000.75", "2023-01-15", "true", "95.5"),
+              ("List_Ayşe", "thirty", "invalid_salary", "invalid_date", "maybe", "not_number"),
+              ("List_Mehmet", -5, 0, "1900-01-01", "false", "100.0")]),
+    FileSpec("file1.csv", ("List_Name", "List_Age"), [("List_File1", 25)]),
+    FileSpec("file2.csv", ("List_Name", "List_City"), [("List_File2", "Istanbul")]),
+    FileSpec("no_separator.csv", ("List_FullData",),
+             [("List_AhmetFromIstanbul25YearsOld",), ("List_AyseFromAnkara30YearsOld",)]),
+    FileSpec("sql_injection.csv", ("List_Name", "List_Query", "List_Payload"),
+             [("List_Drop",) + SQL_INJECTION_PAYLOADS[:2], ("List_Union",) + SQL_INJECTION_PAYLOADS[2:],
+              ("List_Normal", "List_RegularName", "List_RegularData")], quote=True),
+    FileSpec("xss_injection.csv", ("List_Name", "List_Script", "List_Html"),
+             [("List_Alert",) + XSS_PAYLOADS[:2], ("List_Iframe",) + XSS_PAYLOADS[2:],
+              ("List_Normal", "List_RegularName", "List_RegularData")], quote=True),
+    FileSpec("no_extension_file", ("List_Name", "List_Age"), [("List_Ahmet", 25)]),
+    FileSpec("duplicate_columns.csv", ("List_Name", "List_Name", "List_Age", "List_Age", "List_Name"),
+             [("List_Ahmet1", "List_Ahmet2", 25, 26, "List_Ahmet3"),
+              ("List_Ayse1", "List_Ayse2", 30, 31, "List_Ayse3")]),
+)}
+
+
+# select_separator'daki isimler
+SEPARATORS = {"comma": ",", "tab": "\t", "semicolon": ";", "space": " ", "pipe": "|", "colon": ":"}
+
+_UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+
+
+def parse_size(text):
+    """"10MB", "2GB", "512" -> byte"""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?B)?\s*", str(text).upper())
+    if not match:
+        raise ValueError(f"Geçersiz boyut: {text}")
+    return int(float(match.group(1)) * _UNITS[match.group(2) or "B"])
+
+
+class Column:
+    """Üretilen CSV'nin bir sütunu
+
+    type: int | decimal | text | date | bool
+    distribution: uniform | normal | skewed (küçük değerler baskın) | sequential (satır no)
+    cardinality: text için farklı değer sayısı. Değerler ayraç karakteri içermez.
+    """
+
+    POOL_SIZE = 65536
+
+    def __init__(self, name, type="text", distribution="uniform", low=0, high=100000, length=12, cardinality=None):
+        self.name = name
+        self.type = type
+        self.distribution = distribution
+        self.low = low
+        self.high = high
+        self.length = length
+        self.cardinality = cardinality
+
+    def params(self):
+        return dict(vars(self))
+
+    def _number(self, rng):
+        span = self.high - self.low
+        if self.distribution == "normal":
+            value = rng.gauss(self.low + span / 2, span / 6)
+            return min(max(value, self.low), self.high)
+        if self.distribution == "skewed":
+            return self.low + span * rng.random() ** 4
+        return self.low + span * rng.random()
+
+    def _value(self, rng):
+        if self.type == "int":
+            return str(int(self._number(rng)))
+        if self.type == "decimal":
+            return f"{self._number(rng):.2f}"
+        if self.type == "bool":
+            return "true" if self._number(rng) - self.low < (self.high - self.low) / 2 else "false"
+        if self.type == "date":
+            return (datetime.date(2000, 1, 1) + datetime.timedelta(days=int(self._number(rng)) % 36500)).isoformat()
+        return "".join(rng.choices(string.ascii_letters + string.digits, k=self.length))
+
+    def pool(self, rng):
+        """Dağılımdan örneklenmiş sabit boyutlu değer havuzu (bellek dosya boyutundan bağımsız)"""
+        size = min(self.cardinality or self.POOL_SIZE, self.POOL_SIZE)
+        return [self._value(rng) for _ in range(size)]
+
+
+DEFAULT_COLUMNS = (
+    Column("List_Id", "int", "sequential"),
+    Column("List_Name", "text", cardinality=5000),
+    Column("List_Age", "int", "normal", low=18, high=90),
+    Column("List_Salary", "decimal", "skewed", low=1000, high=500000),
+    Column("List_Date", "date"),
+    Column("List_Active", "bool"),
+)
+
+
+class GeneratedCsvSpec:
+    """Verilen boyuta kadar satır üreten CSV (10MB-2GB upload senaryoları için)
+
+    Satırlar sabit boyutlu batch'ler halinde üretilip yazılır; bellek kullanımı
+    dosya boyutundan bağımsızdır. Aynı parametreler (seed dahil) aynı dosyayı
+    verdiği için cache anahtarı içerik değil spec'in kendisidir.
+    """
+
+    BATCH_ROWS = 5000
+
+    def __init__(self, name, size, separator="comma", columns=DEFAULT_COLUMNS, seed=0, encoding="utf-8"):
+        self.name = name
+        self.size = parse_size(size)
+        self.separator = separator
+        self.columns = tuple(columns)
+        self.seed = seed
+        self.encoding = encoding
+
+    def digest(self):
+        params = {"size": self.size, "separator": self.separator, "seed": self.seed, "encoding": self.encoding,
+                  "columns": [column.params() for column in self.columns]}
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+    def write(self, f):
+        """Dosyayı size byte'a ulaşana kadar batch batch yaz; yazılan byte sayısı"""
+        rng = random.Random(self.seed)
+        separator = SEPARATORS.get(self.separator, self.separator)
+        pools = [None if column.distribution == "sequential" else column.pool(rng) for column in self.columns]
+
+        written = f.write((separator.join(column.name for column in self.columns) + "\n").encode(self.encoding))
+        row_id = 0
+        while written < self.size:
+            values = []
+            for pool in pools:
+                if pool is None:
+                    values.append(map(str, range(row_id + 1, row_id + self.BATCH_ROWS + 1)))
+                else:
+                    values.append(rng.choices(pool, k=self.BATCH_ROWS))
+            row_id += self.BATCH_ROWS
+            chunk = ("\n".join(map(separator.join, zip(*values))) + "\n").encode(self.encoding)
+            if written + len(chunk) > self.size:
+                # Son batch'i satır sınırında kes; dosya size'ı aşmaz
+                written += f.write(chunk[:chunk.rfind(b"\n", 0, self.size - written + 1) + 1])
+                break
+            written += f.write(chunk)
+        return written
+
+
+class DataFileRegistry:
+    """Spec -> diskteki dosya yolu (içerik hash'li, session başına bir kez üretilir)"""
+
+    def __init__(self, specs=None, directory=DATA_FILES_DIR):
+        self.specs = dict(SPECS if specs is None else specs)
+        self.directory = directory
+        self._paths = {}
+        self._lock = threading.Lock()
+
+    def register(self, spec):
+        self.specs[spec.name] = spec
+        self._paths.pop(spec.name, None)
+        return spec
+
+    def path(self, name):
+        """Dosyanın mutlak yolu; gerekiyorsa üretir"""
+        with self._lock:
+            if name not in self._paths:
+                self._paths[name] = self._materialize(self.specs[name])
+            return self._paths[name]
+
+    def _materialize(self, spec):
+        path = os.path.join(self.directory, spec.digest(), spec.name)
+        if os.path.isfile(path):
+            return path
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Her worker kendi geçici dosyasına yazar; os.replace atomik olduğu için
+        # aynı anda üretseler de okuyan taraf hep tam dosyayı görür
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                spec.write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return path
+
+
+_registry = None
+
+
+def registry():
+    """Session genelinde tek registry"""
+    global _registry
+    if _registry is None:
+        _registry = DataFileRegistry()
+    return _registry
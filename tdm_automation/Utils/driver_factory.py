@@ -0,0 +1,75 @@
+import os
+
+from dotenv import load_dotenv
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from .driver_resolver import resolve_chromedriver
+from .trace_capture import MODE as CAPTURE_MODE, TRACE_CATEGORIES
+
+load_dotenv()
+
+
+def build_chrome_options():
+    """Chrome options - Docker ve headless için optimize edilmiş"""
+    headless = os.getenv('HEADLESS', 'false').lower() == 'true'
+    docker_mode = os.getenv('DOCKER_MODE', 'false').lower() == 'true'
+
+    chrome_options = Options()
+
+    if headless:
+        chrome_options.add_argument("--headless")
+        print("HEADLESS modda çalışıyor")
+
+    if docker_mode:
+        # Docker için gerekli argumentlar
+        # Not: Sabit --remote-debugging-port=9222 havuzdaki ikinci browser'ın
+        # açılmasını engelliyor, port seçimini chromedriver'a bırakıyoruz
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--incognito")
+
+        print("DOCKER modda çalışıyor")
+    else:
+        # Local development için
+        chrome_options.add_argument("--incognito")
+
+    # Genel performans ayarları
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--ignore-certificate-errors")
+
+    _enable_performance_log(chrome_options, trace=CAPTURE_MODE == "trace")
+    return chrome_options
+
+
+def build_attach_options(debugger_address):
+    """Çalışan bir Chrome'a (debugger_address) bağlanan session için options
+
+    Bağlanılan browser'ın argümanları değiştirilemediği için sadece performance
+    log'u açılır; timeline trace browser genelinde olduğundan bu modda alınmaz.
+    """
+    chrome_options = Options()
+    chrome_options.debugger_address = debugger_address
+    _enable_performance_log(chrome_options, trace=False)
+    return chrome_options
+
+
+def _enable_performance_log(chrome_options, trace):
+    # CDP Network event'leri performance log'una düşsün (NetworkTracker için)
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    perf_logging = {"enableNetwork": True, "enablePage": False}
+    if trace:
+        # Chrome timeline trace'i de performance log'una düşer (Tracing.dataCollected)
+        perf_logging["traceCategories"] = TRACE_CATEGORIES
+    chrome_options.add_experimental_option("perfLoggingPrefs", perf_logging)
+
+
+def create_driver():
+    """Yeni bir Chrome driver başlat"""
+    service = Service(resolve_chromedriver())
+    driver = webdriver.Chrome(service=service, options=build_chrome_options())
+    driver.maximize_window()
+    return driver
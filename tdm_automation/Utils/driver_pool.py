@@ -0,0 +1,193 @@
+import os
+import queue
+import threading
+import time
+
+from dotenv import load_dotenv
+
+from . import browser_contexts
+from .driver_factory import create_driver
+from .network_tracker import tracker_for
+from .trace_capture import capture_for
+
+load_dotenv()
+
+
+# Lease'ler arası localStorage/sessionStorage temizliği (mevcut origin için)
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class DriverPool:
+    """Session boyunca açık kalan Chrome driver havuzu
+
+    Browser'lar ihtiyaç oldukça (en fazla `size` adet) başlatılır, testlere
+    kiralanır ve geri verildiğinde state'i temizlenir. Reset sırasında hata
+    veren ya da çökmüş browser karantinaya alınır (kapatılır) ve yerine bir
+    sonraki kiralamada yenisi açılır.
+
+    BROWSER_MODE=context ise driver'lar ayrı Chrome process'leri yerine tek bir
+    host Chrome'daki izole browser context'leridir (bkz. browser_contexts).
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, size=None, factory=None):
+        self.size = size or int(os.getenv('DRIVER_POOL_SIZE', '1'))
+        self.lease_timeout = int(os.getenv('DRIVER_LEASE_TIMEOUT', '600'))
+        if factory is None:
+            factory = (browser_contexts.create_context_driver if browser_contexts.BROWSER_MODE == "context"
+                       else create_driver)
+        self._factory = factory
+        self._idle = queue.LifoQueue()
+        self._leased = set()
+        self._created = 0
+        self._lock = threading.Lock()
+        self.quarantined = 0
+
+    @classmethod
+    def instance(cls):
+        """Session genelinde tek havuz"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def shutdown(cls):
+        """Session sonunda tüm browser'ları kapat"""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.close()
+                cls._instance = None
+        browser_contexts.stop_host()
+
+    def warm_up(self):
+        """Havuzdaki tüm browser'ları önceden başlat (session başında)"""
+        drivers = [self.acquire() for _ in range(self.size)]
+        for driver in drivers:
+            self.release(driver)
+
+    def acquire(self):
+        """Havuzdan bir driver kirala"""
+        deadline = time.monotonic() + self.lease_timeout
+        while True:
+            driver = self._try_get_idle() or self._try_create()
+            if driver is None:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"{self.lease_timeout}s içinde boş driver bulunamadı")
+                # Karantina kapasite açabileceği için kısa aralıklarla tekrar dene
+                try:
+                    driver = self._idle.get(timeout=1)
+                except queue.Empty:
+                    continue
+
+            if self._is_alive(driver):
+                with self._lock:
+                    self._leased.add(driver)
+                return driver
+
+            print("Havuzdaki browser yanıt vermiyor, karantinaya alınıyor")
+            self._quarantine(driver)
+
+    def release(self, driver, broken=False):
+        """Driver'ı temizleyip havuza geri ver"""
+        with self._lock:
+            self._leased.discard(driver)
+
+        if broken or not self._reset(driver):
+            self._quarantine(driver)
+            return
+
+        self._idle.put(driver)
+
+    def close(self):
+        """Havuzdaki bütün driver'ları kapat"""
+        drivers = []
+        while True:
+            try:
+                drivers.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        with self._lock:
+            drivers.extend(self._leased)
+            self._leased.clear()
+            self._created = 0
+
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Driver kapatma hatası: {e}")
+
+    def _try_get_idle(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _try_create(self):
+        with self._lock:
+            if self._created >= self.size:
+                return None
+            self._created += 1
+
+        try:
+            print(f"Yeni browser başlatılıyor ({self._created}/{self.size})")
+            driver = self._factory()
+            tracker_for(driver)
+            capture_for(driver)
+            return driver
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _is_alive(self, driver):
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, driver):
+        """Cookie, storage, açık sekme ve modalları temizle"""
+        reset_context = getattr(driver, "reset_context", None)
+        if reset_context is not None:
+            # Paylaşılan browser'da diğer sekmeler başka testlerin; context'i yenilemek yeterli
+            return reset_context()
+
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            if driver.current_url.startswith("http"):
+                driver.execute_script(CLEAR_STORAGE_SCRIPT)
+
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                driver.delete_all_cookies()
+
+            # Boş sayfaya geçmek açık modal ve overlay'leri de kapatır
+            driver.get("about:blank")
+            tracker_for(driver).reset()
+            return True
+        except Exception as e:
+            print(f"Driver reset hatası: {e}")
+            return False
+
+    def _quarantine(self, driver):
+        self.quarantined += 1
+        with self._lock:
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import stat
+import subprocess
+import threading
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+# Dockerfile chromedriver'ı buraya kuruyor
+DEFAULT_LOCAL_PATHS = ["/usr/local/bin/chromedriver", "/usr/bin/chromedriver"]
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tdm_automation", "chromedriver")
+
+_resolved_path = None
+_resolve_lock = threading.Lock()
+
+
+def resolve_chromedriver():
+    """ChromeDriver yolunu session başına bir kez çöz
+
+    Sıra: CHROMEDRIVER_PATH (pinlenmiş yol) -> sistemde kurulu chromedriver ->
+    içerik adresli disk cache'i -> webdriver-manager (sadece cache boşsa, network).
+    """
+    global _resolved_path
+    with _resolve_lock:
+        if _resolved_path is None:
+            _resolved_path = _resolve()
+            print(f"ChromeDriver: {_resolved_path}")
+        return _resolved_path
+
+
+def _resolve():
+    pinned = os.getenv('CHROMEDRIVER_PATH')
+    if pinned:
+        if _is_executable(pinned):
+            return pinned
+        raise FileNotFoundError(f"CHROMEDRIVER_PATH bulunamadı: {pinned}")
+
+    for path in DEFAULT_LOCAL_PATHS + [shutil.which("chromedriver")]:
+        if path and _is_executable(path):
+            return path
+
+    cache = DriverCache(os.getenv('CHROMEDRIVER_CACHE_DIR', DEFAULT_CACHE_DIR))
+    chrome_major = get_chrome_major_version()
+    cached = cache.lookup(chrome_major)
+    if cached:
+        return cached
+
+    # Cache boş - tek seferlik network indirmesi
+    from webdriver_manager.chrome import ChromeDriverManager
+    print("ChromeDriver cache'te yok, webdriver-manager ile indiriliyor")
+    downloaded = ChromeDriverManager().install()
+    return cache.store(downloaded)
+
+
+def get_chrome_major_version():
+    """Yüklü Chrome'un major versiyonunu oku (network'e çıkmadan)"""
+    binaries = [os.getenv('CHROME_BINARY')] + CHROME_BINARIES
+    for binary in binaries:
+        version = _read_version(binary)
+        if version:
+            return version.split(".")[0]
+    return None
+
+
+def _read_version(binary):
+    if not binary or not shutil.which(binary):
+        return None
+    try:
+        output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except Exception:
+        return None
+    match = re.search(r"(\d+\.\d+\.\d+\.\d+)", output)
+    return match.group(1) if match else None
+
+
+def _is_executable(path):
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+class DriverCache:
+    """sha256 ile adreslenen chromedriver cache'i ve versiyon manifest'i
+
+    Yapı: <cache_dir>/<sha256>/chromedriver ve <cache_dir>/manifest.json
+    ({"<major>": {"version": ..., "sha256": ...}}).
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, self.MANIFEST)
+
+    def lookup(self, chrome_major):
+        """Chrome major versiyonuna uyan cache kaydını döndür"""
+        manifest = self._load_manifest()
+        if chrome_major is not None:
+            entry = manifest.get(chrome_major)
+        elif len(manifest) == 1:
+            # Chrome versiyonu okunamadıysa tek kayıt varsa onu kullan
+            entry = next(iter(manifest.values()))
+        else:
+            entry = None
+
+        if not entry:
+            return None
+
+        path = self._blob_path(entry["sha256"])
+        if _is_executable(path) and _sha256(path) == entry["sha256"]:
+            return path
+
+        print(f"Cache kaydı bozuk, yok sayılıyor: {path}")
+        return None
+
+    def store(self, source_path):
+        """İndirilen driver'ı cache'e kopyala ve manifest'e yaz"""
+        digest = _sha256(source_path)
+        target = self._blob_path(digest)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            tmp = f"{target}.{os.getpid()}.tmp"
+            shutil.copy2(source_path, tmp)
+            os.chmod(tmp, os.stat(tmp).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+            os.replace(tmp, target)
+
+        version = _read_version(target) or "unknown"
+        manifest = self._load_manifest()
+        manifest[version.split(".")[0]] = {"version": version, "sha256": digest}
+        self._write_manifest(manifest)
+        return target
+
+    def _blob_path(self, digest):
+        return os.path.join(self.cache_dir, digest, "chromedriver")
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,141 @@
+import os
+import re
+import time
+
+from tdm_automation.Utils.action_profiler import profiler
+
+
+# Satır status hücresinde / history'de / backend'de görülebilecek durumlar
+SUCCESS_STATES = frozenset({"SUCCESS", "SUCCEEDED", "COMPLETED", "DONE", "FINISHED", "SAVED"})
+FAILURE_STATES = frozenset({"FAILED", "FAILURE", "ERROR", "CANCELLED", "CANCELED", "ABORTED", "REJECTED"})
+RUNNING_STATES = frozenset({"RUNNING", "PENDING", "QUEUED", "STARTED", "IN PROGRESS", "PROCESSING"})
+TERMINAL_STATES = SUCCESS_STATES | FAILURE_STATES
+
+
+def normalize_state(text):
+    """Hücre/mesaj metnini bilinen bir duruma çevir (bilinmiyorsa None)"""
+    if not text:
+        return None
+    text = str(text).strip().upper()
+    if text in TERMINAL_STATES or text in RUNNING_STATES:
+        return text
+    return None
+
+
+def state_in(texts):
+    """Hücre metinlerinden ilk bilinen durum"""
+    for text in texts:
+        state = normalize_state(text)
+        if state:
+            return state
+    return None
+
+
+def state_mentioned(texts):
+    """Mesaj metinlerinde kelime olarak geçen ilk durum ("successfully" SUCCESS sayılmaz)"""
+    for text in texts:
+        for state in TERMINAL_STATES | RUNNING_STATES:
+            if re.search(rf"\b{state}\b", str(text), re.IGNORECASE):
+                return state
+    return None
+
+
+class JobResult:
+    """Bekleme sonucu: son durum, terminal mi, geçen süre ve poll sayısı"""
+
+    def __init__(self, name, state, elapsed, polls):
+        self.name = name
+        self.state = state
+        self.elapsed = elapsed
+        self.polls = polls
+
+    @property
+    def finished(self):
+        return self.state in TERMINAL_STATES
+
+    @property
+    def succeeded(self):
+        return self.state in SUCCESS_STATES
+
+    def __bool__(self):
+        return self.finished
+
+    def __repr__(self):
+        return f"<JobResult {self.name} state={self.state} elapsed={self.elapsed:.1f}s polls={self.polls}>"
+
+
+class JobWaiter:
+    """Flow kaydı / case run gibi arka plan işlerini exponential backoff ile bekler
+
+    probe() işin o anki durumunu (ya da bilinmiyorsa None) döndürür. İlk poll
+    hemen yapılır, aralık her poll'da factor ile büyür (max_interval'e kadar);
+    terminal durum görülünce ya da deadline dolunca döner. Süre action
+    profiline "wait_for_job" aksiyonu olarak yazılır.
+
+    require_transition=True ise terminal durum, önce terminal olmayan bir durum
+    ya da baseline'dan (verilmezse ilk poll'dakinden) farklı bir marker (run id,
+    zaman damgası, satır içeriği) görülmeden kabul edilmez; böylece önceki
+    koşunun SUCCESS'i ya da ekranda kalmış bir bildirim yeni işin sonucu
+    sayılmaz. Marker için probe (state, marker) döndürebilir.
+    """
+
+    def __init__(self, probe, name="job", timeout=None, initial=0.25, factor=2.0, max_interval=5.0,
+                 page="JobWaiter", require_transition=False, baseline=None):
+        self.probe = probe
+        self.name = name
+        self.timeout = timeout if timeout is not None else float(os.getenv('JOB_TIMEOUT', '120'))
+        self.initial = initial
+        self.factor = factor
+        self.max_interval = max_interval
+        self.page = page
+        self.require_transition = require_transition
+        self.baseline = baseline
+
+    def wait(self):
+        with profiler.track(self.page, "wait_for_job", f"job={self.name}") as record:
+            start = time.monotonic()
+            deadline = start + self.timeout
+            interval = self.initial
+            state, polls = None, 0
+            reference, transitioned, stale = self.baseline, not self.require_transition, None
+
+            while True:
+                polls += 1
+                try:
+                    observed = self.probe()
+                    observed, marker = observed if isinstance(observed, tuple) else (observed, None)
+                    if not transitioned:
+                        reference = marker if reference is None else reference
+                        if observed in RUNNING_STATES or (marker is not None and marker != reference):
+                            transitioned = True
+                        elif observed in TERMINAL_STATES:
+                            # İş başladığı görülmeden okunan terminal durum önceki koşuya ait olabilir
+                            stale, observed = observed, None
+                    state = observed or state
+                except Exception as e:
+                    # Sayfa geçişi sırasında stale/JS hataları olabilir - sonraki poll'da tekrar dene
+                    print(f"{self.name} durumu okunamadı: {e}")
+
+                now = time.monotonic()
+                if state in TERMINAL_STATES or now >= deadline:
+                    break
+                time.sleep(min(interval, deadline - now))
+                interval = min(interval * self.factor, self.max_interval)
+
+            result = JobResult(self.name, state, time.monotonic() - start, polls)
+            record["wait"] = result.elapsed
+            record["success"] = result.finished
+            if result.finished:
+                print(f"{self.name} {result.elapsed:.1f}s içinde {state} oldu ({polls} poll)")
+            else:
+                print(f"{self.name} {self.timeout}s içinde bitmedi (son durum: {state})")
+                if stale:
+                    print(f"{self.name}: işin başladığı görülmedi, {stale} önceki koşuya ait sayıldı")
+            return result
+
+
+def api_status_probe(client, resource, entity_id, field="status"):
+    """Backend'den kaydın status alanını okuyan probe"""
+    def probe():
+        return normalize_state((client.get(resource, entity_id) or {}).get(field))
+    return probe
@@ -0,0 +1,71 @@
+"""Benchmark'lar için yerel TDM taklidi sunucusu
+
+Tests/mock_tdm altındaki statik sayfayı ve sayfanın çağırdığı /api/<yol>?delay=<ms>
+endpoint'ini (gecikmeli boş JSON) servis eder. Gerçek TDM'e gitmeden page
+object primitive'lerini ölçmek için kullanılır.
+"""
+import functools
+import os
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+MOCK_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Tests", "mock_tdm")
+
+
+class MockTdmHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if not parts.path.startswith("/api/"):
+            return super().do_GET()
+
+        delay = int(parse_qs(parts.query).get("delay", ["0"])[0])
+        time.sleep(delay / 1000)
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MockTdmServer:
+    """Arka plan thread'inde çalışan mock TDM sunucusu (with bloğu ile kullanılabilir)"""
+
+    def __init__(self, host="127.0.0.1", port=0, root=MOCK_ROOT):
+        handler = functools.partial(MockTdmHandler, directory=root)
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, options=None, rows=None, latency=None):
+        """index.html adresi; verilen parametreler sayfaya query string olarak geçer"""
+        params = {"options": options, "rows": rows, "latency": latency}
+        query = "&".join(f"{key}={value}" for key, value in params.items() if value is not None)
+        return f"{self.base_url}/index.html" + (f"?{query}" if query else "")
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,36 @@
+import itertools
+import os
+import re
+import threading
+import time
+
+
+_counter = itertools.count(1)
+_counter_lock = threading.Lock()
+
+# <prefix>_<epoch>_<worker>n<sıra> - sweeper bu formatı kullanarak yaşı hesaplar
+NAME_PATTERN = re.compile(r"^(?P<prefix>.+)_(?P<epoch>\d{10})_(?P<worker>[a-z0-9]+)n(?P<seq>\d+)$")
+
+
+def worker_id():
+    """pytest-xdist worker id'si (gw0, gw1, ...) - paralel değilse 'm'"""
+    return os.getenv('PYTEST_XDIST_WORKER', 'm')
+
+
+def unique_name(prefix):
+    """Worker'a özel, çakışmayan test verisi adı üret
+
+    int(time.time()) aynı saniyede başlayan iki worker'da (ya da aynı test
+    içinde iki kez) aynı adı üretiyordu; worker id ve sayaç bunu engeller.
+    """
+    with _counter_lock:
+        seq = next(_counter)
+    return f"{prefix}_{int(time.time())}_{worker_id()}n{seq}"
+
+
+def parse_name(name):
+    """unique_name ile üretilmiş adı (prefix, epoch, worker) olarak çöz"""
+    match = NAME_PATTERN.match(name)
+    if not match:
+        return None
+    return match.group("prefix"), int(match.group("epoch")), match.group("worker")
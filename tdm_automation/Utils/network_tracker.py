@@ -0,0 +1,117 @@
+import json
+import threading
+import time
+import weakref
+
+
+class NetworkTracker:
+    """Driver'ın in-flight XHR/fetch isteklerini CDP Network event'lerinden takip eder
+
+    Event'ler chromedriver'ın performance log'undan (goog:loggingPrefs) okunur,
+    bu yüzden ayrı bir websocket bağlantısı gerekmez. get_log log'u boşalttığı
+    için performance log'unu okuyan tek yer burası olmalıdır; başka tüketiciler
+    add_listener ile event'lere abone olur.
+    """
+
+    TRACKED_TYPES = {"XHR", "Fetch"}
+    FINISH_EVENTS = {"Network.loadingFinished", "Network.loadingFailed"}
+
+    def __init__(self, driver):
+        self._driver = weakref.ref(driver)
+        self._lock = threading.Lock()
+        self.in_flight = {}
+        self.started = 0
+        self.last_activity = time.monotonic()
+        self.available = True
+        # Paylaşılan browser'da (BROWSER_MODE=context) log diğer sekmelerin
+        # event'lerini de içerir; verilirse sadece bu target'ınkiler işlenir
+        self.webview = None
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """Her CDP event'i için listener(method, params, timestamp) çağrılır"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def poll(self):
+        """Performance log'daki yeni event'leri işle"""
+        driver = self._driver()
+        if driver is None or not self.available:
+            return
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            # Performance logging açık değil - JS tabanlı fallback kullanılır
+            self.available = False
+            return
+
+        with self._lock:
+            for entry in entries:
+                payload = json.loads(entry["message"])
+                if self.webview is not None and payload.get("webview", self.webview) != self.webview:
+                    continue
+                message = payload["message"]
+                self._handle(message["method"], message.get("params", {}), entry.get("timestamp"))
+
+    def _handle(self, method, params, timestamp):
+        request_id = params.get("requestId")
+
+        if method == "Network.requestWillBeSent" and params.get("type") in self.TRACKED_TYPES:
+            self.in_flight[request_id] = params["request"]["url"]
+            self.started += 1
+            self.last_activity = time.monotonic()
+        elif method in self.FINISH_EVENTS and request_id in self.in_flight:
+            del self.in_flight[request_id]
+            self.last_activity = time.monotonic()
+
+        for listener in self._listeners:
+            listener(method, params, timestamp)
+
+    @property
+    def pending(self):
+        self.poll()
+        return len(self.in_flight)
+
+    def is_idle(self, quiet_ms=500):
+        """Bekleyen istek yok ve son quiet_ms boyunca aktivite olmamış"""
+        self.poll()
+        quiet = (time.monotonic() - self.last_activity) * 1000 >= quiet_ms
+        return not self.in_flight and quiet
+
+    def idle_condition(self, quiet_ms=500):
+        """WebDriverWait / BasePage.wait_for ile kullanılabilen koşul"""
+        condition = lambda driver: self.is_idle(quiet_ms)
+        condition.description = f"network_idle({quiet_ms})"
+        return condition
+
+    def started_since(self, count):
+        """count değerinden sonra yeni istek başlamış mı koşulu"""
+        def condition(driver):
+            self.poll()
+            return self.started > count
+
+        condition.description = "request_started"
+        return condition
+
+    def reset(self):
+        """Lease'ler arası: log'u boşalt ve sayaçları sıfırla"""
+        self.poll()
+        with self._lock:
+            self.in_flight.clear()
+            self.last_activity = time.monotonic()
+
+
+_trackers = weakref.WeakKeyDictionary()
+_trackers_lock = threading.Lock()
+
+
+def tracker_for(driver):
+    """Driver'a bağlı tracker'ı döndür (yoksa oluştur)"""
+    with _trackers_lock:
+        tracker = _trackers.get(driver)
+        if tracker is None:
+            tracker = _trackers[driver] = NetworkTracker(driver)
+        return tracker
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import time
+from urllib.parse import urlsplit
+
+from dotenv import load_dotenv
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from tdm_automation.Pages.login_page import LoginPage
+from tdm_automation.Pages.tdm_dashboard_page import TDMDashboardPage
+
+load_dotenv()
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tdm_automation", "sessions")
+
+READ_LOCAL_STORAGE_SCRIPT = "return Object.assign({}, window.localStorage);"
+WRITE_LOCAL_STORAGE_SCRIPT = """
+var items = arguments[0];
+Object.keys(items).forEach(function (key) { window.localStorage.setItem(key, items[key]); });
+"""
+
+
+class SessionCache:
+    """Login olmuş oturumun (cookie + localStorage) dosyaya alınıp driver'lara enjekte edilmesi
+
+    UI'dan login sadece snapshot yokken, süresi dolmuşken ya da enjekte edilen
+    oturum login sayfasına geri yönlendirdiğinde yapılır. Snapshot dosyası
+    kullanıcı adı ve BASE_URL'e göre anahtarlanır.
+    """
+
+    def __init__(self, username, password, base_url=None, cache_dir=None, max_age=None):
+        self.username = username
+        self.password = password
+        self.base_url = base_url or os.getenv('BASE_URL')
+        self.cache_dir = cache_dir or os.getenv('SESSION_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.max_age = max_age or int(os.getenv('SESSION_MAX_AGE', '3600'))
+        self.enabled = os.getenv('SESSION_CACHE', 'true').lower() == 'true'
+
+        key = hashlib.sha1(f"{username}|{self.base_url}".encode("utf-8")).hexdigest()[:16]
+        self.path = os.path.join(self.cache_dir, f"session_{key}.json")
+
+    def open_tdm(self, driver):
+        """Login olmuş halde TDM dashboard'unu aç"""
+        if self.enabled:
+            snapshot = self.load()
+            if snapshot and self._inject(driver, snapshot):
+                print("Cache'teki oturum enjekte edildi, UI login atlandı")
+                return True
+            self.invalidate()
+
+        return self._login_and_snapshot(driver)
+
+    def load(self):
+        """Süresi dolmamış snapshot'ı oku"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - snapshot.get("created", 0) > self.max_age:
+            print("Oturum snapshot'ının süresi dolmuş")
+            return None
+        return snapshot
+
+    def save(self, snapshot):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp, self.path)
+
+    def invalidate(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def _login_and_snapshot(self, driver):
+        """UI üzerinden login ol, TDM'ye geç ve oturumu kaydet"""
+        print("UI üzerinden login olunuyor")
+        login_page = LoginPage(driver)
+        login_page.go_to_login_page()
+        login_page.do_login(self.username, self.password)
+
+        if not login_page.click_tdm_module():
+            print("TDM elementine tıklanamadı")
+            return False
+
+        # Dashboard header gelene kadar bekle, landing URL'i ondan sonra al
+        dashboard_page = TDMDashboardPage(driver)
+        dashboard_page.find_element(dashboard_page.DASHBOARD_HEADER)
+
+        if self.enabled:
+            self.save({
+                "created": time.time(),
+                "landing_url": driver.current_url,
+                "cookies": self._read_cookies(driver),
+                "local_storage": driver.execute_script(READ_LOCAL_STORAGE_SCRIPT) or {},
+            })
+        return True
+
+    def _inject(self, driver, snapshot):
+        """Snapshot'ı driver'a yükle ve oturumun hala geçerli olduğunu doğrula"""
+        landing_url = snapshot["landing_url"]
+        try:
+            self._write_cookies(driver, snapshot["cookies"])
+
+            driver.get(landing_url)
+            if snapshot.get("local_storage"):
+                driver.execute_script(WRITE_LOCAL_STORAGE_SCRIPT, snapshot["local_storage"])
+                driver.refresh()
+
+            # Oturum düşmüşse uygulama login sayfasına yönlendirir
+            WebDriverWait(driver, int(os.getenv('TIMEOUT', '10'))).until(
+                EC.any_of(
+                    EC.url_contains("/login"),
+                    EC.presence_of_element_located(TDMDashboardPage.DASHBOARD_HEADER),
+                )
+            )
+            if LoginPage(driver).is_login_page():
+                print("Enjekte edilen oturum geçersiz, yeniden login olunacak")
+                return False
+            return True
+        except Exception as e:
+            print(f"Oturum enjeksiyon hatası: {e}")
+            return False
+
+    def _read_cookies(self, driver):
+        # CDP tüm domain'lerin cookie'lerini verir (WebConsole + TDM farklı olabilir)
+        try:
+            return driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        except Exception:
+            return driver.get_cookies()
+
+    def _write_cookies(self, driver, cookies):
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_to_cdp_cookie(c) for c in cookies]})
+        except Exception:
+            # CDP yoksa cookie domain'ine gidip tek tek ekle
+            origin = urlsplit(self.base_url)
+            driver.get(f"{origin.scheme}://{origin.netloc}/")
+            for cookie in cookies:
+                driver.add_cookie({k: cookie[k] for k in ("name", "value", "path", "domain", "secure") if k in cookie})
+
+
+def _to_cdp_cookie(cookie):
+    """get_cookies / getAllCookies çıktısını Network.setCookies formatına çevir"""
+    allowed = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+    result = {k: cookie[k] for k in allowed if k in cookie}
+    if "expiry" in cookie:
+        result["expires"] = cookie["expiry"]
+    if result.get("expires", 0) < 0:
+        # Session cookie
+        result.pop("expires")
+    return result
@@ -0,0 +1,253 @@
+"""Sızan test verilerini (app, liste, flow, case) toplu silen sweeper
+
+teardown_method'lardaki cleanup best-effort olduğu için başarısız testlerin
+oluşturduğu kayıtlar ortamda birikiyor. Sweeper suite'in isim formatına
+(unique_name) uyan ve TTL'den eski kayıtları bulup siler: backend API'si
+varsa eşzamanlı DELETE istekleriyle, yoksa liste sayfalarında arama +
+toplu satır silme ile. Suite öncesi ve sonrası conftest'ten çalışır, elle de
+çalıştırılabilir:
+
+    python -m tdm_automation.Utils.sweeper --ttl 7200 [--ui] [--dry-run]
+"""
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+
+from tdm_automation.Pages.application_management_page import AppManagementPage
+from tdm_automation.Pages.data_generation_case_page import DataCasePage
+from tdm_automation.Pages.list_generator_page import ListGeneratorPage
+from tdm_automation.Pages.synthetic_flow_list_page import SyntheticFlowListPage
+from tdm_automation.Pages.tdm_dashboard_page import TDMDashboardPage
+from tdm_automation.Utils.namespace import parse_name
+from tdm_automation.Utils.session_cache import SessionCache
+from tdm_automation.Utils.tdm_api import TdmApiClient, TdmApiError, entity_id
+
+load_dotenv()
+
+
+# Testlerin unique_name'e verdiği önekler (env default'ları + sabit önekler)
+SUITE_PREFIXES = (
+    os.getenv('TEST_APP_NAME', 'TestApp'),
+    os.getenv('TEST_MODULE_NAME', 'TestModule'),
+    os.getenv('TEST_LIST_NAME', 'ListName'),
+    os.getenv('FLOW_NAME', 'FlowName'),
+    os.getenv('CASE_NAME', 'CaseName'),
+    'DuplicateTest',
+    'DuplicateDBTest',
+    'RefreshTest',
+)
+
+# unique_name öncesi format: <prefix>_<epoch>
+LEGACY_PATTERN = re.compile(r"^(?P<prefix>.+)_(?P<epoch>\d{10})$")
+
+# Çocuklar ebeveynlerden önce silinir (case -> module -> application)
+API_RESOURCES = ("case", "synthetic_flow", "list_generator", "version", "module", "application")
+
+
+class SweepReport:
+    """Silinen / silinemeyen kayıtlar (kaynak bazında)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.removed = {}
+        self.failed = {}
+        self.started = time.time()
+        self.duration = 0.0
+
+    def add_removed(self, resource, name):
+        self.removed.setdefault(resource, []).append(name)
+
+    def add_failed(self, resource, name, error):
+        self.failed.setdefault(resource, []).append({"name": name, "error": str(error)})
+
+    @property
+    def total_removed(self):
+        return sum(len(names) for names in self.removed.values())
+
+    def summary(self):
+        parts = [f"{resource}: {len(names)}" for resource, names in self.removed.items()]
+        failed = sum(len(items) for items in self.failed.values())
+        return (f"Sweeper ({self.path}) {self.total_removed} kayıt sildi "
+                f"[{', '.join(parts) or '-'}], {failed} hata, {self.duration:.1f}s")
+
+    def to_dict(self):
+        return {"path": self.path, "removed": self.removed, "failed": self.failed,
+                "started": self.started, "duration": self.duration}
+
+
+class Sweeper:
+    """TTL'den eski suite kayıtlarını bulup silen toplayıcı"""
+
+    def __init__(self, ttl=None, prefixes=None, workers=None, dry_run=False):
+        self.ttl = ttl if ttl is not None else int(os.getenv('SWEEP_TTL', '7200'))
+        extra = [p for p in os.getenv('SWEEP_PREFIXES', '').split(',') if p]
+        self.prefixes = tuple(prefixes or SUITE_PREFIXES) + tuple(extra)
+        self.workers = workers or int(os.getenv('SWEEP_WORKERS', '8'))
+        self.dry_run = dry_run
+
+    def age_of(self, name):
+        """Suite'e ait isimse yaşı (saniye), değilse None"""
+        parsed = parse_name(name)
+        if parsed:
+            return time.time() - parsed[1]
+        legacy = LEGACY_PATTERN.match(name)
+        if legacy and legacy.group("prefix") in self.prefixes:
+            return time.time() - int(legacy.group("epoch"))
+        return None
+
+    def is_stale(self, name):
+        age = self.age_of(name)
+        return age is not None and age > self.ttl
+
+    # =============== API ===============
+    def sweep_api(self, client):
+        """Her kaynak için öneklerle arama yap, eski kayıtları eşzamanlı sil"""
+        report = SweepReport("api")
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for resource in API_RESOURCES:
+                try:
+                    stale = self._stale_entities(client, resource)
+                except TdmApiError as e:
+                    # Bu kaynağın endpoint'i ortamda olmayabilir
+                    report.add_failed(resource, "*", e)
+                    continue
+                if self.dry_run:
+                    for name in stale.values():
+                        report.add_removed(resource, name)
+                    continue
+
+                futures = {executor.submit(client.delete, resource, entity): name
+                           for entity, name in stale.items()}
+                for future, name in futures.items():
+                    try:
+                        future.result()
+                        report.add_removed(resource, name)
+                    except TdmApiError as e:
+                        report.add_failed(resource, name, e)
+        report.duration = time.time() - report.started
+        return report
+
+    def _stale_entities(self, client, resource):
+        stale = {}
+        for prefix in self.prefixes:
+            for entity in client.list(resource, search=prefix):
+                name = entity.get("name", "")
+                identifier = entity_id(entity)
+                if identifier is not None and self.is_stale(name):
+                    stale[identifier] = name
+        return stale
+
+    # =============== UI ===============
+    def sweep_ui(self, driver):
+        """Liste sayfalarında önekle arayıp görünen eski satırları sırayla sil"""
+        dashboard = TDMDashboardPage(driver)
+        targets = (
+            ("case", dashboard.click_data_generation_case, DataCasePage(driver),
+             "click_deletecase_andconfirm_button"),
+            ("synthetic_flow", dashboard.click_syn_flow, SyntheticFlowListPage(driver),
+             "click_deleteflow_andconfirm_button"),
+            ("list_generator", dashboard.click_list_generator, ListGeneratorPage(driver),
+             "click_deletelist_andconfirm_button"),
+            ("application", dashboard.click_application_management, AppManagementPage(driver),
+             "click_deleteapp_andconfirm_button"),
+        )
+
+        report = SweepReport("ui")
+        for resource, navigate, page, delete_method in targets:
+            if not navigate():
+                report.add_failed(resource, "*", "sayfaya gidilemedi")
+                continue
+            page.wait_until_idle()
+            for prefix in self.prefixes:
+                self._sweep_table(page, prefix, getattr(page, delete_method), resource, report)
+            page.table.clear_search()
+        report.duration = time.time() - report.started
+        return report
+
+    def _sweep_table(self, page, prefix, delete, resource, report):
+        table = page.table
+        table.show(prefix)
+
+        attempted = set()
+        while True:
+            stale = [name for name in table.names() if name not in attempted and self.is_stale(name)]
+            if not stale:
+                if not table.next_page():
+                    return
+                continue
+
+            for name in stale:
+                attempted.add(name)
+                if self.dry_run:
+                    report.add_removed(resource, name)
+                    continue
+                if delete(name):
+                    report.add_removed(resource, name)
+                    page.wait_until_idle()
+                else:
+                    report.add_failed(resource, name, "UI ile silinemedi")
+
+
+def write_report(report, directory, phase):
+    """reports/sweep_<phase>.json"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"sweep_{phase}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
+    return path
+
+
+def run_sweep(phase, report_dir="reports", driver=None, **options):
+    """API ile (yoksa verilen driver üzerinden UI ile) sweep çalıştır ve raporla"""
+    sweeper = Sweeper(**options)
+    session_cache = SessionCache(os.getenv('VALID_USERNAME'), os.getenv('VALID_PASSWORD'), os.getenv('BASE_URL'))
+    client = TdmApiClient.from_env(session_cache, pool_size=sweeper.workers)
+    report = None
+    if client is not None:
+        try:
+            report = sweeper.sweep_api(client)
+        except TdmApiError as e:
+            print(f"API ile sweep yapılamadı: {e}")
+        finally:
+            client.close()
+
+    if report is None and driver is not None:
+        if session_cache.open_tdm(driver):
+            report = sweeper.sweep_ui(driver)
+
+    if report is None:
+        print(f"Sweep ({phase}) atlandı: API ya da browser yok")
+        return None
+
+    print(report.summary())
+    write_report(report, report_dir, phase)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sızan TDM test verilerini sil")
+    parser.add_argument("--ttl", type=int, default=None, help="Bu yaştan (saniye) eski kayıtlar silinir")
+    parser.add_argument("--ui", action="store_true", help="API yoksa browser ile UI üzerinden sil")
+    parser.add_argument("--dry-run", action="store_true", help="Silmeden sadece raporla")
+    parser.add_argument("--report-dir", default="reports")
+    args = parser.parse_args(argv)
+
+    driver = None
+    if args.ui:
+        from tdm_automation.Utils.driver_factory import create_driver
+        driver = create_driver()
+    try:
+        report = run_sweep("manual", args.report_dir, driver=driver, ttl=args.ttl, dry_run=args.dry_run)
+    finally:
+        if driver is not None:
+            driver.quit()
+    return 0 if report is None or not report.failed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
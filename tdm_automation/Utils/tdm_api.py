@@ -0,0 +1,290 @@
+import json
+import os
+from urllib.parse import urlsplit
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+load_dotenv()
+
+
+# Kaynak adı -> REST path'i (BASE'e göre). Ortama göre TDM_API_PATHS ile
+# JSON olarak ezilebilir: {"case": "cases"}
+DEFAULT_PATHS = {
+    "application": "applications",
+    "module": "modules",
+    "version": "versions",
+    "list_generator": "list-generators",
+    "synthetic_flow": "synthetic-flows",
+    "case": "data-generation-cases",
+}
+
+# localStorage'da token taşıyabilecek anahtarlar (session snapshot'ından okunur)
+TOKEN_KEYS = ("access_token", "accessToken", "token", "jwt", "id_token")
+
+
+class TdmApiError(Exception):
+    """Backend isteği başarısız (status >= 400 ya da bağlantı hatası)"""
+
+    def __init__(self, message, status=None, body=None):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+class TdmApiClient:
+    """TDM backend'ine doğrudan giden REST client
+
+    Test ön koşulları (app, module, version, liste, flow, case) UI yerine bu
+    client ile oluşturulup silinir. Tek requests.Session kullanılır; bağlantılar
+    keep-alive ile havuzda tutulur, idempotent istekler bağlantı hatalarında
+    tekrar denenir. Auth: TDM_API_TOKEN ya da SessionCache snapshot'ındaki
+    cookie/localStorage token'ı.
+    """
+
+    def __init__(self, base_url, token=None, cookies=None, timeout=None, pool_size=None, paths=None,
+                 session_cache=None):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.timeout = timeout or float(os.getenv('TDM_API_TIMEOUT', '10'))
+        self.paths = dict(DEFAULT_PATHS, **(paths or {}))
+        # Bağlantı/auth sorunu görülünce False olur; seeder'lar UI'a düşer
+        self.available = True
+
+        pool_size = pool_size or int(os.getenv('TDM_API_POOL_SIZE', '4'))
+        retry = Retry(total=2, connect=2, read=0, backoff_factor=0.2,
+                      allowed_methods=frozenset({"GET", "DELETE"}))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+        self._session_cache = session_cache
+        self._snapshot_loaded = False
+        self._fixed_token = bool(token)
+        self._set_auth(token, cookies)
+
+    def _set_auth(self, token=None, cookies=None):
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        for cookie in cookies or []:
+            self.session.cookies.set(cookie["name"], cookie["value"],
+                                     domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+    def _load_snapshot(self):
+        """SessionCache snapshot'ındaki cookie ve token'ı session'a al
+
+        Snapshot ilk test sınıfı login olunca yazıldığı için client oluşturulurken
+        değil, ilk istekte (ve 401 sonrası bir kez daha) okunur.
+        """
+        self._snapshot_loaded = True
+        snapshot = self._session_cache.load() if self._session_cache is not None else None
+        if not snapshot:
+            return False
+        storage = snapshot.get("local_storage") or {}
+        token = None
+        if not self._fixed_token:
+            token = next((storage[key] for key in TOKEN_KEYS if storage.get(key)), None)
+        self._set_auth(token, snapshot.get("cookies"))
+        return True
+
+    @classmethod
+    def from_env(cls, session_cache=None, **options):
+        """TDM_API_URL ve auth bilgisinden client oluştur (TDM_API=false ise None)"""
+        if os.getenv('TDM_API', 'true').lower() != 'true':
+            return None
+
+        base_url = os.getenv('TDM_API_URL')
+        if not base_url:
+            origin = urlsplit(os.getenv('BASE_URL') or "")
+            if not origin.netloc:
+                return None
+            base_url = f"{origin.scheme}://{origin.netloc}/api"
+
+        paths = json.loads(os.getenv('TDM_API_PATHS', '{}'))
+        return cls(base_url, token=os.getenv('TDM_API_TOKEN'), paths=paths, session_cache=session_cache, **options)
+
+    def close(self):
+        self.session.close()
+
+    # =============== HTTP ===============
+    def request(self, method, path, **kwargs):
+        """İstek at, JSON gövdeyi döndür (boş yanıtta None)"""
+        url = self.base_url + path.lstrip("/")
+        kwargs.setdefault("timeout", self.timeout)
+        if not self._snapshot_loaded:
+            self._load_snapshot()
+        try:
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code == 401 and self._load_snapshot():
+                # Oturum yenilenmiş olabilir
+                response = self.session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            raise TdmApiError(f"{method} {url} başarısız: {e}") from e
+
+        if response.status_code >= 400:
+            raise TdmApiError(f"{method} {url} -> {response.status_code}",
+                              status=response.status_code, body=response.text)
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+
+    def path(self, resource, *parts):
+        return "/".join([self.paths[resource]] + [str(part) for part in parts])
+
+    # =============== GENERIC CRUD ===============
+    def create(self, resource, payload):
+        """Kaynağı oluştur, oluşan kaydı döndür"""
+        return self.request("POST", self.path(resource), json=payload)
+
+    def delete(self, resource, entity_id, missing_ok=True):
+        """Kaydı sil; missing_ok ise 404 hata sayılmaz"""
+        try:
+            self.request("DELETE", self.path(resource, entity_id))
+            return True
+        except TdmApiError as e:
+            if missing_ok and e.status == 404:
+                return False
+            raise
+
+    def get(self, resource, entity_id):
+        """Tek kayıt"""
+        return self.request("GET", self.path(resource, entity_id))
+
+    def list(self, resource, **params):
+        """Kayıtları listele (sayfalı yanıtta content/items/data alanı açılır)"""
+        body = self.request("GET", self.path(resource), params=params)
+        if isinstance(body, dict):
+            for key in ("content", "items", "data", "results"):
+                if isinstance(body.get(key), list):
+                    return body[key]
+        return body or []
+
+    def find(self, resource, name):
+        """İsimle tek kayıt (search parametresi ile tek sorgu)"""
+        for entity in self.list(resource, search=name):
+            if entity.get("name") == name:
+                return entity
+        return None
+
+    # =============== TDM KAYNAKLARI ===============
+    def create_application(self, name, versions=("V1",)):
+        return self.create("application", {"name": name, "versions": list(versions)})
+
+    def create_module(self, application_id, name, versions=("V1",)):
+        return self.create("module", {"applicationId": application_id, "name": name, "versions": list(versions)})
+
+    def create_version(self, application_id, name, module_id=None):
+        return self.create("version", {"applicationId": application_id, "moduleId": module_id, "name": name})
+
+    def create_list_generator(self, name, values, value_type="String"):
+        return self.create("list_generator", {"name": name, "type": value_type, "values": list(values)})
+
+    def create_synthetic_flow(self, name, description=""):
+        return self.create("synthetic_flow", {"name": name, "description": description})
+
+    def create_case(self, name, application_id, module_id, description=""):
+        return self.create("case", {"name": name, "applicationId": application_id,
+                                    "moduleId": module_id, "description": description})
+
+
+def entity_id(entity):
+    """Oluşturma yanıtındaki kayıt id'si"""
+    if isinstance(entity, dict):
+        for key in ("id", "uuid", "_id"):
+            if entity.get(key) is not None:
+                return entity[key]
+    return None
+
+
+class ApiSeeder:
+    """Bir testin API ile oluşturduğu kayıtlar - test sonunda ters sırada silinir
+
+    Client yoksa ya da backend erişilemiyorsa metodlar None döner; test bu
+    durumda ön koşulu UI üzerinden oluşturur.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.created = []
+        self._ids = {}
+
+    @property
+    def available(self):
+        return self.client is not None and self.client.available
+
+    def seeded(self, name):
+        """Kayıt bu seeder ile mi oluşturuldu"""
+        return name in self._ids
+
+    def id_of(self, name):
+        return self._ids.get(name)
+
+    def _seed(self, resource, name, *args):
+        if not self.available:
+            return None
+        try:
+            entity = getattr(self.client, f"create_{resource}")(*args)
+        except TdmApiError as e:
+            print(f"API ile {resource} oluşturulamadı, UI kullanılacak: {e}")
+            if e.status is None or e.status in (401, 403, 404):
+                # Bağlantı/auth/endpoint sorunu - session boyunca UI'a düş
+                self.client.available = False
+            return None
+
+        created_id = entity_id(entity)
+        if created_id is None:
+            # Yanıt id döndürmüyorsa isimle bul
+            try:
+                created_id = entity_id(self.client.find(resource, name))
+            except TdmApiError:
+                pass
+        self.created.append((resource, created_id, name))
+        self._ids[name] = created_id
+        print(f"API ile {resource} oluşturuldu: {name}")
+        return entity or {"id": created_id, "name": name}
+
+    def application(self, name, versions=("V1",)):
+        return self._seed("application", name, name, versions)
+
+    def module(self, application_name, name, versions=("V1",)):
+        application_id = self._ids.get(application_name)
+        if application_id is None:
+            return None
+        return self._seed("module", name, application_id, name, versions)
+
+    def version(self, application_name, name, module_name=None):
+        application_id = self._ids.get(application_name)
+        if application_id is None:
+            return None
+        return self._seed("version", name, application_id, name, self._ids.get(module_name))
+
+    def list_generator(self, name, values, value_type="String"):
+        return self._seed("list_generator", name, name, values, value_type)
+
+    def synthetic_flow(self, name, description=""):
+        return self._seed("synthetic_flow", name, name, description)
+
+    def case(self, name, application_name, module_name, description=""):
+        application_id = self._ids.get(application_name)
+        module_id = self._ids.get(module_name)
+        if application_id is None or module_id is None:
+            return None
+        return self._seed("case", name, name, application_id, module_id, description)
+
+    def cleanup(self):
+        """Oluşturulan kayıtları ters sırada sil (best effort)"""
+        while self.created:
+            resource, created_id, name = self.created.pop()
+            self._ids.pop(name, None)
+            if created_id is None:
+                continue
+            try:
+                self.client.delete(resource, created_id)
+            except TdmApiError as e:
+                print(f"API ile {resource} silinemedi ({name}): {e}")
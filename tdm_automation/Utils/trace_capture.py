@@ -0,0 +1,210 @@
+"""Test başına network (HAR) ve Chrome performance trace yakalama
+
+NetworkTracker'ın okuduğu CDP event'leri bir listener ile sabit boyutlu ring
+buffer'a (deque) eklenir; geçen testler için maliyet sadece bu append'tir.
+Dosyalar (gzip'li HAR / trace) yalnızca başarısız ya da yavaş testler için
+yazılır ve pytest-html raporuna eklenir.
+
+TRACE_CAPTURE: off | network (varsayılan) | trace (Chrome timeline trace dahil,
+driver_factory perfLoggingPrefs'e traceCategories ekler)
+"""
+import gzip
+import itertools
+import json
+import os
+import re
+import threading
+import weakref
+from collections import deque
+from datetime import datetime, timezone
+
+from .network_tracker import tracker_for
+
+
+MODE = os.getenv('TRACE_CAPTURE', 'network').lower()
+BUFFER_SIZE = int(os.getenv('TRACE_CAPTURE_BUFFER', '5000'))
+SLOW_SECONDS = float(os.getenv('TRACE_CAPTURE_SLOW_SECONDS', '60'))
+TRACE_CATEGORIES = os.getenv('TRACE_CAPTURE_CATEGORIES', 'devtools.timeline,v8.execute,blink.user_timing')
+
+_sequence = itertools.count(1)
+_recorders = weakref.WeakSet()
+_recorders_lock = threading.Lock()
+
+
+class TraceRecorder:
+    """Bir driver'ın son N network / trace event'i"""
+
+    def __init__(self, driver, size=BUFFER_SIZE, trace=(MODE == "trace")):
+        self._driver = weakref.ref(driver)
+        self.network = deque(maxlen=size)
+        self.trace = deque(maxlen=size * 4) if trace else None
+        tracker_for(driver).add_listener(self._on_event)
+
+    def _on_event(self, method, params, timestamp):
+        if method.startswith("Network."):
+            self.network.append((next(_sequence), method, params))
+        elif method == "Tracing.dataCollected" and self.trace is not None:
+            self.trace.append((next(_sequence), params))
+
+    def flush(self):
+        """Performance log'da bekleyen event'leri buffer'a al"""
+        driver = self._driver()
+        if driver is not None:
+            tracker_for(driver).poll()
+
+    def network_since(self, mark):
+        return [(method, params) for seq, method, params in self.network if seq > mark]
+
+    def trace_since(self, mark):
+        if self.trace is None:
+            return []
+        return [params for seq, params in self.trace if seq > mark]
+
+
+def capture_for(driver):
+    """Driver'a recorder bağla (TRACE_CAPTURE=off ise None)"""
+    if MODE == "off":
+        return None
+    recorder = TraceRecorder(driver)
+    with _recorders_lock:
+        _recorders.add(recorder)
+    return recorder
+
+
+def mark():
+    """Şu ana kadarki son event sırası - testin başında alınır"""
+    return next(_sequence)
+
+
+def should_capture(failed, duration):
+    return MODE != "off" and (failed or duration >= SLOW_SECONDS)
+
+
+def dump(nodeid, since, directory):
+    """since'ten sonraki event'leri HAR (ve trace) olarak yaz; yazılan dosya yolları"""
+    with _recorders_lock:
+        recorders = list(_recorders)
+
+    network, trace = [], []
+    for recorder in recorders:
+        recorder.flush()
+        network.extend(recorder.network_since(since))
+        trace.extend(recorder.trace_since(since))
+
+    paths = []
+    if not network and not trace:
+        return paths
+
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, _safe_name(nodeid))
+    if network:
+        paths.append(_write_gzip(f"{base}.har.gz", build_har(network)))
+    if trace:
+        paths.append(_write_gzip(f"{base}.trace.json.gz", {"traceEvents": trace}))
+    return paths
+
+
+def _safe_name(nodeid):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid)[-150:]
+
+
+def _write_gzip(path, data):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(data, f)
+    return path
+
+
+def build_har(events):
+    """CDP Network event'lerinden HAR 1.2 log'u"""
+    entries = {}
+    current = {}
+    for method, params in events:
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            # Redirect'te aynı requestId ile yeni istek gelir - ayrı entry olur
+            key = current[request_id] = (request_id, len(entries))
+            entries[key] = {"request": params, "response": None, "end": None, "failed": None}
+        elif request_id in current:
+            entry = entries[current[request_id]]
+            if method == "Network.responseReceived":
+                entry["response"] = params.get("response")
+            elif method == "Network.loadingFinished":
+                entry["end"] = params
+            elif method == "Network.loadingFailed":
+                entry["end"] = params
+                entry["failed"] = params.get("errorText")
+
+    return {"log": {
+        "version": "1.2",
+        "creator": {"name": "tdm_automation", "version": "1.0"},
+        "pages": [],
+        "entries": [_har_entry(entry) for entry in entries.values()],
+    }}
+
+
+def _headers(headers):
+    return [{"name": name, "value": str(value)} for name, value in (headers or {}).items()]
+
+
+def _har_entry(entry):
+    sent = entry["request"]
+    request = sent.get("request", {})
+    response = entry["response"] or {}
+    end = entry["end"] or {}
+
+    start = sent.get("timestamp", 0.0)
+    total = max((end.get("timestamp", start) - start) * 1000, 0.0) if end else -1
+    timings = _timings(response.get("timing"), total)
+
+    started = datetime.fromtimestamp(sent.get("wallTime", 0), tz=timezone.utc)
+    return {
+        "startedDateTime": started.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+        "time": total,
+        "request": {
+            "method": request.get("method", "GET"),
+            "url": request.get("url", ""),
+            "httpVersion": response.get("protocol", ""),
+            "headers": _headers(request.get("headers")),
+            "queryString": [],
+            "cookies": [],
+            "headersSize": -1,
+            "bodySize": len(request.get("postData", "") or ""),
+        },
+        "response": {
+            "status": response.get("status", 0),
+            "statusText": entry["failed"] or response.get("statusText", ""),
+            "httpVersion": response.get("protocol", ""),
+            "headers": _headers(response.get("headers")),
+            "cookies": [],
+            "content": {"size": int(end.get("encodedDataLength", 0) or 0),
+                        "mimeType": response.get("mimeType", "")},
+            "redirectURL": "",
+            "headersSize": -1,
+            "bodySize": int(end.get("encodedDataLength", -1) or -1),
+        },
+        "cache": {},
+        "timings": timings,
+        "_resourceType": sent.get("type", ""),
+    }
+
+
+def _timings(timing, total):
+    """CDP ResourceTiming (ms, requestTime'a göre) -> HAR timings"""
+    if not timing:
+        return {"send": 0, "wait": total, "receive": 0}
+
+    def span(start, end):
+        a, b = timing.get(start, -1), timing.get(end, -1)
+        return b - a if a >= 0 and b >= 0 else -1
+
+    wait = span("sendEnd", "receiveHeadersEnd")
+    headers_end = timing.get("receiveHeadersEnd", 0)
+    return {
+        "blocked": timing.get("dnsStart", -1) if timing.get("dnsStart", -1) >= 0 else -1,
+        "dns": span("dnsStart", "dnsEnd"),
+        "connect": span("connectStart", "connectEnd"),
+        "ssl": span("sslStart", "sslEnd"),
+        "send": max(span("sendStart", "sendEnd"), 0),
+        "wait": max(wait, 0),
+        "receive": max(total - headers_end, 0) if total >= 0 else -1,
+    }